@@ -0,0 +1,60 @@
+"""
+Compare two benchmark suite results, exiting with an error status when a
+metric regressed by more than the threshold
+
+    python -m benchmarks.compare before.json after.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+
+# metrics where a higher value is better, all others being durations or sizes
+HIGHER_IS_BETTER = ('throughput',)
+
+
+def flatten(results, prefix=''):
+    for key, value in results.items():
+        if key == 'environment':
+            continue
+        name = prefix + key
+        if isinstance(value, dict):
+            yield from flatten(value, name + '.')
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
+
+
+def compare(before, after, threshold):
+    """(metric, before, after, relative change, regressed) for common metrics"""
+    before, after = dict(flatten(before)), dict(flatten(after))
+    for name in sorted(before.keys() & after.keys()):
+        old, new = before[name], after[name]
+        change = (new - old) / old if old else 0.0
+        if name.startswith(HIGHER_IS_BETTER):
+            regressed = change < -threshold
+        else:
+            regressed = change > threshold
+        yield name, old, new, change, regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('before')
+    parser.add_argument('after')
+    parser.add_argument('--threshold', type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+
+    regressions = 0
+    for name, old, new, change, regressed in compare(before, after, args.threshold):
+        regressions += regressed
+        print('{} {:<50} {:>14.6g} {:>14.6g} {:>+8.1%}'.format('!' if regressed else ' ', name, old, new, change))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+Compare JSON decoding backends on coinlist and histominute bodies
+
+    python -m benchmarks.decoding
+"""
+
+import timeit
+
+from cryptocompare import decoder
+from cryptocompare.columnar import Candles
+from cryptocompare.lazy import LazyMapping
+
+from . import fixtures
+
+BACKENDS = ('json', 'orjson', 'simdjson', 'ujson')
+
+
+def available_backends():
+    for name in BACKENDS:
+        try:
+            yield name, decoder.get_loads(name)
+        except ImportError:
+            pass
+
+
+def best(function, number=5, repeat=5):
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def main():
+    bodies = {
+        'coinlist': fixtures.coinlist(),
+        'histominute': fixtures.histo(count=2001),
+        'histominute x100': fixtures.histo(count=200001),
+    }
+    backends = list(available_backends())
+    print('default backend: {}'.format(decoder.backend))
+
+    for name, body in bodies.items():
+        print('\n{} ({:.1f} MB)'.format(name, len(body) / 1e6))
+        reference = None
+        for backend, loads in backends:
+            seconds = best(lambda: loads(body), number=1 if 'x100' in name else 5)
+            reference = reference or seconds
+            print('  {:<10} {:9.2f} ms  x{:.2f}'.format(backend, seconds * 1000, reference / seconds))
+            if name.startswith('histo'):
+                seconds = best(lambda: Candles.parse(body, loads), number=1 if 'x100' in name else 5)
+                print('  {:<10} {:9.2f} ms  x{:.2f}'.format('+columnar', seconds * 1000, reference / seconds))
+            else:
+                seconds = best(lambda: LazyMapping.parse(body, loads)['Data'])
+                print('  {:<10} {:9.2f} ms  x{:.2f}'.format('+lazy', seconds * 1000, reference / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+"""
+Response bodies shaped like the ones of CryptoCompare endpoints, generated
+deterministically so that benchmarks do not depend on the network
+"""
+
+import json
+import random
+
+HISTO_FIELDS = ('time', 'high', 'low', 'open', 'volumefrom', 'volumeto', 'close')
+
+
+def _dumps(payload):
+    return json.dumps(payload, separators=(',', ':')).encode()
+
+
+def symbols(count):
+    return ['C{:04d}'.format(i) for i in range(count)]
+
+
+def coinlist(count=5000):
+    data = {}
+    for i, symbol in enumerate(symbols(count)):
+        data[symbol] = {
+            'Id': str(1000 + i),
+            'Url': '/coins/{}/overview'.format(symbol.lower()),
+            'ImageUrl': '/media/{}/{}.png'.format(19000 + i, symbol.lower()),
+            'Name': symbol,
+            'Symbol': symbol,
+            'CoinName': 'Coin {}'.format(i),
+            'FullName': 'Coin {} ({})'.format(i, symbol),
+            'Algorithm': 'SHA256',
+            'ProofType': 'PoW',
+            'FullyPremined': '0',
+            'TotalCoinSupply': '21000000',
+            'PreMinedValue': 'N/A',
+            'TotalCoinsFreeFloat': 'N/A',
+            'SortOrder': str(i + 1),
+            'Sponsored': False,
+        }
+    return _dumps({
+        'Response': 'Success', 'Message': 'Coin list succesfully returned!',
+        'BaseImageUrl': 'https://www.cryptocompare.com', 'BaseLinkUrl': 'https://www.cryptocompare.com',
+        'Data': data, 'Type': 100,
+    })
+
+
+def candles(count, step=60, to_ts=1500000000, seed=0):
+    rng = random.Random(seed)
+    price = 100.0
+    data = []
+    for t in range(to_ts - (count - 1) * step, to_ts + 1, step):
+        open_ = price
+        price *= 1 + rng.gauss(0, 0.001)
+        data.append(dict(zip(HISTO_FIELDS, (
+            t, round(max(open_, price) * 1.001, 2), round(min(open_, price) * 0.999, 2), round(open_, 2),
+            round(rng.uniform(0, 100), 2), round(rng.uniform(0, 10000), 2), round(price, 2)
+        ))))
+    return data
+
+
+def histo(count=2001, step=60, to_ts=1500000000):
+    data = candles(count, step, to_ts)
+    return _dumps({
+        'Response': 'Success', 'Type': 100, 'Aggregated': False, 'Data': data,
+        'TimeTo': data[-1]['time'], 'TimeFrom': data[0]['time'], 'FirstValueInArray': True,
+        'ConversionType': {'type': 'direct', 'conversionSymbol': ''},
+    })
+
+
+def exchanges(count=100, pairs=50):
+    names = symbols(pairs)
+    return _dumps({
+        'Exchange{}'.format(i): {fsym: ['USD', 'EUR', 'BTC'] for fsym in names[i % 7:]}
+        for i in range(count)
+    })
+
+
+def pricemulti(fsyms, tsyms):
+    return _dumps({fsym: {tsym: 1.5 for tsym in tsyms} for fsym in fsyms})
+
+
+def _raw(fsym, tsym):
+    return {
+        'TYPE': '5', 'MARKET': 'CCCAGG', 'FROMSYMBOL': fsym, 'TOSYMBOL': tsym, 'FLAGS': '4',
+        'PRICE': 1.5, 'LASTUPDATE': 1500000000, 'LASTVOLUME': 0.1, 'LASTVOLUMETO': 0.15,
+        'LASTTRADEID': '123456', 'VOLUMEDAY': 1000.0, 'VOLUMEDAYTO': 1500.0,
+        'VOLUME24HOUR': 2000.0, 'VOLUME24HOURTO': 3000.0, 'OPENDAY': 1.4, 'HIGHDAY': 1.6,
+        'LOWDAY': 1.3, 'OPEN24HOUR': 1.4, 'HIGH24HOUR': 1.6, 'LOW24HOUR': 1.3,
+        'LASTMARKET': 'Bitstamp', 'CHANGE24HOUR': 0.1, 'CHANGEPCT24HOUR': 7.1,
+        'CHANGEDAY': 0.1, 'CHANGEPCTDAY': 7.1, 'SUPPLY': 21000000, 'MKTCAP': 31500000.0,
+        'TOTALVOLUME24H': 5000.0, 'TOTALVOLUME24HTO': 7500.0,
+    }
+
+
+def _display(fsym, tsym):
+    return {
+        name: '{} {}'.format(tsym, value) if isinstance(value, float) else str(value)
+        for name, value in _raw(fsym, tsym).items()
+    }
+
+
+def pricemultifull(fsyms, tsyms):
+    return _dumps({
+        'RAW': {fsym: {tsym: _raw(fsym, tsym) for tsym in tsyms} for fsym in fsyms},
+        'DISPLAY': {fsym: {tsym: _display(fsym, tsym) for tsym in tsyms} for fsym in fsyms},
+    })
+
+
+def generate_avg(fsym, tsym):
+    return _dumps({'RAW': _raw(fsym, tsym), 'DISPLAY': _display(fsym, tsym)})
+
+
+def pricehistorical(fsym, tsyms):
+    return _dumps({fsym: {tsym: 1.5 for tsym in tsyms}})
+
+
+def coinsnapshot():
+    return _dumps({
+        'Response': 'Success', 'Type': 100,
+        'Data': {
+            'Algorithm': 'SHA256', 'ProofType': 'PoW', 'BlockNumber': 500000, 'BlockReward': 12.5,
+            'AggregatedData': _raw('BTC', 'USD'),
+            'Exchanges': [dict(_raw('BTC', 'USD'), MARKET='Exchange{}'.format(i)) for i in range(50)],
+        },
+    })
+
+
+def coinsnapshotfullbyid():
+    return _dumps({
+        'Response': 'Success', 'Type': 100,
+        'Data': {
+            'General': {'Id': '1182', 'Name': 'Bitcoin', 'Symbol': 'BTC', 'Description': 'lorem ipsum ' * 500},
+            'ICO': {'Status': 'N/A'},
+            'SEO': {'PageTitle': 'Bitcoin (BTC)'},
+            'StreamerDataRaw': ['5~CCCAGG~BTC~USD~{}'.format(i) for i in range(200)],
+            'Subs': ['2~Exchange{}~BTC~USD'.format(i) for i in range(200)],
+        },
+    })
+
+
+def socialstats():
+    return _dumps({
+        'Response': 'Success', 'Type': 100,
+        'Data': {
+            'General': {'Name': 'BTC', 'CoinName': 'Bitcoin', 'Type': 'Webpagecoinp', 'Points': 100000},
+            'Twitter': {'followers': 100000, 'statuses': 10000, 'Points': 1000},
+            'Reddit': {'subscribers': 100000, 'comments_per_day': 100.0, 'Points': 1000},
+            'CodeRepository': {'List': [{'stars': i, 'forks': i, 'url': 'https://github.com/{}'.format(i)} for i in range(50)]},
+        },
+    })
+
+
+def mining(key, count=1000):
+    return _dumps({
+        'Response': 'Success', 'Type': 100,
+        'MiningData': {
+            str(i): {
+                'Id': str(i), 'Company': 'Company {}'.format(i), 'Name': '{} {}'.format(key, i),
+                'Url': '/mining/{}'.format(i), 'Cost': '1000', 'Currency': 'USD', 'HashesPerSecond': '1000000',
+                'Algorithm': 'SHA256', 'CurrenciesAvailable': 'BTC', 'Recommended': False, 'Sponsored': False,
+            }
+            for i in range(count)
+        },
+    })
+
+
+def top_exchanges(fsym, tsym, count=50):
+    return _dumps({
+        'Response': 'Success', 'Type': 100,
+        'Data': [
+            {'exchange': 'Exchange{}'.format(i), 'fromSymbol': fsym, 'toSymbol': tsym,
+             'volume24h': 1000.0 - i, 'volume24hTo': 1500.0 - i}
+            for i in range(count)
+        ],
+    })
+
+
+def top_pairs(fsym, count=50):
+    return _dumps({
+        'Response': 'Success', 'Type': 100,
+        'Data': [
+            {'exchange': 'CCCAGG', 'fromSymbol': fsym, 'toSymbol': 'C{:04d}'.format(i),
+             'volume24h': 1000.0 - i, 'volume24hTo': 1500.0 - i}
+            for i in range(count)
+        ],
+    })
+
+
+def news_providers(count=50):
+    return _dumps([
+        {'key': 'provider{}'.format(i), 'name': 'Provider {}'.format(i), 'lang': 'EN',
+         'img': 'https://images.cryptocompare.com/news/default/provider{}.png'.format(i)}
+        for i in range(count)
+    ])
+
+
+def news(before=1500000000, count=50):
+    return _dumps([
+        {'id': str(before - i), 'guid': 'https://example.com/{}'.format(before - i),
+         'published_on': before - i * 60, 'imageurl': 'https://example.com/{}.png'.format(i),
+         'title': 'Title {}'.format(i), 'url': 'https://example.com/{}'.format(before - i),
+         'source': 'provider{}'.format(i % 10), 'body': 'lorem ipsum ' * 50, 'tags': 'BTC|ETH',
+         'lang': 'EN', 'source_info': {'name': 'Provider {}'.format(i % 10), 'lang': 'EN'}}
+        for i in range(count)
+    ])
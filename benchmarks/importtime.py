@@ -0,0 +1,86 @@
+"""
+Measure the time taken to import the package, from `python -X importtime`
+reports of fresh interpreters
+
+    python -m benchmarks.importtime --repeat 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+MARKER = '-- importtime marker --'
+
+STATEMENTS = {
+    'import': 'import cryptocompare',
+    'client': 'import cryptocompare; cryptocompare.CryptoCompare()',
+    'async_client': 'import cryptocompare; cryptocompare.AsyncCryptoCompare',
+}
+
+
+def parse(report):
+    """
+    (module, self, cumulative, depth) tuples, in microseconds, of the imports
+    reported after the marker
+    """
+    lines = report.split(MARKER, 1)[-1].splitlines()
+    for line in lines:
+        if not line.startswith('import time:') or line.rstrip().endswith('imported package'):
+            continue
+        self_us, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        yield name.strip(), int(self_us), int(cumulative), depth
+
+
+def measure(statement):
+    """Imports made by running statement in a fresh interpreter"""
+    code = 'import sys; sys.stderr.write({!r}); {}'.format(MARKER + '\n', statement)
+    report = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        stderr=subprocess.PIPE, stdout=subprocess.DEVNULL, universal_newlines=True, check=True
+    ).stderr
+    return list(parse(report))
+
+
+def total(imports):
+    """Seconds spent importing, i.e. the cumulative times of top level imports"""
+    return sum(cumulative for _, _, cumulative, depth in imports if depth == 0) / 1e6
+
+
+def bench_import(repeat=10):
+    """Median and best import times of every statement, in seconds"""
+    results = {}
+    for name, statement in STATEMENTS.items():
+        times = [total(measure(statement)) for _ in range(repeat)]
+        results[name] = {'median': statistics.median(times), 'min': min(times)}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--top', type=int, default=10, help="number of slowest modules to list")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = bench_import(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return results
+
+    for name, statement in STATEMENTS.items():
+        print('{:<14} {:8.1f} ms  (best {:.1f} ms)  {}'.format(
+            name, results[name]['median'] * 1000, results[name]['min'] * 1000, statement
+        ))
+
+    imports = measure(STATEMENTS['client'])
+    print('\nslowest modules imported by the client (cumulative):')
+    for module, _, cumulative, _ in sorted(imports, key=lambda i: -i[2])[:args.top]:
+        print('  {:<40} {:8.1f} ms'.format(module, cumulative / 1000))
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""Local HTTP server replaying fixtures for every CryptoCompare endpoint"""
+
+import http.server
+import socketserver
+import threading
+import urllib.parse
+
+from cryptocompare import RequestsTransport
+
+from . import fixtures
+
+
+def _symbols(params, name):
+    return params.get(name, 'BTC').split(',')
+
+
+class Routes:
+    """Response bodies of every endpoint path, built lazily and memoized"""
+
+    def __init__(self):
+        self._static = {}
+
+    def _memoize(self, key, build):
+        if key not in self._static:
+            self._static[key] = build()
+        return self._static[key]
+
+    def __call__(self, path, params):
+        path = path.rstrip('/')
+        if path == '/data/all/coinlist':
+            return self._memoize(path, fixtures.coinlist)
+        if path == '/data/all/exchanges':
+            return self._memoize(path, fixtures.exchanges)
+        if path == '/data/pricemulti':
+            return fixtures.pricemulti(_symbols(params, 'fsyms'), _symbols(params, 'tsyms'))
+        if path == '/data/pricemultifull':
+            return fixtures.pricemultifull(_symbols(params, 'fsyms'), _symbols(params, 'tsyms'))
+        if path == '/data/generateAvg':
+            return fixtures.generate_avg(params.get('fsym', 'BTC'), params.get('tsym', 'USD'))
+        if path.startswith('/data/histo'):
+            step = {'day': 86400, 'hour': 3600, 'minute': 60}[path[len('/data/histo'):]]
+            count = int(params.get('limit', 30)) + 1
+            to_ts = int(params.get('toTs', 1500000000))
+            return self._memoize((step, count, to_ts), lambda: fixtures.histo(count, step, to_ts - to_ts % step))
+        if path == '/data/pricehistorical':
+            return fixtures.pricehistorical(params.get('fsym', 'BTC'), _symbols(params, 'tsyms'))
+        if path == '/api/data/coinsnapshot':
+            return self._memoize(path, fixtures.coinsnapshot)
+        if path == '/api/data/coinsnapshotfullbyid':
+            return self._memoize(path, fixtures.coinsnapshotfullbyid)
+        if path == '/api/data/socialstats':
+            return self._memoize(path, fixtures.socialstats)
+        if path == '/api/data/miningcontracts':
+            return self._memoize(path, lambda: fixtures.mining('Contract'))
+        if path == '/api/data/miningequipment':
+            return self._memoize(path, lambda: fixtures.mining('Equipment'))
+        if path == '/data/top/exchanges':
+            return fixtures.top_exchanges(params.get('fsym', 'BTC'), params.get('tsym', 'USD'))
+        if path == '/data/top/pairs':
+            return fixtures.top_pairs(params.get('fsym', 'BTC'))
+        if path == '/data/news/providers':
+            return self._memoize(path, fixtures.news_providers)
+        if path == '/data/news':
+            return fixtures.news(int(params.get('lTs', 1500000000)))
+        return None
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        parts = urllib.parse.urlsplit(self.path)
+        body = self.server.routes(parts.path, dict(urllib.parse.parse_qsl(parts.query)))
+        if body is None:
+            self.send_response(404)
+            body = b''
+        else:
+            self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    # http.server.ThreadingHTTPServer is only available from Python 3.7
+    daemon_threads = True
+
+
+class StubServer:
+    """Fixtures server running on a background thread, as a context manager"""
+
+    def __init__(self, routes=None):
+        self._server = _ThreadingServer(('127.0.0.1', 0), _Handler)
+        self._server.routes = routes or Routes()
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return 'http://{}:{}'.format(*self._server.server_address)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class LocalTransport(RequestsTransport):
+    """Transport sending every request to `base_url` instead of CryptoCompare hosts"""
+
+    def __init__(self, base_url, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base_url = base_url
+
+    def get(self, url, timeout=None):
+        parts = urllib.parse.urlsplit(url)
+        return super().get(self.base_url + urllib.parse.urlunsplit(('', '', parts.path, parts.query, '')), timeout)
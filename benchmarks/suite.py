@@ -0,0 +1,172 @@
+"""
+Offline benchmark suite, replaying fixtures from a local server for every
+client endpoint. Results are written as JSON to be compared between commits
+with `benchmarks.compare`.
+
+    python -m benchmarks.suite --output results.json
+"""
+
+import argparse
+import concurrent.futures
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+from cryptocompare import Candles, CryptoCompare, CryptoCompareApiError, Period, Response, StubTransport, Transport, decoder
+
+from . import fixtures, importtime
+from .server import LocalTransport, StubServer
+
+ENDPOINTS = {
+    'get_coin_list': lambda cc: cc.get_coin_list(),
+    'get_exchange_list': lambda cc: cc.get_exchange_list(),
+    'get_price': lambda cc: cc.get_price(['BTC', 'ETH'], ['USD', 'EUR']),
+    'get_symbols_full_data': lambda cc: cc.get_symbols_full_data(['BTC', 'ETH'], ['USD', 'EUR']),
+    'get_generate_custom_average': lambda cc: cc.get_generate_custom_average('BTC', 'USD', ['Kraken']),
+    'get_historical': lambda cc: cc.get_historical('BTC', 'USD', Period.MINUTE, limit=2000),
+    'get_historical_columnar': lambda cc: cc.get_historical('BTC', 'USD', Period.MINUTE, limit=2000, columnar=True),
+    'get_historical_for_timestamp': lambda cc: cc.get_historical_for_timestamp('BTC', 'USD', 1500000000),
+    'get_coin_snapshot': lambda cc: cc.get_coin_snapshot('BTC', 'USD'),
+    'get_coin_snapshot_full_by_id': lambda cc: cc.get_coin_snapshot_full_by_id(1182),
+    'get_social_stats': lambda cc: cc.get_social_stats(1182),
+    'get_mining_contracts': lambda cc: cc.get_mining_contracts(),
+    'get_mining_equipement': lambda cc: cc.get_mining_equipement(),
+    'get_top_exchanges': lambda cc: cc.get_top_exchanges('BTC', 'USD'),
+    'get_top_pairs': lambda cc: cc.get_top_pairs('BTC'),
+    'get_news_providers': lambda cc: cc.get_news_providers(),
+    'get_latest_news': lambda cc: cc.get_latest_news(),
+}
+
+
+def timings(function, repeat):
+    results = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        results.append(time.perf_counter() - start)
+    return results
+
+
+def summary(samples):
+    samples = sorted(samples)
+    return {
+        'median': statistics.median(samples),
+        'p95': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        'min': samples[0],
+    }
+
+
+def bench_endpoints(server, repeat):
+    """Latency of every endpoint through HTTP, and part of it spent decoding"""
+    cc = CryptoCompare(transport=LocalTransport(server.url))
+    results = {}
+    for name, call in ENDPOINTS.items():
+        call(cc)  # warm up connection and fixtures
+        latency = summary(timings(lambda: call(cc), repeat))
+
+        # same call answered by an in-memory transport isolates parsing
+        body = cc.transport.get(_last_url(cc, call)).content
+        offline = CryptoCompare(transport=_ConstantTransport(body))
+        parse = summary(timings(lambda: call(offline), repeat))
+
+        results[name] = {
+            'latency': latency,
+            'parse': parse,
+            'overhead': max(0.0, latency['median'] - parse['median']),
+            'bytes': len(body),
+        }
+    return results
+
+
+class _ConstantTransport(Transport):
+    def __init__(self, body):
+        self.body = body
+
+    def get(self, url, timeout=None):
+        return Response(200, self.body, 0.0)
+
+
+def _last_url(cc, call):
+    recorder = StubTransport()
+    try:
+        call(CryptoCompare(transport=recorder))
+    except CryptoCompareApiError:
+        pass
+    return recorder.requests[-1]
+
+
+def bench_memory(count):
+    """Memory held per candle of historical data, as dicts or columns"""
+    body = fixtures.histo(count)
+    results = {}
+    for name, parse in (('dicts', lambda: decoder.loads(body)['Data']), ('columnar', lambda: Candles.parse(body)['Data'])):
+        tracemalloc.start()
+        data = parse()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del data
+        results[name] = {'bytes_per_candle': current / count, 'peak_bytes_per_candle': peak / count}
+    return results
+
+
+def bench_throughput(server, requests, workers):
+    """Requests per second of concurrent calls sharing one client"""
+    cc = CryptoCompare(transport=LocalTransport(server.url, pool_size=max(workers)))
+    call = ENDPOINTS['get_price']
+    call(cc)
+
+    results = {}
+    for count in workers:
+        with concurrent.futures.ThreadPoolExecutor(count) as executor:
+            start = time.perf_counter()
+            list(executor.map(lambda _: call(cc), range(requests)))
+            results[str(count)] = requests / (time.perf_counter() - start)
+    return results
+
+
+def environment():
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'json_backend': decoder.backend,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', help="file to write JSON results to")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--candles', type=int, default=100000)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--import-repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with StubServer() as server:
+        results = {
+            'environment': environment(),
+            'endpoints': bench_endpoints(server, args.repeat),
+            'memory': bench_memory(args.candles),
+            'throughput': bench_throughput(server, args.requests, args.workers),
+            'import': importtime.bench_import(args.import_repeat),
+        }
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+    return results
+
+
+if __name__ == '__main__':
+    main()
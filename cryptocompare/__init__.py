@@ -1 +1,67 @@
-from .api import *
+"""
+CryptoCompare API wrapper. Names are imported from their submodule on first
+access, so that importing the package does not load requests, NumPy or
+asyncio until they are needed.
+"""
+
+import importlib
+import sys
+
+_EXPORTS = {
+    'api': [
+        'CalculationType', 'CryptoCompare', 'CryptoCompareApiError', 'CryptoCompareCircuitOpenError',
+        'CryptoCompareHttpError', 'CryptoCompareRateLimitError', 'Period', 'ERROR_TYPE_THRESHOLD',
+        'HISTORICAL_PAGE_LIMIT', 'MINUTE_HISTORY', 'RATE_LIMIT_RETRIES',
+    ],
+    'transport': [
+        'DEFAULT_POOL_SIZE', 'DEFAULT_TIMEOUT', 'RequestsTransport', 'Response', 'StubTransport', 'Transport',
+    ],
+    'aio': ['AiohttpTransport', 'AsyncCryptoCompare', 'AsyncTransport', 'ExecutorTransport'],
+    'columnar': ['Candles'],
+    'store': ['CandleStore'],
+    'cache': ['DiskCache', 'MemoryCache', 'ResponseCache', 'endpoint_name'],
+    'ratelimit': ['ProcessRateLimiter', 'RateLimiter', 'backoff'],
+    'batch': ['PriceBatcher'],
+    'stream': ['PollingSource', 'PriceSubscription', 'Update'],
+    'metrics': ['MetricsCollector', 'RequestEvent', 'StatsdExporter'],
+    'registry': ['Coin', 'Registry'],
+    'matrix': ['PriceMatrix', 'get_price_matrix'],
+    'resample': ['EMA', 'SMA', 'Resampler', 'RollingStd', 'merge_exchanges', 'resample'],
+    'news': ['NewsCursor'],
+    'lazy': ['LazyMapping'],
+    'singleflight': ['AsyncSingleFlight', 'SingleFlight'],
+    'models': ['PairVolume', 'Price', 'Ticker'],
+    'venues': ['PairVenues', 'Venue', 'VenueBook'],
+    'resilience': ['CircuitBreaker', 'Hedge', 'RetryPolicy'],
+    'panel': ['Panel'],
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name):
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name)) from None
+
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+# bound on import, as loading the resample submodule would shadow the function
+from .resample import resample  # noqa: E402
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# module __getattr__ is only called from Python 3.7 on
+if sys.version_info < (3, 7):
+    for _name in __all__:
+        __getattr__(_name)
+    del _name
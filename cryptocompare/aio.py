@@ -0,0 +1,282 @@
+import asyncio
+import concurrent.futures
+import itertools
+import time
+
+from .api import (
+    RATE_LIMIT_RETRIES, CryptoCompare, CryptoCompareCircuitOpenError, CryptoCompareHttpError,
+    CryptoCompareRateLimitError, Period, _timestamp
+)
+from .panel import Panel
+from .ratelimit import backoff
+from .singleflight import AsyncSingleFlight
+from .transport import DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT, RequestsTransport, Response
+
+_UNLOADED = object()
+# imported on first use, None if not installed
+aiohttp = _UNLOADED
+
+
+def _aiohttp():
+    global aiohttp
+    if aiohttp is _UNLOADED:
+        try:
+            import aiohttp
+        except ImportError:
+            aiohttp = None
+    return aiohttp
+
+
+class AsyncTransport:
+    """Asynchronous counterpart of `Transport`"""
+
+    async def get(self, url, timeout=None):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class AiohttpTransport(AsyncTransport):
+    """Transport backed by a single `aiohttp.ClientSession` connection pool"""
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT):
+        if _aiohttp() is None:
+            raise RuntimeError("aiohttp is required by AiohttpTransport")
+
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._session = None
+
+    def _get_session(self):
+        # the session has to be created from within the running event loop
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                headers={'Accept-Encoding': 'gzip, deflate'}
+            )
+        return self._session
+
+    async def get(self, url, timeout=None):
+        session = self._get_session()
+        start = time.monotonic()
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout or self.timeout)) as response:
+                elapsed = time.monotonic() - start
+                content = await response.read()
+        except asyncio.TimeoutError as e:
+            # distinct from the builtin TimeoutError before Python 3.11
+            raise TimeoutError('Request timed out after {}s'.format(timeout or self.timeout)) from e
+        return Response(response.status, content, elapsed)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class ExecutorTransport(AsyncTransport):
+    """
+    Adapts a blocking `Transport` by running its requests on a bounded thread
+    pool, used when aiohttp is not available
+    """
+
+    def __init__(self, transport, max_workers=DEFAULT_POOL_SIZE):
+        self.transport = transport
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    async def get(self, url, timeout=None):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, self.transport.get, url, timeout)
+
+    async def close(self):
+        self._executor.shutdown(wait=False)
+        self.transport.close()
+
+
+async def gather(*aws, limit=None, return_exceptions=False):
+    """
+    Like `asyncio.gather`, but awaiting at most `limit` of the given
+    awaitables at once
+    """
+    if limit is None:
+        return await asyncio.gather(*aws, return_exceptions=return_exceptions)
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(bounded(aw) for aw in aws), return_exceptions=return_exceptions)
+
+
+class AsyncCryptoCompare(CryptoCompare):
+    """
+    Asynchronous client, every `get_*` method of `CryptoCompare` returns a
+    coroutine. At most `max_concurrency` requests are in flight at once.
+    """
+
+    def __init__(self, app_name=None, transport=None, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT,
+                 cache=None, rate_limiter=None, rate_limit_retries=RATE_LIMIT_RETRIES, json_backend=None,
+                 hooks=None, max_concurrency=None, single_flight=True, retry=None, hedge=None, breaker=None,
+                 timeouts=None):
+        if transport is None:
+            if _aiohttp() is not None:
+                transport = AiohttpTransport(pool_size, timeout)
+            else:
+                transport = ExecutorTransport(RequestsTransport(pool_size, timeout), pool_size)
+
+        super().__init__(
+            app_name, transport, pool_size, timeout, cache, rate_limiter, rate_limit_retries, json_backend, hooks,
+            retry=retry, breaker=breaker, timeouts=timeouts
+        )
+        self.single_flight = AsyncSingleFlight() if single_flight else None
+        # hedged with tasks rather than threads
+        self.hedge = hedge
+        self.max_concurrency = max_concurrency or pool_size
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        await self.transport.close()
+
+    async def _send(self, request):
+        endpoint, _, url = request
+        timeout = self.timeouts.get(endpoint, self.timeout)
+        if self.hedge is None:
+            return await self.transport.get(url, timeout=timeout)
+        return await self.hedge.get_async(self.transport, endpoint, url, timeout, self.rate_limiter)
+
+    async def _fetch(self, request, cache, key, check, parse):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        attempt = failures = 0
+        while True:
+            self._check_circuit(request)
+            try:
+                if self.rate_limiter is not None:
+                    await asyncio.sleep(self.rate_limiter.reserve())
+
+                async with self._semaphore:
+                    start = time.perf_counter()
+                    try:
+                        response = await self._send(request)
+                    except Exception as e:
+                        self._emit(request, start, cache=cache, error=e)
+                        delay = self._retry_delay(request, failures, error=e)
+                        if delay is None:
+                            raise
+                        response = None
+            except BaseException:
+                # cancelled requests must not hold a half-open circuit trial
+                self._abandon_circuit(request)
+                raise
+
+            if response is not None:
+                delay = self._retry_delay(request, failures, status=response.status)
+            if delay is not None:
+                if response is not None:
+                    self._emit(request, start, response, cache=cache, error=CryptoCompareHttpError(response.status))
+                failures += 1
+                await asyncio.sleep(delay)
+                continue
+
+            try:
+                result = self._observed_decode(request, start, response, cache, key, check, parse)
+                break
+            except CryptoCompareRateLimitError:
+                if attempt >= self.rate_limit_retries:
+                    raise
+                await asyncio.sleep(backoff(attempt))
+                attempt += 1
+
+        if self.cache is not None:
+            self.cache.set(request[0], request[2], response.content)
+        return response, result
+
+    async def _get(self, url, key=None, check=True, parse=None, **params):
+        request = self._request(url, params)
+        endpoint, _, url = request
+
+        cache = None
+        if self.cache is not None:
+            cached = self.cache.get(endpoint, url)
+            if cached is not None:
+                return self._observed_decode(
+                    request, time.perf_counter(), Response(200, cached, 0.0), 'hit', key, check, parse
+                )
+            cache = 'miss'
+
+        try:
+            if self.single_flight is None:
+                return (await self._fetch(request, cache, key, check, parse))[1]
+            leader, (response, result) = await self.single_flight.do(
+                url, lambda: self._fetch(request, cache, key, check, parse)
+            )
+        except CryptoCompareCircuitOpenError as e:
+            return self._serve_stale(request, e, key, check, parse)
+
+        if leader:
+            return result
+        return self._observed_decode(
+            request, time.perf_counter(), Response(response.status, response.content, None), 'shared',
+            key, check, parse
+        )
+
+    async def gather(self, *aws, limit=None, return_exceptions=False):
+        """Await many requests at once, `limit` defaulting to `max_concurrency`"""
+        return await gather(*aws, limit=limit or self.max_concurrency, return_exceptions=return_exceptions)
+
+    async def get_historical_range(self, fsym, tsym, period=Period.DAY, start=0, end=None, exchange=None,
+                                   columnar=False, max_workers=None):
+        start = _timestamp(start)
+        end = _timestamp(end) if end is not None else int(time.time())
+        pages = await self.gather(*(
+            self.get_historical(fsym, tsym, period, exchange=exchange, limit=limit, to_ts=to_ts, columnar=columnar)
+            for to_ts, limit in self._historical_windows(period, start, end)
+        ), limit=max_workers)
+        return self._merge_historical(pages, start, end, columnar)
+
+    async def get_historical_panel(self, pairs, period=Period.DAY, start=0, end=None, fill=None, max_workers=None):
+        pairs, start, end, windows = self._panel_plan(pairs, period, start, end)
+        pages = await self.gather(*(
+            self.get_historical(fsym, tsym, period, exchange=exchange, limit=limit, to_ts=to_ts, columnar=True)
+            for (fsym, tsym, exchange), (to_ts, limit) in itertools.product(pairs, windows)
+        ), limit=max_workers)
+
+        n = len(windows)
+        series = [self._merge_historical(pages[i * n:(i + 1) * n], start, end, True) for i in range(len(pairs))]
+        return Panel.from_candles(pairs, series, period.seconds, start, end, fill)
+
+    async def get_prices_at(self, fsym, tsyms, timestamps, exchange=None, field='close'):
+        if isinstance(tsyms, str):
+            tsyms = tsyms.split(',')
+        timestamps = sorted({_timestamp(ts) for ts in timestamps})
+
+        result = {ts: {} for ts in timestamps}
+        for tsym in (tsym.upper() for tsym in tsyms):
+            for period, cluster in self._plan_prices_at(timestamps, int(time.time())):
+                start = cluster[0] - cluster[0] % period.seconds
+                candles = await self.get_historical_range(
+                    fsym, tsym, period, start, cluster[-1], exchange=exchange, columnar=True
+                )
+                missing = []
+                for ts, price in zip(cluster, self._lookup_prices_at(candles, cluster, period, field)):
+                    if price is None:
+                        missing.append(ts)
+                    else:
+                        result[ts][tsym] = price
+
+                prices = await self.gather(*(
+                    self.get_historical_for_timestamp(fsym, tsym, ts, exchange=exchange) for ts in missing
+                ))
+                for ts, price in zip(missing, prices):
+                    result[ts][tsym] = price[fsym.upper()][tsym]
+        return result
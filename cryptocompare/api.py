@@ -1,10 +1,28 @@
+import bisect
+import collections.abc
 import enum
 import datetime
-import requests
+import functools
+import itertools
+import time
 
 from datetime import timezone
 
+from . import decoder, models, panel
+from .cache import endpoint_name
+from .columnar import Candles
+from .lazy import LazyMapping
+from .metrics import RequestEvent
+from .ratelimit import backoff
+from .resilience import CircuitBreaker
+from .singleflight import SingleFlight
+from .transport import DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT, RequestsTransport, Response
+
 ERROR_TYPE_THRESHOLD = 100
+RATE_LIMIT_RETRIES = 3
+HISTORICAL_PAGE_LIMIT = 2000
+# age of the oldest minute data provided by CryptoCompare
+MINUTE_HISTORY = 7 * 24 * 3600
 
 
 class Period(enum.Enum):
@@ -12,6 +30,10 @@ class Period(enum.Enum):
     HOUR = 'hour'
     MINUTE = 'minute'
 
+    @property
+    def seconds(self):
+        return {'day': 86400, 'hour': 3600, 'minute': 60}[self.value]
+
 
 class CalculationType(enum.Enum):
     CLOSE = 'Close'
@@ -19,32 +41,274 @@ class CalculationType(enum.Enum):
     VOL_F_VOL_T = 'VolFVolT'
 
 
-class CryptoCompare(requests.Session):
-    def __init__(self, app_name=None):
-        self.app_name = None
+class CryptoCompare:
+    def __init__(self, app_name=None, transport=None, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT,
+                 cache=None, rate_limiter=None, rate_limit_retries=RATE_LIMIT_RETRIES, json_backend=None,
+                 hooks=None, single_flight=True, retry=None, hedge=None, breaker=None, timeouts=None):
+        self.app_name = app_name
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.transport = transport if transport is not None else RequestsTransport(pool_size, timeout)
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.rate_limit_retries = rate_limit_retries
+        self.loads = decoder.get_loads(json_backend)
+        self.hooks = list(hooks or [])
+        self.single_flight = SingleFlight() if single_flight else None
+        self.retry = retry
+        self.hedge = hedge
+        self.breaker = breaker
+        self.timeouts = dict(timeouts or {})  # seconds by endpoint, overriding timeout
+        # threads of hedged requests
+        self._executor = None
+        if hedge is not None:
+            import concurrent.futures
+            self._executor = concurrent.futures.ThreadPoolExecutor(pool_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self.transport.close()
+
+    def add_hook(self, hook):
+        """Call `hook` with a `RequestEvent` after every request"""
+        self.hooks.append(hook)
 
     @staticmethod
     def _check_request_response_error(response):
-        if not isinstance(response, dict):
+        if not isinstance(response, collections.abc.Mapping):
             return
         if response.get('Response') == 'Error' or response.get('Type', ERROR_TYPE_THRESHOLD) < ERROR_TYPE_THRESHOLD:
+            if 'rate limit' in str(response.get('Message')).lower():
+                raise CryptoCompareRateLimitError(response.get('Message'))
             raise CryptoCompareApiError(response.get('Message'))
 
-    def get_coin_list(self):
-        url = 'https://min-api.cryptocompare.com/data/all/coinlist'
-        result = requests.get(url).json()
+    def _request(self, url, params):
+        """(endpoint, URL template, URL) of a request"""
+        params.setdefault('extra_params', '&extraParams={}'.format(self.app_name) if self.app_name else '')
+        formatted = url.format(**params)
+        return endpoint_name(formatted), url, formatted
+
+    def _decode(self, response, key=None, check=True, parse=None):
+        if response.status == 429:
+            raise CryptoCompareRateLimitError('HTTP error 429')
+        if response.status >= 400:
+            raise CryptoCompareHttpError(response.status)
+
+        result = parse(response.content, self.loads) if parse else self.loads(response.content)
+        if check:
+            self.__class__._check_request_response_error(result)
+        return result[key] if key else result
+
+    def _emit(self, request, start, response=None, decode=0.0, cache=None, error=None):
+        if not self.hooks:
+            return
+        event = RequestEvent(
+            *request,
+            bytes=len(response.content) if response is not None else 0,
+            ttfb=response.elapsed if response is not None else None,
+            total=time.perf_counter() - start,
+            decode=decode,
+            cache=cache,
+            error=type(error).__name__ if error is not None else None
+        )
+        for hook in self.hooks:
+            hook(event)
+
+    def _observed_decode(self, request, start, response, cache, key, check, parse):
+        """Decode a response, reporting its request to hooks"""
+        decode_start = time.perf_counter()
+        error = None
+        try:
+            return self._decode(response, key, check, parse)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._emit(request, start, response, time.perf_counter() - decode_start, cache, error)
+
+    def _check_circuit(self, request):
+        if self.breaker is not None:
+            host = CircuitBreaker.host(request[2])
+            if not self.breaker.allow(host):
+                raise CryptoCompareCircuitOpenError(host)
+
+    def _abandon_circuit(self, request):
+        if self.breaker is not None:
+            self.breaker.abandon(CircuitBreaker.host(request[2]))
+
+    def _retry_delay(self, request, failures, error=None, status=None):
+        """
+        Delay before retrying an attempt which failed with a transport error
+        or a 5xx status, None if it is not retried. Outcomes of attempts are
+        reported to the circuit breaker.
+        """
+        failed = error is not None or status >= 500
+        if self.breaker is not None:
+            host = CircuitBreaker.host(request[2])
+            if failed:
+                self.breaker.failure(host)
+            else:
+                self.breaker.success(host)
+
+        if not failed or self.retry is None:
+            return None
+        if error is not None and not self.retry.retries_error(error, failures):
+            return None
+        if error is None and not self.retry.retries_status(status, failures):
+            return None
+        return self.retry.delay(failures)
+
+    def _serve_stale(self, request, error, key, check, parse):
+        """Expired cached response of a request refused by the circuit breaker"""
+        content = self.cache.get(request[0], request[2], stale=True) if self.cache is not None else None
+        if content is None:
+            raise error
+        return self._observed_decode(
+            request, time.perf_counter(), Response(200, content, None), 'stale', key, check, parse
+        )
+
+    def _send(self, request):
+        endpoint, _, url = request
+        timeout = self.timeouts.get(endpoint, self.timeout)
+        if self.hedge is None:
+            return self.transport.get(url, timeout=timeout)
+        return self.hedge.get(self._executor, self.transport, endpoint, url, timeout, self.rate_limiter)
+
+    def _fetch(self, request, cache, key, check, parse):
+        """
+        (response, result) of a request sent through the transport, retried
+        on rate limit errors and as allowed by the retry policy
+        """
+        attempt = failures = 0
+        while True:
+            self._check_circuit(request)
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+
+                start = time.perf_counter()
+                try:
+                    response = self._send(request)
+                except Exception as e:
+                    self._emit(request, start, cache=cache, error=e)
+                    delay = self._retry_delay(request, failures, error=e)
+                    if delay is None:
+                        raise
+                    response = None
+            except BaseException:
+                # interrupted requests must not hold a half-open circuit trial
+                self._abandon_circuit(request)
+                raise
+
+            if response is None:
+                failures += 1
+                time.sleep(delay)
+                continue
+
+            delay = self._retry_delay(request, failures, status=response.status)
+            if delay is not None:
+                self._emit(request, start, response, cache=cache, error=CryptoCompareHttpError(response.status))
+                failures += 1
+                time.sleep(delay)
+                continue
+
+            try:
+                result = self._observed_decode(request, start, response, cache, key, check, parse)
+                break
+            except CryptoCompareRateLimitError:
+                if attempt >= self.rate_limit_retries:
+                    raise
+                time.sleep(backoff(attempt))
+                attempt += 1
+
+        if self.cache is not None:
+            self.cache.set(request[0], request[2], response.content)
+        return response, result
+
+    def _get(self, url, key=None, check=True, parse=None, **params):
+        """
+        Format `url` with `params`, fetch it through the client transport and
+        return the response decoded by `parse(content, loads)` (JSON by
+        default), or its `key` item if provided. Concurrent calls for the
+        same URL share a single request.
+        """
+        request = self._request(url, params)
+        endpoint, _, url = request
+
+        cache = None
+        if self.cache is not None:
+            cached = self.cache.get(endpoint, url)
+            if cached is not None:
+                return self._observed_decode(
+                    request, time.perf_counter(), Response(200, cached, 0.0), 'hit', key, check, parse
+                )
+            cache = 'miss'
+
+        try:
+            if self.single_flight is None:
+                return self._fetch(request, cache, key, check, parse)[1]
+            leader, (response, result) = self.single_flight.do(
+                url, lambda: self._fetch(request, cache, key, check, parse)
+            )
+        except CryptoCompareCircuitOpenError as e:
+            return self._serve_stale(request, e, key, check, parse)
+
+        if leader:
+            return result
+        # callers may parse the shared body differently
+        return self._observed_decode(
+            request, time.perf_counter(), Response(response.status, response.content, None), 'shared',
+            key, check, parse
+        )
+
+    @staticmethod
+    def _historical_windows(period, start, end, page_limit=HISTORICAL_PAGE_LIMIT):
+        """
+        Split the [start, end] range into (to_ts, limit) pages of historical
+        data, newest first
+        """
+        step = period.seconds
+        to_ts = end - end % step
+        windows = []
+        while to_ts >= start:
+            windows.append((to_ts, max(1, min(page_limit, (to_ts - start) // step))))
+            to_ts -= (page_limit + 1) * step
+        return windows
 
-        self.__class__._check_request_response_error(result)
-        return result['Data']
+    @staticmethod
+    def _merge_historical(pages, start, end, columnar=False):
+        """Merge pages of historical data, without duplicates and in time order"""
+        if columnar:
+            return Candles.concat(pages, start, end)
+
+        candles = {}
+        for page in pages:
+            for candle in page:
+                if start <= candle['time'] <= end:
+                    candles[candle['time']] = candle
+        return [candles[t] for t in sorted(candles)]
+
+    def get_coin_list(self, lazy=False):
+        """
+        Coins by symbol. With `lazy`, a read only `LazyMapping` decoding coins
+        from the raw response only when accessed is returned instead
+        """
+        url = 'https://min-api.cryptocompare.com/data/all/coinlist'
+        return self._get(url, key='Data', parse=LazyMapping.parse if lazy else None)
 
     def get_exchange_list(self):
         url = 'https://min-api.cryptocompare.com/data/all/exchanges'
-        result = requests.get(url).json()
-
-        self.__class__._check_request_response_error(result)
-        return result
+        return self._get(url)
 
-    def get_price(self, fsyms, tsyms, exchange=None):
+    def get_price(self, fsyms, tsyms, exchange=None, typed=False):
+        """Prices by fsym and tsym, or a list of `Price` records if `typed` is set"""
         url = 'https://min-api.cryptocompare.com/data/pricemulti?fsyms={fsyms}&tsyms={tsyms}{exchange}{extra_params}'
 
         if isinstance(fsyms, (list, tuple, set)):
@@ -52,17 +316,19 @@ class CryptoCompare(requests.Session):
         if isinstance(tsyms, (list, tuple, set)):
             tsyms = ','.join(tsyms)
 
-        result = requests.get(url.format(
+        return self._get(
+            url,
+            parse=models.parse_prices if typed else None,
             fsyms=fsyms.upper(),
             tsyms=tsyms.upper(),
-            exchange='&e={}'.format(exchange) if exchange else '',
-            extra_params='&extraParams={}'.format(self.app_name) if self.app_name else ''
-        )).json()
-
-        self.__class__._check_request_response_error(result)
-        return result
-
-    def get_symbols_full_data(self, fsyms, tsyms, exchange=None):
+            exchange='&e={}'.format(exchange) if exchange else ''
+        )
+
+    def get_symbols_full_data(self, fsyms, tsyms, exchange=None, typed=False, display=True):
+        """
+        RAW and DISPLAY full data by fsym and tsym, or a list of `Ticker`
+        records if `typed` is set. DISPLAY is not even decoded without `display`.
+        """
         url = 'https://min-api.cryptocompare.com/data/pricemultifull?fsyms={fsyms}&tsyms={tsyms}{exchange}{extra_params}'
 
         if isinstance(fsyms, (list, tuple, set)):
@@ -70,42 +336,158 @@ class CryptoCompare(requests.Session):
         if isinstance(tsyms, (list, tuple, set)):
             tsyms = ','.join(tsyms)
 
-        result = requests.get(url.format(
+        parse = None
+        if typed or not display:
+            parse = functools.partial(models.parse_full_data, typed=typed, display=display)
+        return self._get(
+            url,
+            parse=parse,
             fsyms=fsyms.upper(),
             tsyms=tsyms.upper(),
-            exchange='&e={}'.format(exchange) if exchange else '',
-            extra_params='&extraParams={}'.format(self.app_name) if self.app_name else ''
-        )).json()
-
-        self.__class__._check_request_response_error(result)
-        return result
+            exchange='&e={}'.format(exchange) if exchange else ''
+        )
 
     def get_generate_custom_average(self, fsym, tsym, exchanges=[]):
         url = 'https://min-api.cryptocompare.com/data/generateAvg?fsym={fsym}&tsym={tsym}&e={exchange}'
-        result = requests.get(url.format(
+        return self._get(
+            url,
             fsym=fsym.upper(),
             tsym=tsym.upper(),
-            exchange=','.join(exchanges),
-            extra_params='&extraParams={}'.format(self.app_name) if self.app_name else ''
-        )).json()
-
-        self.__class__._check_request_response_error(result)
-        return result
-
-    def get_historical(self, fsym, tsym, period=Period.DAY, exchange=None, limit=None, to_ts=None):
+            exchange=','.join(exchanges)
+        )
+
+    def get_historical(self, fsym, tsym, period=Period.DAY, exchange=None, limit=None, to_ts=None, columnar=False):
+        """
+        Historical data as a list of candle dicts, or as `Candles` columns if
+        `columnar` is set
+        """
         url = 'https://min-api.cryptocompare.com/data/histo{period}?fsym={fsym}&tsym={tsym}{limit}{exchange}{to_ts}{extra_params}'
-        result = requests.get(url.format(
+        return self._get(
+            url,
+            key='Data',
+            parse=Candles.parse if columnar else None,
             fsym=fsym.upper(),
             tsym=tsym.upper(),
             period=period.value,
             exchange='&e={}'.format(exchange) if exchange else '',
             limit='&limit={}'.format(limit) if limit else '',
-            to_ts='&toTs={}'.format(to_ts) if to_ts else '',
-            extra_params='&extraParams={}'.format(self.app_name) if self.app_name else ''
-        )).json()
+            to_ts='&toTs={}'.format(to_ts) if to_ts else ''
+        )
+
+    def get_historical_range(self, fsym, tsym, period=Period.DAY, start=0, end=None, exchange=None,
+                             columnar=False, max_workers=None):
+        """
+        Historical data between `start` and `end` (timestamps or datetimes,
+        `end` defaulting to now), fetched as concurrent pages of at most
+        HISTORICAL_PAGE_LIMIT points
+        """
+        start = _timestamp(start)
+        end = _timestamp(end) if end is not None else int(time.time())
+        windows = self._historical_windows(period, start, end)
+
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or self.pool_size) as executor:
+            pages = executor.map(
+                lambda w: self.get_historical(
+                    fsym, tsym, period, exchange=exchange, limit=w[1], to_ts=w[0], columnar=columnar
+                ),
+                windows
+            )
+            return self._merge_historical(pages, start, end, columnar)
+
+    @staticmethod
+    def _panel_plan(pairs, period, start, end):
+        """(pairs, start, end, windows) of a panel, start being aligned on the period"""
+        pairs = panel.normalize_pairs(pairs)
+        start = _timestamp(start)
+        start -= start % period.seconds
+        end = _timestamp(end) if end is not None else int(time.time())
+        return pairs, start, end, CryptoCompare._historical_windows(period, start, end)
+
+    def get_historical_panel(self, pairs, period=Period.DAY, start=0, end=None, fill=None, max_workers=None):
+        """
+        Historical data of many (fsym, tsym) or (fsym, tsym, exchange) pairs
+        between `start` and `end`, as a `Panel` aligned on a shared time index.
+        Pages of all pairs are fetched concurrently; gaps are NaN, or forward
+        filled with `fill='ffill'`.
+        """
+        pairs, start, end, windows = self._panel_plan(pairs, period, start, end)
+
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or self.pool_size) as executor:
+            pages = list(executor.map(
+                lambda job: self.get_historical(
+                    job[0][0], job[0][1], period, exchange=job[0][2], limit=job[1][1], to_ts=job[1][0], columnar=True
+                ),
+                itertools.product(pairs, windows)
+            ))
+
+        n = len(windows)
+        series = [self._merge_historical(pages[i * n:(i + 1) * n], start, end, True) for i in range(len(pairs))]
+        return panel.Panel.from_candles(pairs, series, period.seconds, start, end, fill)
+
+    @staticmethod
+    def _plan_prices_at(timestamps, now):
+        """
+        Group sorted timestamps into (period, timestamps) clusters, using minute
+        data where available. Clusters are split where consecutive timestamps
+        are more than a page apart, so that no page without a timestamp is
+        fetched, and may span any number of pages.
+        """
+        groups = (
+            (Period.MINUTE, [ts for ts in timestamps if now - ts < MINUTE_HISTORY]),
+            (Period.HOUR, [ts for ts in timestamps if now - ts >= MINUTE_HISTORY]),
+        )
+        for period, group in groups:
+            cluster = []
+            for ts in group:
+                if cluster and ts - cluster[-1] > HISTORICAL_PAGE_LIMIT * period.seconds:
+                    yield period, cluster
+                    cluster = []
+                cluster.append(ts)
+            if cluster:
+                yield period, cluster
 
-        self.__class__._check_request_response_error(result)
-        return result['Data']
+    @staticmethod
+    def _lookup_prices_at(candles, timestamps, period, field):
+        """
+        Value of `field` of the candle holding each timestamp, None where
+        there is no such candle or it holds no data
+        """
+        times = candles.time
+        values = getattr(candles, field)
+        for ts in timestamps:
+            i = bisect.bisect_right(times, ts) - 1
+            if i >= 0 and ts - times[i] < period.seconds and values[i]:
+                yield values[i]
+            else:
+                yield None
+
+    def get_prices_at(self, fsym, tsyms, timestamps, exchange=None, field='close'):
+        """
+        Prices of `fsym` in `tsyms` at many timestamps, as a dict of
+        {timestamp: {tsym: price}}. Historical data covering the timestamps is
+        fetched once per cluster of close timestamps, `get_historical_for_timestamp`
+        being only requested for timestamps it does not cover.
+        """
+        if isinstance(tsyms, str):
+            tsyms = tsyms.split(',')
+        timestamps = sorted({_timestamp(ts) for ts in timestamps})
+
+        result = {ts: {} for ts in timestamps}
+        for tsym in (tsym.upper() for tsym in tsyms):
+            for period, cluster in self._plan_prices_at(timestamps, int(time.time())):
+                start = cluster[0] - cluster[0] % period.seconds
+                candles = self.get_historical_range(
+                    fsym, tsym, period, start, cluster[-1], exchange=exchange, columnar=True
+                )
+                for ts, price in zip(cluster, self._lookup_prices_at(candles, cluster, period, field)):
+                    if price is None:
+                        price = self.get_historical_for_timestamp(fsym, tsym, ts, exchange=exchange)[fsym.upper()][tsym]
+                    result[ts][tsym] = price
+        return result
 
     def get_historical_for_timestamp(self, fsym, tsyms, ts, calculation_type=None, exchange=None):
         url = 'https://min-api.cryptocompare.com/data/pricehistorical?fsym={fsym}&tsyms={tsyms}&ts={ts}{calculation_type}{exchange}{extra_params}'
@@ -113,81 +495,63 @@ class CryptoCompare(requests.Session):
         if isinstance(tsyms, (list, tuple, set)):
             tsyms = ','.join(tsyms)
 
-        result = requests.get(url.format(
+        return self._get(
+            url,
             fsym=fsym.upper(),
             tsyms=tsyms.upper(),
             ts=ts,
             calculation_type='&calculationType={}'.format(calculation_type.value) if calculation_type else '',
-            exchange='&e={}'.format(exchange) if exchange else '',
-            extra_params='&extraParams={}'.format(self.app_name) if self.app_name else ''
-        )).json()
-
-        self.__class__._check_request_response_error(result)
-        return result
+            exchange='&e={}'.format(exchange) if exchange else ''
+        )
 
     def get_coin_snapshot(self, fsym, tsym):
         url = 'https://www.cryptocompare.com/api/data/coinsnapshot/?fsym={fsym}&tsym={tsym}'
-        result = requests.get(url.format(tsym=tsym, fsym=fsym)).json()
-
-        self.__class__._check_request_response_error(result)
-        return result['Data']
+        return self._get(url, key='Data', tsym=tsym, fsym=fsym)
 
     def get_coin_snapshot_full_by_id(self, coin_id):
         url = 'https://www.cryptocompare.com/api/data/coinsnapshotfullbyid/?id={id}'
-        result = requests.get(url.format(id=coin_id)).json()
-
-        self.__class__._check_request_response_error(result)
-        return result['Data']
+        return self._get(url, key='Data', id=coin_id)
 
     def get_social_stats(self, coin_id):
         url = 'https://www.cryptocompare.com/api/data/socialstats/?id={id}'
-        result = requests.get(url.format(id=coin_id)).json()
-
-        self.__class__._check_request_response_error(result)
-        return result['Data']
+        return self._get(url, key='Data', id=coin_id)
 
-    def get_mining_contracts(self):
+    def get_mining_contracts(self, lazy=False):
+        """Mining contracts by id, as a `LazyMapping` if `lazy` is set"""
         url = 'https://www.cryptocompare.com/api/data/miningcontracts'
-        result = requests.get(url).json()
-
-        self.__class__._check_request_response_error(result)
-        return result['MiningData']
+        return self._get(url, key='MiningData', parse=LazyMapping.parse if lazy else None)
 
-    def get_mining_equipement(self):
+    def get_mining_equipement(self, lazy=False):
+        """Mining equipment by id, as a `LazyMapping` if `lazy` is set"""
         url = 'https://www.cryptocompare.com/api/data/miningequipment'
-        result = requests.get(url).json()
+        return self._get(url, key='MiningData', parse=LazyMapping.parse if lazy else None)
 
-        self.__class__._check_request_response_error(result)
-        return result['MiningData']
-
-    def get_top_exchanges(self, fsym, tsym, limit=None):
+    def get_top_exchanges(self, fsym, tsym, limit=None, typed=False):
+        """Top exchanges by volume of a pair, as `PairVolume` records if `typed` is set"""
         url = 'https://min-api.cryptocompare.com/data/top/exchanges?fsym={fsym}&tsym={tsym}{limit}{extra_params}'
-        result = requests.get(url.format(
+        return self._get(
+            url,
+            key='Data',
+            parse=models.parse_volumes if typed else None,
             fsym=fsym.upper(),
             tsym=tsym.upper(),
-            limit='&limit={}'.format(limit) if limit else '',
-            extra_params='&extraParams={}'.format(self.app_name) if self.app_name else ''
-        )).json()
-
-        self.__class__._check_request_response_error(result)
-        return result['Data']
+            limit='&limit={}'.format(limit) if limit else ''
+        )
 
-    def get_top_pairs(self, fsym, limit=None):
+    def get_top_pairs(self, fsym, limit=None, typed=False):
+        """Top pairs by volume of a coin, as `PairVolume` records if `typed` is set"""
         url = 'https://min-api.cryptocompare.com/data/top/pairs?fsym={fsym}{limit}{extra_params}'
-        result = requests.get(url.format(
+        return self._get(
+            url,
+            key='Data',
+            parse=models.parse_volumes if typed else None,
             fsym=fsym.upper(),
-            limit='&limit={}'.format(limit) if limit else '',
-            extra_params='&extraParams={}'.format(self.app_name) if self.app_name else ''
-        )).json()
-
-        self.__class__._check_request_response_error(result)
-        return result['Data']
+            limit='&limit={}'.format(limit) if limit else ''
+        )
 
     def get_news_providers(self):
         url = 'https://min-api.cryptocompare.com/data/news/providers?{extra_params}'
-        return requests.get(url.format(
-            extra_params='&extraParams={}'.format(self.app_name) if self.app_name else ''
-        )).json()
+        return self._get(url, check=False)
 
     def get_latest_news(self, feeds=None, before=None, lang=None):
         url = 'https://min-api.cryptocompare.com/data/news/?{feeds}{lTs}{lang}{extra_params}'
@@ -197,22 +561,39 @@ class CryptoCompare(requests.Session):
         if isinstance(lang, (list, tuple, set)):
             lang = ','.join(lang)
 
-        timestamp = None
-        if isinstance(before, datetime.datetime):
-            timestamp = int(before.replace(tzinfo=timezone.utc).timestamp())
-        elif before:
-            timestamp = int(before)
+        timestamp = _timestamp(before) if before else None
 
-        result = requests.get(url.format(
+        return self._get(
+            url,
             feeds='feeds={}'.format(feeds) if feeds else '',
-            lTs='lTs={}'.format(timestamp) if timestamp else '',
-            lang='&lang={}'.format(lang) if lang else '',
-            extra_params='&extraParams={}'.format(self.app_name) if self.app_name else ''
-        )).json()
+            lTs='&lTs={}'.format(timestamp) if timestamp else '',
+            lang='&lang={}'.format(lang) if lang else ''
+        )
 
-        self.__class__._check_request_response_error(result)
-        return result
+
+def _timestamp(value):
+    if isinstance(value, datetime.datetime):
+        return int(value.replace(tzinfo=timezone.utc).timestamp())
+    return int(value)
 
 
 class CryptoCompareApiError(Exception):
     pass
+
+
+class CryptoCompareRateLimitError(CryptoCompareApiError):
+    pass
+
+
+class CryptoCompareHttpError(CryptoCompareApiError):
+    def __init__(self, status):
+        super().__init__('HTTP error {}'.format(status))
+        self.status = status
+
+
+class CryptoCompareCircuitOpenError(CryptoCompareApiError):
+    """Request refused as the circuit breaker of its host is open"""
+
+    def __init__(self, host):
+        super().__init__('Circuit open for {}'.format(host))
+        self.host = host
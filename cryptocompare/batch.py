@@ -0,0 +1,101 @@
+import collections
+import concurrent.futures
+import threading
+
+from .api import CryptoCompareApiError
+
+DEFAULT_WINDOW = 0.01
+# maximum lengths of the comma separated symbols lists accepted by pricemulti
+MAX_FSYMS_LENGTH = 300
+MAX_TSYMS_LENGTH = 100
+
+
+def chunk_symbols(symbols, max_length):
+    """Split symbols into lists whose comma separated length fits max_length"""
+    chunk = []
+    length = -1
+    for symbol in symbols:
+        if chunk and length + 1 + len(symbol) > max_length:
+            yield chunk
+            chunk = []
+            length = -1
+        chunk.append(symbol)
+        length += 1 + len(symbol)
+    if chunk:
+        yield chunk
+
+
+class PriceBatcher:
+    """
+    Coalesces single pair price lookups made within `window` seconds, from any
+    thread, into as few pricemulti requests as possible. With `full` set,
+    pricemultifull is requested and the RAW data of pairs is returned instead
+    of their price.
+    """
+
+    def __init__(self, client, window=DEFAULT_WINDOW, full=False):
+        self.client = client
+        self.window = window
+        self.full = full
+        self._pending = collections.defaultdict(list)
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
+
+    def submit(self, fsym, tsym, exchange=None):
+        """Schedule a pair lookup, returning a future of its result"""
+        future = concurrent.futures.Future()
+        with self._lock:
+            self._pending[exchange].append((fsym.upper(), tsym.upper(), future))
+            if self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return future
+
+    def get_price(self, fsym, tsym, exchange=None):
+        return self.submit(fsym, tsym, exchange).result()
+
+    def flush(self):
+        """Send the pending lookups now"""
+        with self._lock:
+            pending, self._pending = self._pending, collections.defaultdict(list)
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        for exchange, lookups in pending.items():
+            fsyms = sorted({fsym for fsym, _, _ in lookups})
+            for fchunk in chunk_symbols(fsyms, MAX_FSYMS_LENGTH):
+                fset = set(fchunk)
+                chunk_lookups = [lookup for lookup in lookups if lookup[0] in fset]
+                # only the tsyms looked up for this chunk, so that every request serves a lookup
+                tsyms = sorted({tsym for _, tsym, _ in chunk_lookups})
+                for tchunk in chunk_symbols(tsyms, MAX_TSYMS_LENGTH):
+                    self._send(exchange, fchunk, tchunk, chunk_lookups)
+
+    def _send(self, exchange, fsyms, tsyms, lookups):
+        tset = set(tsyms)
+        lookups = [lookup for lookup in lookups if lookup[1] in tset]
+
+        try:
+            if self.full:
+                result = self.client.get_symbols_full_data(fsyms, tsyms, exchange=exchange).get('RAW', {})
+            else:
+                result = self.client.get_price(fsyms, tsyms, exchange=exchange)
+        except Exception as e:
+            for _, _, future in lookups:
+                future.set_exception(e)
+            return
+
+        for fsym, tsym, future in lookups:
+            value = result.get(fsym, {}).get(tsym)
+            if value is None:
+                future.set_exception(CryptoCompareApiError('No data for {}/{}'.format(fsym, tsym)))
+            else:
+                future.set_result(value)
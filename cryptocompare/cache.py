@@ -0,0 +1,150 @@
+import collections
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+import urllib.parse
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+# seconds during which responses of each endpoint are considered fresh,
+# endpoints not listed are not cached
+DEFAULT_TTLS = {
+    'all/coinlist': 6 * 3600,
+    'all/exchanges': 3600,
+    'miningcontracts': 3600,
+    'miningequipment': 3600,
+    'news/providers': 6 * 3600,
+    'coinsnapshotfullbyid': 600,
+    'socialstats': 600,
+    'top/exchanges': 60,
+    'top/pairs': 60,
+    'pricemulti': 10,
+    'pricemultifull': 10,
+    'generateAvg': 10,
+}
+
+
+def endpoint_name(url):
+    """Name of the endpoint of an URL, i.e. its path without the API prefix"""
+    path = urllib.parse.urlsplit(url).path.strip('/')
+    for prefix in ('api/data/', 'data/'):
+        if path.startswith(prefix):
+            return path[len(prefix):]
+    return path
+
+
+class MemoryCache:
+    """
+    In-memory backend evicting least recently used entries once their total
+    size exceeds `max_size` bytes
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, expires, content):
+        if len(content) > self.max_size:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[1])
+            self._entries[key] = (expires, content)
+            self.size += len(content)
+            while self.size > self.max_size:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class DiskCache:
+    """Backend storing each entry in a file of `directory`"""
+
+    HEADER = struct.Struct('<d')
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest())
+
+    def get(self, key):
+        try:
+            with open(self._path(key), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        expires, = self.HEADER.unpack_from(data)
+        return expires, data[self.HEADER.size:]
+
+    def set(self, key, expires, content):
+        fd, path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.HEADER.pack(expires))
+            f.write(content)
+        os.replace(path, self._path(key))
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+
+
+class ResponseCache:
+    """
+    Cache of raw response bodies keyed by URL, with a time to live per
+    endpoint. Expired entries are kept until evicted by the backend.
+    """
+
+    def __init__(self, backend=None, ttls=None, default_ttl=0):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.hits = collections.Counter()
+        self.misses = collections.Counter()
+
+    def ttl(self, endpoint):
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, endpoint, url, stale=False):
+        """Cached body of `url`, None if missing or expired unless `stale` is set"""
+        if not self.ttl(endpoint):
+            return None
+
+        entry = self.backend.get(url)
+        if entry is not None and (stale or entry[0] > time.time()):
+            self.hits[endpoint] += 1
+            return entry[1]
+
+        self.misses[endpoint] += 1
+        return None
+
+    def set(self, endpoint, url, content):
+        ttl = self.ttl(endpoint)
+        if ttl:
+            self.backend.set(url, time.time() + ttl, content)
+
+    def clear(self):
+        self.backend.clear()
+        self.hits.clear()
+        self.misses.clear()
@@ -0,0 +1,170 @@
+"""
+Command line interface
+
+    python -m cryptocompare backfill BTC/USD ETH/USD@Kraken --period minute \\
+        --start 2018-01-01 --output data/
+"""
+
+import argparse
+import collections
+import datetime
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from .api import HISTORICAL_PAGE_LIMIT, CryptoCompare, Period, _timestamp
+from .ratelimit import ProcessRateLimiter
+
+DEFAULT_PAGES_PER_JOB = 10
+DEFAULT_WORKERS = 4
+CHECKPOINT = 'checkpoint.jsonl'
+TIME_FORMATS = ('%Y-%m-%d', '%Y-%m-%dT%H:%M:%S')
+
+Job = collections.namedtuple('Job', ['fsym', 'tsym', 'exchange', 'period', 'start', 'end'])
+
+_client = None
+
+
+def parse_pair(value):
+    """(fsym, tsym, exchange) of strings like 'BTC/USD' or 'BTC/USD@Kraken'"""
+    pair, _, exchange = value.partition('@')
+    fsym, _, tsym = pair.partition('/')
+    if not fsym or not tsym:
+        raise argparse.ArgumentTypeError("invalid pair {!r}, expected FSYM/TSYM[@EXCHANGE]".format(value))
+    return fsym.upper(), tsym.upper(), exchange or None
+
+
+def parse_time(value):
+    """Timestamp of an integer or ISO 8601 date string"""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+
+    # datetime.fromisoformat is not available before Python 3.7
+    for date_format in TIME_FORMATS:
+        try:
+            return _timestamp(datetime.datetime.strptime(value, date_format))
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError("invalid time {!r}, expected a timestamp or YYYY-MM-DD[THH:MM:SS]".format(value))
+
+
+def plan(pairs, period, start, end, pages_per_job=DEFAULT_PAGES_PER_JOB):
+    """Jobs covering every pair between start and end, a few pages each"""
+    span = pages_per_job * (HISTORICAL_PAGE_LIMIT + 1) * period.seconds
+    first = start - start % period.seconds
+    jobs = []
+    for fsym, tsym, exchange in pairs:
+        for window in range(first, end + 1, span):
+            jobs.append(Job(fsym, tsym, exchange, period.value, window, min(end, window + span - period.seconds)))
+    return jobs
+
+
+def job_key(job):
+    return '{}-{}-{}-{}-{}-{}'.format(job.fsym, job.tsym, job.exchange or 'CCCAGG', job.period, job.start, job.end)
+
+
+def job_path(output, job):
+    directory = os.path.join(output, '{}-{}-{}-{}'.format(job.fsym, job.tsym, job.exchange or 'CCCAGG', job.period))
+    return os.path.join(directory, '{}-{}.candles'.format(job.start, job.end))
+
+
+def read_checkpoint(path):
+    try:
+        with open(path) as f:
+            return {json.loads(line)['job'] for line in f if line.strip()}
+    except FileNotFoundError:
+        return set()
+
+
+def _init_worker(client_kwargs):
+    global _client
+    _client = CryptoCompare(**client_kwargs)
+
+
+def _run_job(args):
+    job, output = args
+    candles = _client.get_historical_range(
+        job.fsym, job.tsym, Period(job.period), job.start, job.end, exchange=job.exchange, columnar=True,
+        max_workers=1
+    )
+    path = job_path(output, job)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    candles.save(path + '.tmp')
+    os.replace(path + '.tmp', path)
+    return job, len(candles)
+
+
+def backfill(jobs, output, workers=DEFAULT_WORKERS, client_kwargs=None, report=None):
+    """
+    Run jobs on `workers` processes (in process if 0), skipping those already
+    recorded in the output checkpoint. Return the number of fetched candles.
+    """
+    os.makedirs(output, exist_ok=True)
+    checkpoint = os.path.join(output, CHECKPOINT)
+    done = read_checkpoint(checkpoint)
+    pending = [job for job in jobs if job_key(job) not in done]
+    client_kwargs = client_kwargs or {}
+
+    if workers:
+        pool = multiprocessing.Pool(workers, _init_worker, (client_kwargs,))
+        results = pool.imap_unordered(_run_job, [(job, output) for job in pending])
+    else:
+        pool = None
+        _init_worker(client_kwargs)
+        results = map(_run_job, [(job, output) for job in pending])
+
+    total = 0
+    start = time.monotonic()
+    try:
+        with open(checkpoint, 'a') as f:
+            for count, (job, candles) in enumerate(results, 1):
+                f.write(json.dumps({'job': job_key(job), 'candles': candles}) + '\n')
+                f.flush()
+                total += candles
+                if report is not None:
+                    report(count, len(pending), total, time.monotonic() - start)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+    return total
+
+
+def _report(done, jobs, candles, elapsed):
+    print(
+        '\r{}/{} jobs, {} candles, {:.0f} candles/s'.format(done, jobs, candles, candles / max(elapsed, 1e-9)),
+        end='', file=sys.stderr, flush=True
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cryptocompare')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    command = commands.add_parser('backfill', help="download historical data of many pairs to columnar files")
+    command.add_argument('pairs', nargs='+', type=parse_pair, metavar='FSYM/TSYM[@EXCHANGE]')
+    command.add_argument('--period', default=Period.DAY.value, choices=[p.value for p in Period])
+    command.add_argument('--start', type=parse_time, required=True, help="timestamp or ISO 8601 date")
+    command.add_argument('--end', type=parse_time, default=None, help="timestamp or ISO 8601 date, now by default")
+    command.add_argument('--output', required=True, help="directory of files and checkpoint")
+    command.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="processes, 0 to run in process")
+    command.add_argument('--pages-per-job', type=int, default=DEFAULT_PAGES_PER_JOB)
+    command.add_argument('--per-second', type=int, default=None, help="requests budget shared by workers")
+    command.add_argument('--per-minute', type=int, default=None)
+    command.add_argument('--per-hour', type=int, default=None)
+    command.add_argument('--app-name', default=None)
+    args = parser.parse_args(argv)
+
+    end = args.end if args.end is not None else int(time.time())
+    jobs = plan(args.pairs, Period(args.period), args.start, end, args.pages_per_job)
+    client_kwargs = {'app_name': args.app_name}
+    if args.per_second or args.per_minute or args.per_hour:
+        client_kwargs['rate_limiter'] = ProcessRateLimiter(args.per_second, args.per_minute, args.per_hour)
+
+    total = backfill(jobs, args.output, args.workers, client_kwargs, _report)
+    print('\n{} candles written to {}'.format(total, args.output), file=sys.stderr)
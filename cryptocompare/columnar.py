@@ -0,0 +1,151 @@
+import array
+import json
+import struct
+import sys
+
+from . import decoder
+
+FIELDS = ('time', 'open', 'high', 'low', 'close', 'volumefrom', 'volumeto')
+
+# binary file format: magic, candles count, then every column in FIELDS order
+# as little endian int64 or float64 values
+MAGIC = b'CCCANDL1'
+HEADER = struct.Struct('<8sQ')
+
+
+class Candles:
+    """
+    Columnar OHLCV history, each field being held in a contiguous array so
+    that it can be viewed as a NumPy array without copying
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, time=(), open=(), high=(), low=(), close=(), volumefrom=(), volumeto=()):
+        self.time = array.array('q', time)
+        self.open = array.array('d', open)
+        self.high = array.array('d', high)
+        self.low = array.array('d', low)
+        self.close = array.array('d', close)
+        self.volumefrom = array.array('d', volumefrom)
+        self.volumeto = array.array('d', volumeto)
+
+    def __len__(self):
+        return len(self.time)
+
+    def __getitem__(self, index):
+        return {field: getattr(self, field)[index] for field in FIELDS}
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __eq__(self, other):
+        if not isinstance(other, Candles):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in FIELDS)
+
+    def __repr__(self):
+        return '<Candles {} points>'.format(len(self))
+
+    def append(self, candle):
+        for field in FIELDS:
+            getattr(self, field).append(candle[field])
+
+    def columns(self):
+        return {field: getattr(self, field) for field in FIELDS}
+
+    @classmethod
+    def parse(cls, content, loads=None):
+        """
+        Decode an historical data response body with `loads`, its 'Data'
+        candles being returned as columns. With the standard library decoder,
+        candles are appended straight into columns instead of being built as
+        dicts.
+        """
+        if loads is not None and loads is not decoder.get_loads('json'):
+            result = loads(content)
+            if isinstance(result, dict) and isinstance(result.get('Data'), list):
+                data = result['Data']
+                result['Data'] = cls(*([candle[field] for candle in data] for field in FIELDS))
+            return result
+
+        candles = cls()
+        appends = {field: getattr(candles, field).append for field in FIELDS}
+
+        def object_pairs_hook(pairs):
+            if not pairs or pairs[0][0] not in appends:
+                return dict(pairs)
+            for name, value in pairs:
+                append = appends.get(name)
+                if append is not None:
+                    append(value)
+
+        result = json.loads(content, object_pairs_hook=object_pairs_hook)
+        if isinstance(result, dict) and isinstance(result.get('Data'), list):
+            result['Data'] = candles
+        return result
+
+    @classmethod
+    def concat(cls, parts, start=None, end=None):
+        """
+        Concatenate time ordered candles, keeping those between `start` and
+        `end` and dropping duplicated times
+        """
+        result = cls()
+        last = None
+        for part in sorted((p for p in parts if len(p)), key=lambda p: p.time[0]):
+            for i, t in enumerate(part.time):
+                if (last is not None and t <= last) or (start is not None and t < start):
+                    continue
+                if end is not None and t > end:
+                    break
+                for field in FIELDS:
+                    getattr(result, field).append(getattr(part, field)[i])
+                last = t
+        return result
+
+    def save(self, path):
+        """Write columns to a compact binary file"""
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(self)))
+            for field in FIELDS:
+                column = getattr(self, field)
+                if sys.byteorder != 'little':
+                    column = array.array(column.typecode, column)
+                    column.byteswap()
+                column.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """Read columns written by `save`"""
+        candles = cls()
+        with open(path, 'rb') as f:
+            magic, count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError("{} is not a candles file".format(path))
+            for field in FIELDS:
+                column = getattr(candles, field)
+                column.fromfile(f, count)
+                if sys.byteorder != 'little':
+                    column.byteswap()
+        return candles
+
+    def to_numpy(self):
+        """
+        Dict of NumPy arrays sharing memory with the columns, which cannot be
+        appended to while those arrays are alive
+        """
+        import numpy
+
+        return {
+            field: numpy.frombuffer(column, dtype=numpy.int64 if column.typecode == 'q' else numpy.float64)
+            for field, column in self.columns().items()
+        }
+
+    def to_pandas(self):
+        """DataFrame of the columns, indexed by time"""
+        import pandas
+
+        columns = self.to_numpy()
+        index = pandas.to_datetime(columns.pop('time'), unit='s')
+        return pandas.DataFrame(columns, index=index)
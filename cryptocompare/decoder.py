@@ -0,0 +1,56 @@
+"""
+JSON decoding of response bodies, using the fastest available backend among
+orjson, simdjson and ujson, or the standard library otherwise
+"""
+
+import json
+import sys
+
+
+def _standard_loads(content):
+    return json.loads(content)
+
+
+def _load_backend():
+    try:
+        import orjson
+        return 'orjson', orjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import simdjson
+        return 'simdjson', simdjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import ujson
+        return 'ujson', ujson.loads
+    except ImportError:
+        pass
+
+    return 'json', _standard_loads
+
+
+def __getattr__(name):
+    # the default backend is looked up on first use, as importing it takes time
+    if name in ('backend', 'loads'):
+        global backend, loads
+        backend, loads = _load_backend()
+        return globals()[name]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+# module __getattr__ is only called from Python 3.7 on
+if sys.version_info < (3, 7):
+    backend, loads = _load_backend()
+
+
+def get_loads(name=None):
+    """Decoding function of the given backend, the default one if None"""
+    if name is None:
+        return sys.modules[__name__].loads
+    if name == 'json':
+        return _standard_loads
+    return __import__(name).loads
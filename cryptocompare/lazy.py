@@ -0,0 +1,161 @@
+import collections.abc
+import json
+import re
+
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+_SCALAR = re.compile(rb'[^\s,{}\[\]"]+')
+_KEY = re.compile(rb'\s*("[^"\\]*(?:\\.[^"\\]*)*")\s*:\s*')
+_OPEN = re.compile(rb'[{\[]\s*([}\]])?')
+_SEPARATOR = re.compile(rb'\s*([,}\]])')
+_SPACE = re.compile(rb'\s*')
+_CLOSE = {b'{': b'}', b'[': b']'}
+
+
+def _invalid(pos):
+    return ValueError("invalid JSON at offset {}".format(pos))
+
+
+def _key(raw):
+    raw = raw[1:-1]
+    return json.loads(b'"' + raw + b'"') if b'\\' in raw else raw.decode()
+
+
+def _flat_end(content, pos, close):
+    """
+    Offset right after the container starting at pos if it holds no nested
+    container nor escaped character, else None. Only relies on byte searches,
+    a closing bracket within a string being caught by the quotes count.
+    """
+    end = content.find(close, pos)
+    if end < 0:
+        raise _invalid(pos)
+    if (content.find(b'{', pos + 1, end) < 0 and content.find(b'[', pos + 1, end) < 0
+            and content.find(b'\\', pos, end) < 0 and not content.count(b'"', pos, end) % 2):
+        return end + 1
+    return None
+
+
+def _value(content, pos, keep):
+    """End offset of the JSON value starting at pos, with its index if it is an object"""
+    first = content[pos:pos + 1]
+    if first == b'"':
+        match = _STRING.match(content, pos)
+    elif first in _CLOSE:
+        end = _flat_end(content, pos, _CLOSE[first])
+        if end is not None:
+            return end, None
+        if first == b'{':
+            index, end = _object(content, pos, keep)
+            return end, index
+        return _array(content, pos), None
+    else:
+        match = _SCALAR.match(content, pos)
+    if match is None:
+        raise _invalid(pos)
+    return match.end(), None
+
+
+def _separator(content, pos, close):
+    """Offset after the separator following a member, and whether it closed the container"""
+    match = _SEPARATOR.match(content, pos)
+    if match is None or match.group(1) not in (b',', close):
+        raise _invalid(pos)
+    return match.end(), match.group(1) == close
+
+
+def _object(content, pos, keep):
+    """
+    Index of the members of the JSON object starting at pos, mapping keys to
+    (start, end, index) where index is the one of a nested object found
+    while scanning, kept `keep` levels deep. Also returns the end offset.
+    """
+    match = _OPEN.match(content, pos)
+    if match is None or content[pos:pos + 1] != b'{':
+        raise _invalid(pos)
+
+    index = {}
+    if match.group(1):
+        return index, match.end()
+
+    pos = match.end()
+    closed = False
+    while not closed:
+        match = _KEY.match(content, pos)
+        if match is None:
+            raise _invalid(pos)
+        start = match.end()
+        end, nested = _value(content, start, keep - 1)
+        index[_key(match.group(1))] = start, end, nested if keep > 0 else None
+        pos, closed = _separator(content, end, b'}')
+    return index, pos
+
+
+def _array(content, pos):
+    """Offset right after the JSON array starting at pos"""
+    match = _OPEN.match(content, pos)
+    if match is None or content[pos:pos + 1] != b'[':
+        raise _invalid(pos)
+    if match.group(1):
+        return match.end()
+
+    pos = match.end()
+    closed = False
+    while not closed:
+        end, _ = _value(content, pos, 0)
+        pos, closed = _separator(content, end, b']')
+        pos = _SPACE.match(content, pos).end()
+    return pos
+
+
+class LazyMapping(collections.abc.Mapping):
+    """
+    Read only mapping over a JSON object of a response body, its members
+    being decoded only when accessed. Members offsets are indexed in a single
+    pass on creation. With `levels` greater than 1, members which are objects
+    are themselves returned as lazy mappings of `levels - 1` levels.
+    """
+
+    def __init__(self, content, loads=json.loads, levels=1, start=0, index=None):
+        self._content = content
+        self._loads = loads
+        self._levels = levels
+        if index is None:
+            index = _object(content, start, levels - 1)[0]
+        self._index = index
+        self._values = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        start, end, index = self._index[key]
+        if self._levels > 1 and self._content[start:start + 1] == b'{':
+            value = LazyMapping(self._content, self._loads, self._levels - 1, start, index)
+        else:
+            value = self._loads(self._content[start:end])
+        self._values[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __repr__(self):
+        return '<LazyMapping {} keys>'.format(len(self))
+
+    def raw(self, key):
+        """Undecoded JSON bytes of a member"""
+        start, end, _ = self._index[key]
+        return self._content[start:end]
+
+    @classmethod
+    def parse(cls, content, loads=json.loads):
+        """Lazy response, the members of its top level objects being lazy too"""
+        return cls(content, loads, levels=2)
@@ -0,0 +1,130 @@
+import array
+import math
+
+from .batch import MAX_FSYMS_LENGTH, MAX_TSYMS_LENGTH, chunk_symbols
+
+_UNLOADED = object()
+# imported on first use, None if not installed
+numpy = _UNLOADED
+
+DEFAULT_PIVOTS = ('USD',)
+
+
+def _numpy():
+    global numpy
+    if numpy is _UNLOADED:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+    return numpy
+
+
+class PriceMatrix:
+    """
+    Rates between every two symbols, `rate(a, b)` being the price of one `a`
+    in `b`, NaN when unknown. Rates quoted by CryptoCompare are direct, the
+    others being derived through a pivot currency.
+    """
+
+    def __init__(self, symbols, rates, direct):
+        self.symbols = list(symbols)
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.rates = rates  # list of array('d') rows
+        self.direct = direct  # set of (i, j) indexes
+
+    def __getitem__(self, pair):
+        return self.rate(*pair)
+
+    def rate(self, fsym, tsym):
+        return self.rates[self.index[fsym.upper()]][self.index[tsym.upper()]]
+
+    def is_direct(self, fsym, tsym):
+        return (self.index[fsym.upper()], self.index[tsym.upper()]) in self.direct
+
+    def is_synthetic(self, fsym, tsym):
+        return not self.is_direct(fsym, tsym) and not math.isnan(self.rate(fsym, tsym))
+
+    def to_dict(self):
+        """Rates as nested dicts, like `get_price` results"""
+        return {
+            a: {b: row[j] for j, b in enumerate(self.symbols) if not math.isnan(row[j])}
+            for a, row in zip(self.symbols, self.rates)
+        }
+
+    def to_numpy(self):
+        return _numpy().array(self.rates)
+
+
+def _cross_rates(quotes, pivots):
+    """
+    Rates of every symbol in every other, `quotes` being per symbol a list of
+    their prices in each pivot (NaN if unknown), the first pivot quoting both
+    symbols being used
+    """
+    numpy = _numpy()
+    if numpy is not None:
+        prices = numpy.array(quotes, dtype=float).reshape(len(quotes), len(pivots))
+        rates = numpy.full((len(quotes), len(quotes)), numpy.nan)
+        for k in range(len(pivots)):
+            column = prices[:, k]
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                cross = column[:, None] / column[None, :]
+            rates = numpy.where(numpy.isnan(rates), cross, rates)
+        rates[~numpy.isfinite(rates)] = numpy.nan
+        return [array.array('d', row) for row in rates]
+
+    rates = []
+    for a in quotes:
+        row = array.array('d', [math.nan]) * len(quotes)
+        for j, b in enumerate(quotes):
+            for pa, pb in zip(a, b):
+                if not math.isnan(pa) and not math.isnan(pb) and pb:
+                    row[j] = pa / pb
+                    break
+        rates.append(row)
+    return rates
+
+
+def get_price_matrix(client, symbols, pivots=DEFAULT_PIVOTS, exchange=None):
+    """
+    Price matrix of `symbols`, requesting their prices in the `pivots`
+    currencies only (from a given exchange if provided) and deriving the other
+    rates from those. Pivots are quoted in each other too, so that symbols
+    missing a quote in a pivot are converted from another one.
+    """
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+    pivots = [pivot.upper() for pivot in pivots]
+
+    prices = {}
+    for fsyms in chunk_symbols(list(dict.fromkeys(symbols + pivots)), MAX_FSYMS_LENGTH):
+        for tsyms in chunk_symbols(pivots, MAX_TSYMS_LENGTH):
+            for fsym, quotes in client.get_price(fsyms, tsyms, exchange=exchange).items():
+                prices.setdefault(fsym, {}).update(quotes)
+
+    # pivots quote themselves
+    quotes = [
+        [1.0 if symbol == pivot else prices.get(symbol, {}).get(pivot, math.nan) for pivot in pivots]
+        for symbol in symbols
+    ]
+    for row in quotes:
+        for k, pivot in enumerate(pivots):
+            if not math.isnan(row[k]):
+                continue
+            for l, other in enumerate(pivots):
+                rate = prices.get(other, {}).get(pivot)
+                if not math.isnan(row[l]) and rate:
+                    row[k] = row[l] * rate
+                    break
+
+    rates = _cross_rates(quotes, pivots)
+
+    index = {symbol: i for i, symbol in enumerate(symbols)}
+    direct = {(i, i) for i in range(len(symbols))}
+    for fsym, quoted in prices.items():
+        for tsym in quoted:
+            if fsym in index and tsym in index:
+                direct.add((index[fsym], index[tsym]))
+                rates[index[fsym]][index[tsym]] = quoted[tsym]
+
+    return PriceMatrix(symbols, rates, direct)
@@ -0,0 +1,152 @@
+import bisect
+import collections
+import threading
+
+RequestEvent = collections.namedtuple('RequestEvent', [
+    'endpoint',  # endpoint path, e.g. 'histominute'
+    'template',  # URL template of the client method
+    'url',
+    'bytes',  # size of the response body
+    'ttfb',  # seconds until response headers were received, None if no response
+    'total',  # seconds spent on the request, decoding included
+    'decode',  # seconds spent decoding the response
+    'cache',  # 'hit', 'miss', 'shared' (concurrent identical request), 'stale' (open circuit) or None
+    'error',  # name of the raised exception type, or None
+])
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the `q` quantile"""
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank and cumulative:
+                return bound
+        return None
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+
+
+class EndpointMetrics:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.requests = 0
+        self.bytes = 0
+        self.errors = collections.Counter()
+        self.cache = collections.Counter()
+        self.total = Histogram(buckets)
+        self.ttfb = Histogram(buckets)
+        self.decode = Histogram(buckets)
+
+
+class MetricsCollector:
+    """
+    Client hook aggregating request events per endpoint, with latency
+    histograms exportable in the Prometheus text format
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.endpoints = collections.defaultdict(lambda: EndpointMetrics(self.buckets))
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        with self._lock:
+            metrics = self.endpoints[event.endpoint]
+            metrics.requests += 1
+            metrics.bytes += event.bytes
+            metrics.total.observe(event.total)
+            metrics.decode.observe(event.decode)
+            if event.ttfb is not None and event.cache != 'hit':
+                metrics.ttfb.observe(event.ttfb)
+            if event.error is not None:
+                metrics.errors[event.error] += 1
+            if event.cache is not None:
+                metrics.cache[event.cache] += 1
+
+    def to_prometheus(self, prefix='cryptocompare'):
+        lines = []
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+
+            lines.append('# TYPE {}_requests_total counter'.format(prefix))
+            for endpoint, metrics in endpoints:
+                lines.append('{}_requests_total{{endpoint="{}"}} {}'.format(prefix, endpoint, metrics.requests))
+
+            lines.append('# TYPE {}_response_bytes_total counter'.format(prefix))
+            for endpoint, metrics in endpoints:
+                lines.append('{}_response_bytes_total{{endpoint="{}"}} {}'.format(prefix, endpoint, metrics.bytes))
+
+            lines.append('# TYPE {}_errors_total counter'.format(prefix))
+            for endpoint, metrics in endpoints:
+                for error, count in sorted(metrics.errors.items()):
+                    lines.append('{}_errors_total{{endpoint="{}",type="{}"}} {}'.format(prefix, endpoint, error, count))
+
+            lines.append('# TYPE {}_cache_total counter'.format(prefix))
+            for endpoint, metrics in endpoints:
+                for result, count in sorted(metrics.cache.items()):
+                    lines.append('{}_cache_total{{endpoint="{}",result="{}"}} {}'.format(prefix, endpoint, result, count))
+
+            for name in ('total', 'ttfb', 'decode'):
+                metric = '{}_request_{}_seconds'.format(prefix, name)
+                lines.append('# TYPE {} histogram'.format(metric))
+                for endpoint, metrics in endpoints:
+                    histogram = getattr(metrics, name)
+                    for bound, count in histogram.cumulative():
+                        le = '+Inf' if bound == float('inf') else repr(bound)
+                        lines.append('{}_bucket{{endpoint="{}",le="{}"}} {}'.format(metric, endpoint, le, count))
+                    lines.append('{}_sum{{endpoint="{}"}} {}'.format(metric, endpoint, histogram.sum))
+                    lines.append('{}_count{{endpoint="{}"}} {}'.format(metric, endpoint, histogram.count))
+
+        return '\n'.join(lines) + '\n'
+
+
+class StatsdExporter:
+    """Client hook sending every request event to a StatsD server over UDP"""
+
+    def __init__(self, host='127.0.0.1', port=8125, prefix='cryptocompare'):
+        self.address = (host, port)
+        self.prefix = prefix
+        import socket
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def lines(self, event):
+        name = '{}.{}'.format(self.prefix, event.endpoint.replace('/', '_'))
+        lines = [
+            '{}.requests:1|c'.format(name),
+            '{}.bytes:{}|c'.format(name, event.bytes),
+            '{}.total:{:.3f}|ms'.format(name, event.total * 1000),
+            '{}.decode:{:.3f}|ms'.format(name, event.decode * 1000),
+        ]
+        if event.ttfb is not None and event.cache != 'hit':
+            lines.append('{}.ttfb:{:.3f}|ms'.format(name, event.ttfb * 1000))
+        if event.error is not None:
+            lines.append('{}.errors.{}:1|c'.format(name, event.error))
+        if event.cache is not None:
+            lines.append('{}.cache.{}:1|c'.format(name, event.cache))
+        return lines
+
+    def __call__(self, event):
+        self._socket.sendto('\n'.join(self.lines(event)).encode(), self.address)
+
+    def close(self):
+        self._socket.close()
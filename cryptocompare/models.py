@@ -0,0 +1,133 @@
+import collections
+import sys
+
+Price = collections.namedtuple('Price', ['fsym', 'tsym', 'price'])
+
+# (attribute, RAW key) of full data fields
+TICKER_FIELDS = (
+    ('fsym', 'FROMSYMBOL'),
+    ('tsym', 'TOSYMBOL'),
+    ('market', 'MARKET'),
+    ('flags', 'FLAGS'),
+    ('price', 'PRICE'),
+    ('last_update', 'LASTUPDATE'),
+    ('last_volume', 'LASTVOLUME'),
+    ('last_volume_to', 'LASTVOLUMETO'),
+    ('last_trade_id', 'LASTTRADEID'),
+    ('last_market', 'LASTMARKET'),
+    ('volume_day', 'VOLUMEDAY'),
+    ('volume_day_to', 'VOLUMEDAYTO'),
+    ('volume_24h', 'VOLUME24HOUR'),
+    ('volume_24h_to', 'VOLUME24HOURTO'),
+    ('open_day', 'OPENDAY'),
+    ('high_day', 'HIGHDAY'),
+    ('low_day', 'LOWDAY'),
+    ('open_24h', 'OPEN24HOUR'),
+    ('high_24h', 'HIGH24HOUR'),
+    ('low_24h', 'LOW24HOUR'),
+    ('change_day', 'CHANGEDAY'),
+    ('change_pct_day', 'CHANGEPCTDAY'),
+    ('change_24h', 'CHANGE24HOUR'),
+    ('change_pct_24h', 'CHANGEPCT24HOUR'),
+    ('supply', 'SUPPLY'),
+    ('mktcap', 'MKTCAP'),
+    ('total_volume_24h', 'TOTALVOLUME24H'),
+    ('total_volume_24h_to', 'TOTALVOLUME24HTO'),
+)
+_INTERNED = frozenset(['FROMSYMBOL', 'TOSYMBOL', 'MARKET', 'LASTMARKET'])
+
+# display is the DISPLAY dict of the pair, None unless requested
+Ticker = collections.namedtuple('Ticker', [name for name, _ in TICKER_FIELDS] + ['display'])
+
+PairVolume = collections.namedtuple('PairVolume', ['exchange', 'fsym', 'tsym', 'volume_24h', 'volume_24h_to'])
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def ticker(raw, display=None):
+    """`Ticker` of the RAW full data of a pair"""
+    return Ticker(
+        *(_intern(raw.get(key)) if key in _INTERNED else raw.get(key) for _, key in TICKER_FIELDS),
+        display=display
+    )
+
+
+def _is_error(result):
+    return isinstance(result, dict) and result.get('Response') == 'Error'
+
+
+def parse_prices(content, loads):
+    """`Price` records of a `pricemulti` response"""
+    result = loads(content)
+    if _is_error(result):
+        return result
+    return [
+        Price(sys.intern(fsym), sys.intern(tsym), price)
+        for fsym, prices in result.items()
+        for tsym, price in prices.items()
+    ]
+
+
+def _display_key(content):
+    """Offset of the comma before a DISPLAY object key, None if not found"""
+    pos = content.find(b'"DISPLAY"')
+    while pos >= 0:
+        # quotes within strings are escaped, so a key follows a comma or brace
+        before = content[:pos].rstrip()
+        if before.endswith(b',') and content[pos + 9:pos + 19].lstrip().startswith(b':'):
+            return len(before) - 1
+        pos = content.find(b'"DISPLAY"', pos + 1)
+    return None
+
+
+def _without_display(content, loads):
+    """
+    Full data response decoded without its DISPLAY member. As CryptoCompare
+    sends it after RAW, the body is cut before it so that it is never decoded.
+    """
+    cut = _display_key(content)
+    if cut is not None:
+        try:
+            response = loads(content[:cut] + b'}')
+        except ValueError:
+            response = None
+        if isinstance(response, dict) and 'RAW' in response:
+            return response
+
+    response = loads(content)
+    if isinstance(response, dict):
+        response.pop('DISPLAY', None)
+    return response
+
+
+def parse_full_data(content, loads, typed=True, display=True):
+    """
+    `Ticker` records of a `pricemultifull` response, or the response itself
+    if `typed` is not set. Unless `display` is set, DISPLAY is not decoded.
+    """
+    response = loads(content) if display else _without_display(content, loads)
+    if not typed or not isinstance(response, dict) or 'RAW' not in response:
+        return response
+
+    displays = response.get('DISPLAY', {})
+    return [
+        ticker(raw, displays.get(fsym, {}).get(tsym) if display else None)
+        for fsym, tsyms in response['RAW'].items()
+        for tsym, raw in tsyms.items()
+    ]
+
+
+def parse_volumes(content, loads):
+    """`top/exchanges` or `top/pairs` response, its Data being `PairVolume` records"""
+    result = loads(content)
+    if isinstance(result, dict) and isinstance(result.get('Data'), list):
+        result['Data'] = [
+            PairVolume(
+                _intern(entry.get('exchange')), _intern(entry.get('fromSymbol')), _intern(entry.get('toSymbol')),
+                entry.get('volume24h'), entry.get('volume24hTo')
+            )
+            for entry in result['Data']
+        ]
+    return result
@@ -0,0 +1,121 @@
+import collections
+import concurrent.futures
+import queue
+import threading
+import time
+
+DEFAULT_SEEN_SIZE = 10000
+DEFAULT_WORKERS = 4
+
+_DONE = object()
+
+
+def _articles(result):
+    return result['Data'] if isinstance(result, dict) else result
+
+
+class NewsCursor:
+    """
+    Walks `get_latest_news` forward and backward without returning an
+    article twice. The identifiers of the last `seen_size` articles are
+    remembered, along with the newest and oldest publication times seen.
+    """
+
+    def __init__(self, client, feeds=None, lang=None, seen_size=DEFAULT_SEEN_SIZE):
+        self.client = client
+        self.feeds = feeds
+        self.lang = lang
+        self.seen_size = seen_size
+        self.newest = None
+        self.oldest = None
+        self._seen = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _page(self, before=None):
+        return _articles(self.client.get_latest_news(feeds=self.feeds, before=before, lang=self.lang))
+
+    def _accept(self, article):
+        """Whether an article was not seen yet, marking it seen"""
+        with self._lock:
+            if article['id'] in self._seen:
+                return False
+            self._seen[article['id']] = None
+            if len(self._seen) > self.seen_size:
+                self._seen.popitem(last=False)
+
+            published = article['published_on']
+            self.newest = published if self.newest is None else max(self.newest, published)
+            self.oldest = published if self.oldest is None else min(self.oldest, published)
+            return True
+
+    def poll(self):
+        """
+        Articles published since the newest seen one, newest first. Pages are
+        only requested further back until reaching already seen articles.
+        """
+        newest = self.newest
+        before = None
+        while True:
+            page = self._page(before)
+            for article in page:
+                if newest is None or article['published_on'] >= newest:
+                    if self._accept(article):
+                        yield article
+
+            if newest is None or not page:
+                return
+            oldest = min(article['published_on'] for article in page)
+            if oldest <= newest or oldest == before:
+                return
+            before = oldest
+
+    def _walk(self, start, end, pages, stop):
+        """Put pages of articles published between start and end in queue"""
+        try:
+            before = end
+            while not stop.is_set():
+                page = self._page(before)
+                pages.put([article for article in page if article['published_on'] >= start])
+                if not page:
+                    return
+                oldest = min(article['published_on'] for article in page)
+                if oldest < start or oldest == before:
+                    return
+                before = oldest
+        finally:
+            pages.put(_DONE)
+
+    def backfill(self, until, workers=DEFAULT_WORKERS):
+        """
+        Articles published from the oldest seen one (or now) back to the
+        `until` timestamp. The range is split in `workers` slices paged back
+        concurrently, articles being yielded as pages arrive.
+        """
+        end = self.oldest if self.oldest is not None else int(time.time())
+        span = max(1, (end - until) // workers)
+        slices = [(max(until, end - (i + 1) * span), end - i * span) for i in range(workers)]
+        slices[-1] = (until, slices[-1][1])
+
+        pages = queue.Queue(maxsize=workers * 2)
+        stop = threading.Event()
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            futures = [executor.submit(self._walk, a, b, pages, stop) for a, b in slices if a < b]
+            remaining = len(futures)
+            try:
+                while remaining:
+                    page = pages.get()
+                    if page is _DONE:
+                        remaining -= 1
+                        continue
+                    for article in page:
+                        if self._accept(article):
+                            yield article
+            finally:
+                # let workers finish when iteration is stopped early
+                stop.set()
+                while remaining:
+                    if pages.get() is _DONE:
+                        remaining -= 1
+
+            for future in futures:
+                future.result()
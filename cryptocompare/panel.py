@@ -0,0 +1,138 @@
+import array
+import math
+
+from .columnar import FIELDS
+
+VALUE_FIELDS = FIELDS[1:]
+PRICE_FIELDS = ('open', 'high', 'low', 'close')
+FILLS = (None, 'ffill')
+
+
+def normalize_pairs(pairs):
+    """(fsym, tsym, exchange) tuples of (fsym, tsym) or (fsym, tsym, exchange) pairs"""
+    result = []
+    for pair in pairs:
+        fsym, tsym, exchange = (tuple(pair) + (None,))[:3]
+        result.append((fsym.upper(), tsym.upper(), exchange))
+    return result
+
+
+def _is_empty(candles, k):
+    # CryptoCompare answers zero candles before a pair was listed
+    return not (candles.close[k] or candles.volumefrom[k] or candles.volumeto[k])
+
+
+class Panel:
+    """
+    Historical data of many pairs aligned on a shared time index of one point
+    every `step` seconds. Each field is a row major (pairs, time) matrix held
+    as one flat array('d'), missing candles being NaN unless filled.
+    """
+
+    def __init__(self, pairs, time, step, values):
+        self.pairs = pairs  # (fsym, tsym, exchange) tuples
+        self.time = time  # array('q')
+        self.step = step
+        self.values = values  # field -> array('d') of len(pairs) * len(time) values
+        self.index = {pair: i for i, pair in enumerate(pairs)}
+
+    @property
+    def shape(self):
+        return len(self.pairs), len(self.time)
+
+    def __getitem__(self, field):
+        return self.values[field]
+
+    def _position(self, pair):
+        if len(pair) == 2:
+            pair = tuple(pair) + (None,)
+        return self.index[normalize_pairs([pair])[0]]
+
+    def row(self, field, pair):
+        """Values of a field for a pair, along the time index"""
+        width = len(self.time)
+        i = self._position(pair)
+        return self.values[field][i * width:(i + 1) * width]
+
+    def value(self, field, pair, t):
+        """Value of a field for a pair at timestamp t"""
+        column = (t - self.time[0]) // self.step if self.time else -1
+        if not 0 <= column < len(self.time):
+            raise IndexError("timestamp {} is outside of the panel time index".format(t))
+        return self.values[field][self._position(pair) * len(self.time) + column]
+
+    @classmethod
+    def from_candles(cls, pairs, series, step, start, end, fill=None):
+        """
+        Panel of `series` of `Candles`, one per pair, on the time index from
+        `start` to `end`. With `fill='ffill'`, gaps following a candle take
+        its close price and zero volumes.
+        """
+        if fill not in FILLS:
+            raise ValueError("fill should be one of {}".format(FILLS))
+
+        first = start - start % step
+        time = array.array('q', range(first, end + 1, step))
+        width = len(time)
+        values = {field: array.array('d', [math.nan]) * (len(pairs) * width) for field in VALUE_FIELDS}
+
+        for i, candles in enumerate(series):
+            cls._place(values, i * width, width, candles, first, step)
+            if fill == 'ffill':
+                cls._fill(values, i * width, width)
+        return cls(list(pairs), time, step, values)
+
+    @staticmethod
+    def _place(values, offset, width, candles, first, step):
+        n = len(candles)
+        if not n:
+            return
+        i = (candles.time[0] - first) // step
+        contiguous = candles.time[-1] - candles.time[0] == (n - 1) * step
+        if contiguous and 0 <= i and i + n <= width and not candles.close.count(0.0):
+            # copied column by column
+            for field in VALUE_FIELDS:
+                values[field][offset + i:offset + i + n] = getattr(candles, field)
+            return
+
+        for k, t in enumerate(candles.time):
+            i = (t - first) // step
+            if 0 <= i < width and not _is_empty(candles, k):
+                for field in VALUE_FIELDS:
+                    values[field][offset + i] = getattr(candles, field)[k]
+
+    @staticmethod
+    def _fill(values, offset, width):
+        close = values['close']
+        previous = math.nan
+        for i in range(offset, offset + width):
+            if close[i] != close[i]:
+                if previous == previous:
+                    for field in PRICE_FIELDS:
+                        values[field][i] = previous
+                    values['volumefrom'][i] = values['volumeto'][i] = 0.0
+            else:
+                previous = close[i]
+
+    def to_numpy(self):
+        """
+        Dict of the time index and of (pairs, time) NumPy matrices sharing
+        memory with the panel
+        """
+        import numpy
+
+        result = {'time': numpy.frombuffer(self.time, dtype=numpy.int64)}
+        for field, column in self.values.items():
+            result[field] = numpy.frombuffer(column, dtype=numpy.float64).reshape(self.shape)
+        return result
+
+    def to_pandas(self, field='close'):
+        """DataFrame of a field, indexed by time with a column per pair"""
+        import pandas
+
+        arrays = self.to_numpy()
+        columns = [
+            '{}/{}'.format(fsym, tsym) + ('@' + exchange if exchange else '') for fsym, tsym, exchange in self.pairs
+        ]
+        index = pandas.to_datetime(arrays['time'], unit='s')
+        return pandas.DataFrame(arrays[field].T, index=index, columns=columns)
@@ -0,0 +1,118 @@
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """Bucket of `limit` tokens refilled over `window` seconds"""
+
+    def __init__(self, limit, window):
+        self.capacity = limit
+        self.rate = limit / window
+        self.tokens = float(limit)
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self):
+        """Seconds to wait until a token is available"""
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """
+    Paces requests to stay within per second, minute and hour budgets. A
+    single limiter can be shared by several clients and threads.
+    """
+
+    def __init__(self, per_second=None, per_minute=None, per_hour=None):
+        self._buckets = [
+            TokenBucket(limit, window)
+            for limit, window in ((per_second, 1), (per_minute, 60), (per_hour, 3600))
+            if limit
+        ]
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Take a token from every budget and return the seconds to wait before
+        sending the request. Budgets are taken in advance so that concurrent
+        callers are served in order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for bucket in self._buckets:
+                bucket.refill(now)
+            delay = max((bucket.delay() for bucket in self._buckets), default=0.0)
+            for bucket in self._buckets:
+                bucket.tokens -= 1
+            return delay
+
+    def acquire(self):
+        """Block until a request can be sent"""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    def try_acquire(self):
+        """Take a token from every budget if none has to be waited for"""
+        with self._lock:
+            now = time.monotonic()
+            for bucket in self._buckets:
+                bucket.refill(now)
+            if any(bucket.tokens < 1 for bucket in self._buckets):
+                return False
+            for bucket in self._buckets:
+                bucket.tokens -= 1
+            return True
+
+
+class ProcessRateLimiter:
+    """
+    Rate limiter shared by processes, e.g. passed to `multiprocessing` pool
+    initializers. Every budget is tracked as the theoretical arrival time of
+    its next request (GCRA), which is equivalent to a token bucket.
+    """
+
+    def __init__(self, per_second=None, per_minute=None, per_hour=None, context=None):
+        if context is None:
+            import multiprocessing as context
+
+        self._budgets = [
+            (window / limit, window - window / limit)  # emission interval, burst tolerance
+            for limit, window in ((per_second, 1), (per_minute, 60), (per_hour, 3600))
+            if limit
+        ]
+        self._arrivals = context.Array('d', len(self._budgets), lock=False)
+        self._lock = context.Lock()
+
+    def reserve(self):
+        with self._lock:
+            now = time.time()
+            delay = 0.0
+            for i, (interval, tolerance) in enumerate(self._budgets):
+                delay = max(delay, self._arrivals[i] - tolerance - now)
+            for i, (interval, _) in enumerate(self._budgets):
+                self._arrivals[i] = max(self._arrivals[i], now + delay) + interval
+            return delay
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    def try_acquire(self):
+        with self._lock:
+            now = time.time()
+            if any(self._arrivals[i] - tolerance > now for i, (_, tolerance) in enumerate(self._budgets)):
+                return False
+            for i, (interval, _) in enumerate(self._budgets):
+                self._arrivals[i] = max(self._arrivals[i], now) + interval
+            return True
+
+
+def backoff(attempt, base=0.5, cap=30.0):
+    """Exponential backoff delay with full jitter for the given attempt"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
@@ -0,0 +1,148 @@
+import collections
+import sys
+import threading
+
+Coin = collections.namedtuple('Coin', ['id', 'symbol', 'name', 'full_name', 'algorithm', 'proof_type'])
+
+
+def _coin(entry):
+    return Coin(
+        int(entry['Id']),
+        sys.intern(entry['Symbol'] if 'Symbol' in entry else entry['Name']),
+        entry.get('CoinName'),
+        entry.get('FullName'),
+        sys.intern(entry.get('Algorithm') or ''),
+        sys.intern(entry.get('ProofType') or ''),
+    )
+
+
+class Registry:
+    """
+    Coins and exchanges indexed from `get_coin_list` and `get_exchange_list`,
+    loaded on first lookup. Symbols and exchange names are case insensitive.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._coins = {}  # upper case symbol -> Coin
+        self._coins_by_id = {}
+        self._exchanges = {}  # lower case name -> name
+        self._exchange_pairs = {}  # name -> frozenset of (fsym, tsym)
+        self._pair_exchanges = collections.defaultdict(set)  # (fsym, tsym) -> set of names
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def _ensure_loaded(self):
+        # checked again under the lock, so that concurrent first lookups fetch the lists once
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._update(self.client.get_coin_list(), self.client.get_exchange_list())
+
+    def refresh(self):
+        """
+        Fetch coin and exchange lists again, updating only the index entries
+        which changed
+        """
+        coins = self.client.get_coin_list()
+        exchanges = self.client.get_exchange_list()
+        with self._lock:
+            self._update(coins, exchanges)
+
+    def _update(self, coins, exchanges):
+        self._refresh_coins(coins)
+        self._refresh_exchanges(exchanges)
+        self._loaded = True
+
+    def _refresh_coins(self, entries):
+        symbols = set()
+        for symbol, entry in entries.items():
+            key = symbol.upper()
+            symbols.add(key)
+            coin = _coin(entry)
+            previous = self._coins.get(key)
+            if previous != coin:
+                if previous is not None:
+                    self._coins_by_id.pop(previous.id, None)
+                self._coins[key] = coin
+                self._coins_by_id[coin.id] = coin
+
+        for key in self._coins.keys() - symbols:
+            self._coins_by_id.pop(self._coins.pop(key).id, None)
+
+    def _refresh_exchanges(self, entries):
+        names = set()
+        for name, fsyms in entries.items():
+            name = sys.intern(name)
+            names.add(name)
+            pairs = frozenset(
+                (sys.intern(fsym.upper()), sys.intern(tsym.upper()))
+                for fsym, tsyms in fsyms.items() for tsym in tsyms
+            )
+            previous = self._exchange_pairs.get(name, frozenset())
+            if pairs == previous:
+                continue
+
+            for pair in previous - pairs:
+                self._pair_exchanges[pair].discard(name)
+            for pair in pairs - previous:
+                self._pair_exchanges[pair].add(name)
+            self._exchange_pairs[name] = pairs
+            self._exchanges[name.lower()] = name
+
+        for name in set(self._exchange_pairs) - names:
+            for pair in self._exchange_pairs.pop(name):
+                self._pair_exchanges[pair].discard(name)
+            del self._exchanges[name.lower()]
+
+    def coin(self, symbol):
+        """Coin of a symbol, None if unknown"""
+        self._ensure_loaded()
+        with self._lock:
+            return self._coins.get(symbol.upper())
+
+    def coin_id(self, symbol):
+        """Identifier of a symbol, as used by `get_coin_snapshot_full_by_id`"""
+        coin = self.coin(symbol)
+        if coin is None:
+            raise KeyError(symbol)
+        return coin.id
+
+    def coin_by_id(self, coin_id):
+        self._ensure_loaded()
+        with self._lock:
+            return self._coins_by_id.get(int(coin_id))
+
+    @property
+    def symbols(self):
+        self._ensure_loaded()
+        with self._lock:
+            return frozenset(self._coins)
+
+    @property
+    def exchanges(self):
+        self._ensure_loaded()
+        with self._lock:
+            return frozenset(self._exchange_pairs)
+
+    def exchange(self, name):
+        """Exchange name as listed by CryptoCompare, None if unknown"""
+        self._ensure_loaded()
+        with self._lock:
+            return self._exchanges.get(name.lower())
+
+    def pairs(self, exchange):
+        """(fsym, tsym) pairs supported by an exchange"""
+        self._ensure_loaded()
+        with self._lock:
+            name = self._exchanges.get(exchange.lower())
+            return self._exchange_pairs[name] if name is not None else frozenset()
+
+    def exchanges_for(self, fsym, tsym):
+        """Names of the exchanges supporting a pair"""
+        self._ensure_loaded()
+        with self._lock:
+            return frozenset(self._pair_exchanges.get((fsym.upper(), tsym.upper()), ()))
+
+    def supports(self, exchange, fsym, tsym):
+        return (fsym.upper(), tsym.upper()) in self.pairs(exchange)
@@ -0,0 +1,191 @@
+import array
+import collections
+import math
+
+from .columnar import FIELDS, Candles
+
+UNITS = {'m': 60, 'h': 3600, 'd': 86400, 'w': 7 * 86400}
+# offset aligning weekly bars on mondays, epoch being a thursday
+MONDAY = 4 * 86400
+
+
+def interval(value):
+    """Bar size in seconds, from seconds or strings such as '15m', '4h' or '1w'"""
+    if isinstance(value, str):
+        return int(value[:-1]) * UNITS[value[-1].lower()]
+    return int(value)
+
+
+def _candles(candles):
+    return candles if isinstance(candles, Candles) else Candles(*([c[f] for c in candles] for f in FIELDS))
+
+
+class Resampler:
+    """
+    Incremental aggregation of candles into bars of `seconds` (or an interval
+    string) starting at `offset` past the epoch. Candles are appended in time
+    order; appending again the last candle, e.g. as it was still open, updates
+    it instead.
+    """
+
+    def __init__(self, seconds, offset=0):
+        self.seconds = interval(seconds)
+        self.offset = offset
+        self.closed = Candles()
+        self._bar = None  # start time of the current bar
+        self._sources = collections.OrderedDict()  # candles of the current bar by time
+
+    def _start(self, t):
+        return t - (t - self.offset) % self.seconds
+
+    def append(self, candle):
+        start = self._start(candle['time'])
+        if self._bar is not None and start < self._bar:
+            raise ValueError("candles must be appended in time order")
+        if self._bar is not None and start > self._bar:
+            self.closed.append(self._aggregate())
+            self._sources.clear()
+        self._bar = start
+        self._sources[candle['time']] = candle
+
+    def extend(self, candles):
+        for candle in candles:
+            self.append(candle)
+
+    def _aggregate(self):
+        sources = list(self._sources.values())
+        return {
+            'time': self._bar,
+            'open': sources[0]['open'],
+            'high': max(c['high'] for c in sources),
+            'low': min(c['low'] for c in sources),
+            'close': sources[-1]['close'],
+            'volumefrom': sum(c['volumefrom'] for c in sources),
+            'volumeto': sum(c['volumeto'] for c in sources),
+        }
+
+    @property
+    def current(self):
+        """Bar still being aggregated, None if there is none"""
+        return self._aggregate() if self._sources else None
+
+    def candles(self):
+        """Closed bars followed by the current one"""
+        result = Candles(**self.closed.columns())
+        if self._sources:
+            result.append(self._aggregate())
+        return result
+
+
+def resample(candles, seconds, offset=0):
+    """Candles (dicts or `Candles`) aggregated into bars of `seconds`"""
+    resampler = Resampler(seconds, offset)
+    resampler.extend(candles)
+    return resampler.candles()
+
+
+def merge_exchanges(series):
+    """
+    Consolidate candles of the same pair from several exchanges: volumes are
+    summed, open and close prices weighted by volume, highs and lows being the
+    extreme ones
+    """
+    rows = collections.defaultdict(list)
+    for candles in series:
+        for candle in _candles(candles):
+            rows[candle['time']].append(candle)
+
+    result = Candles()
+    for t in sorted(rows):
+        candles = rows[t]
+        volume = sum(c['volumefrom'] for c in candles)
+
+        def weighted(field):
+            if volume:
+                return sum(c[field] * c['volumefrom'] for c in candles) / volume
+            return sum(c[field] for c in candles) / len(candles)
+
+        result.append({
+            'time': t,
+            'open': weighted('open'),
+            'high': max(c['high'] for c in candles),
+            'low': min(c['low'] for c in candles),
+            'close': weighted('close'),
+            'volumefrom': volume,
+            'volumeto': sum(c['volumeto'] for c in candles),
+        })
+    return result
+
+
+class SMA:
+    """Incremental simple moving average over `window` values"""
+
+    def __init__(self, window):
+        self.window = window
+        self._values = collections.deque()
+        self._sum = 0.0
+
+    def update(self, value):
+        self._values.append(value)
+        self._sum += value
+        if len(self._values) > self.window:
+            self._sum -= self._values.popleft()
+        return self._sum / self.window if len(self._values) == self.window else math.nan
+
+
+class EMA:
+    """Incremental exponential moving average, seeded with the first value"""
+
+    def __init__(self, span):
+        self.alpha = 2 / (span + 1)
+        self.value = None
+
+    def update(self, value):
+        self.value = value if self.value is None else self.value + self.alpha * (value - self.value)
+        return self.value
+
+
+class RollingStd:
+    """
+    Incremental sample standard deviation over `window` values, updated
+    with Welford's method, which unlike running sums of values and squares
+    keeps its precision for values far from zero
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self._values = collections.deque()
+        self._mean = 0.0
+        self._m2 = 0.0  # sum of squared differences from the mean
+
+    def update(self, value):
+        self._values.append(value)
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            mean = self._mean + (value - old) / self.window
+            self._m2 += (value - old) * (value - mean + old - self._mean)
+            self._mean = mean
+        else:
+            delta = value - self._mean
+            self._mean += delta / len(self._values)
+            self._m2 += delta * (value - self._mean)
+        n = len(self._values)
+        if n < self.window or n < 2:
+            return math.nan
+        return math.sqrt(max(0.0, self._m2 / (n - 1)))
+
+
+def _apply(indicator, values):
+    return array.array('d', (indicator.update(value) for value in values))
+
+
+def sma(values, window):
+    return _apply(SMA(window), values)
+
+
+def ema(values, span):
+    return _apply(EMA(span), values)
+
+
+def rolling_std(values, window):
+    return _apply(RollingStd(window), values)
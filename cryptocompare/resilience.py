@@ -0,0 +1,216 @@
+import collections
+import threading
+import time
+import urllib.parse
+
+from .ratelimit import backoff
+
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_STATUSES = frozenset([500, 502, 503, 504])
+DEFAULT_QUANTILE = 0.95
+DEFAULT_WINDOW = 100
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+
+
+class RetryPolicy:
+    """
+    Retries of failed requests, all API requests being idempotent GETs.
+    Responses with one of `statuses` and transport errors of one of the
+    `errors` types (connection errors and timeouts by default) are retried
+    up to `retries` times, after an exponential backoff delay.
+    """
+
+    def __init__(self, retries=DEFAULT_RETRIES, statuses=DEFAULT_RETRY_STATUSES, errors=(OSError, TimeoutError),
+                 base=0.25, cap=5.0):
+        self.retries = retries
+        self.statuses = frozenset(statuses)
+        self.errors = tuple(errors)
+        self.base = base
+        self.cap = cap
+
+    def retries_status(self, status, attempt):
+        return status in self.statuses and attempt < self.retries
+
+    def retries_error(self, error, attempt):
+        return isinstance(error, self.errors) and attempt < self.retries
+
+    def delay(self, attempt):
+        return backoff(attempt, self.base, self.cap)
+
+
+class Hedge:
+    """
+    Hedged requests: when a response takes longer than the `quantile` of the
+    latencies of the last `window` requests of its endpoint, a duplicate
+    request is sent and the first response is used. Endpoints are hedged once
+    `min_samples` latencies are known. With a rate limiter, duplicates are
+    only sent when its budgets have a token left. `hedged` and `won` count
+    by endpoint duplicates sent and duplicates answering first.
+    """
+
+    def __init__(self, quantile=DEFAULT_QUANTILE, window=DEFAULT_WINDOW, min_samples=DEFAULT_MIN_SAMPLES,
+                 min_delay=0.0):
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.hedged = collections.Counter()
+        self.won = collections.Counter()
+        self._latencies = collections.defaultdict(lambda: collections.deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint, seconds):
+        with self._lock:
+            self._latencies[endpoint].append(seconds)
+
+    def delay(self, endpoint):
+        """Seconds to wait for a response before hedging, None if not hedged yet"""
+        with self._lock:
+            latencies = sorted(self._latencies[endpoint])
+        if len(latencies) < self.min_samples:
+            return None
+        return max(self.min_delay, latencies[min(len(latencies) - 1, int(self.quantile * len(latencies)))])
+
+    def get(self, executor, transport, endpoint, url, timeout, rate_limiter=None):
+        """Response of a blocking transport, hedged on `executor` threads"""
+        import concurrent.futures
+
+        delay = self.delay(endpoint)
+        start = time.perf_counter()
+        if delay is None:
+            response = transport.get(url, timeout=timeout)
+            self.observe(endpoint, time.perf_counter() - start)
+            return response
+
+        first = executor.submit(transport.get, url, timeout)
+        if concurrent.futures.wait((first,), timeout=delay).done or not self._budgeted(rate_limiter):
+            response = first.result()
+            self.observe(endpoint, time.perf_counter() - start)
+            return response
+
+        with self._lock:
+            self.hedged[endpoint] += 1
+        second = executor.submit(transport.get, url, timeout)
+        error = None
+        for future in concurrent.futures.as_completed((first, second)):
+            try:
+                response = future.result()
+            except Exception as e:
+                error = e
+                continue
+            self._finish(endpoint, start, future is second)
+            return response
+        raise error
+
+    async def get_async(self, transport, endpoint, url, timeout, rate_limiter=None):
+        """Response of an asynchronous transport, hedged with a concurrent task"""
+        import asyncio
+
+        delay = self.delay(endpoint)
+        start = time.perf_counter()
+        if delay is None:
+            response = await transport.get(url, timeout=timeout)
+            self.observe(endpoint, time.perf_counter() - start)
+            return response
+
+        first = asyncio.ensure_future(transport.get(url, timeout=timeout))
+        pending = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done and not self._budgeted(rate_limiter):
+                done, pending = await asyncio.wait(pending)
+            if done:
+                self.observe(endpoint, time.perf_counter() - start)
+                return first.result()
+
+            with self._lock:
+                self.hedged[endpoint] += 1
+            second = asyncio.ensure_future(transport.get(url, timeout=timeout))
+            pending.add(second)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    self._finish(endpoint, start, task is second)
+                    return task.result()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _budgeted(rate_limiter):
+        """Whether a duplicate request fits in the budget of the rate limiter"""
+        return rate_limiter is None or rate_limiter.try_acquire()
+
+    def _finish(self, endpoint, start, won):
+        self.observe(endpoint, time.perf_counter() - start)
+        if won:
+            with self._lock:
+                self.won[endpoint] += 1
+
+
+class CircuitBreaker:
+    """
+    Per host circuit breaker. After `failure_threshold` consecutive failures
+    (transport errors or 5xx responses) requests to a host are refused for
+    `reset_timeout` seconds, after which one trial request is let through,
+    closing the circuit again if it succeeds.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = collections.Counter()
+        self._opened = {}  # host -> monotonic time the circuit opened
+        self._trials = set()  # hosts with a trial request in flight
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(url):
+        return urllib.parse.urlsplit(url).netloc
+
+    def state(self, host):
+        with self._lock:
+            if host not in self._opened:
+                return self.CLOSED
+            if time.monotonic() - self._opened[host] < self.reset_timeout:
+                return self.OPEN
+            return self.HALF_OPEN
+
+    def allow(self, host):
+        """Whether a request to host may be sent"""
+        with self._lock:
+            opened = self._opened.get(host)
+            if opened is None:
+                return True
+            if time.monotonic() - opened < self.reset_timeout or host in self._trials:
+                return False
+            self._trials.add(host)
+            return True
+
+    def success(self, host):
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened.pop(host, None)
+            self._trials.discard(host)
+
+    def failure(self, host):
+        with self._lock:
+            self._failures[host] += 1
+            if host in self._trials or self._failures[host] >= self.failure_threshold:
+                self._opened[host] = time.monotonic()
+            self._trials.discard(host)
+
+    def abandon(self, host):
+        """Release the trial of a request ending without an outcome, such as a cancelled one"""
+        with self._lock:
+            self._trials.discard(host)
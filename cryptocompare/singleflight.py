@@ -0,0 +1,101 @@
+import threading
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls sharing a key into one: while a call is in
+    flight, other callers with the same key wait for it and receive its
+    result or exception. `calls` and `collapsed` count calls made and calls
+    which waited on another one.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.collapsed = 0
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def __len__(self):
+        """Number of calls in flight"""
+        return len(self._flights)
+
+    def do(self, key, function):
+        """
+        (leader, result) of `function()`, leader being False when the result
+        was shared by a concurrent call
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._flights.get(key)
+            leader = call is None
+            if leader:
+                call = self._flights[key] = _Call()
+            else:
+                self.collapsed += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return False, call.result
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            call.done.set()
+        return True, call.result
+
+
+class AsyncSingleFlight(SingleFlight):
+    """`SingleFlight` collapsing coroutines awaited in the same event loop"""
+
+    async def do(self, key, function):
+        """
+        (leader, result) of `await function()`, leader being False when the
+        result was shared by a concurrent call
+        """
+        import asyncio
+
+        self.calls += 1
+        future = self._flights.get(key)
+        while future is not None:
+            self.collapsed += 1
+            try:
+                # a cancelled waiter must not cancel the shared call
+                return False, await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            # the leader was cancelled, one of its waiters takes over the call
+            future = self._flights.get(key)
+
+        future = self._flights[key] = asyncio.get_event_loop().create_future()
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # mark retrieved, there might be no waiter
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._flights[key]
+        return True, result
@@ -0,0 +1,143 @@
+import sqlite3
+import threading
+import time
+
+from .api import Period
+from .columnar import FIELDS, Candles
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    fsym TEXT NOT NULL,
+    tsym TEXT NOT NULL,
+    exchange TEXT NOT NULL,
+    period TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    open REAL, high REAL, low REAL, close REAL, volumefrom REAL, volumeto REAL,
+    PRIMARY KEY (fsym, tsym, exchange, period, time)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS synced (
+    fsym TEXT NOT NULL,
+    tsym TEXT NOT NULL,
+    exchange TEXT NOT NULL,
+    period TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    PRIMARY KEY (fsym, tsym, exchange, period)
+) WITHOUT ROWID
+"""
+
+KEY = 'fsym = ? AND tsym = ? AND exchange = ? AND period = ?'
+
+
+class CandleStore:
+    """
+    SQLite backed store of historical data, keyed by pair, exchange and
+    period. `sync` only fetches what is missing locally.
+    """
+
+    def __init__(self, path=':memory:'):
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._connection.close()
+
+    @staticmethod
+    def _key(fsym, tsym, period, exchange):
+        return fsym.upper(), tsym.upper(), exchange or '', period.value
+
+    def _query(self, sql, args):
+        with self._lock:
+            return self._connection.execute(sql, args).fetchall()
+
+    def bounds(self, fsym, tsym, period=Period.DAY, exchange=None):
+        """Times of the first and last stored candles, or None if there are none"""
+        sql = 'SELECT MIN(time), MAX(time) FROM candles WHERE ' + KEY
+        first, last = self._query(sql, self._key(fsym, tsym, period, exchange))[0]
+        return None if first is None else (first, last)
+
+    def synced(self, fsym, tsym, period=Period.DAY, exchange=None):
+        """Earliest start time synced so far, or None if never synced"""
+        rows = self._query('SELECT start FROM synced WHERE ' + KEY, self._key(fsym, tsym, period, exchange))
+        return rows[0][0] if rows else None
+
+    def gaps(self, fsym, tsym, period=Period.DAY, exchange=None):
+        """(start, end) ranges of candles missing between stored ones"""
+        # found in Python rather than with LAG, as window functions need SQLite 3.25
+        sql = 'SELECT time FROM candles WHERE ' + KEY + ' ORDER BY time'
+        rows = self._query(sql, self._key(fsym, tsym, period, exchange))
+        step = period.seconds
+        return [
+            (previous + step, current - step)
+            for (previous,), (current,) in zip(rows, rows[1:]) if current - previous > step
+        ]
+
+    def write(self, fsym, tsym, candles, period=Period.DAY, exchange=None):
+        """Store candles, replacing the stored ones with the same time"""
+        key = self._key(fsym, tsym, period, exchange)
+        rows = [key + tuple(candle[field] for field in FIELDS) for candle in candles]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows
+            )
+
+    def read(self, fsym, tsym, period=Period.DAY, exchange=None, start=None, end=None, columnar=False):
+        """
+        Stored candles between `start` and `end`, in time order, as candle dicts
+        or as `Candles` columns if `columnar` is set
+        """
+        sql = 'SELECT {} FROM candles WHERE {} AND time >= ? AND time <= ? ORDER BY time'.format(', '.join(FIELDS), KEY)
+        args = self._key(fsym, tsym, period, exchange) + (
+            start if start is not None else -2 ** 63,
+            end if end is not None else 2 ** 63 - 1
+        )
+        rows = self._query(sql, args)
+
+        if columnar:
+            return Candles(*zip(*rows)) if rows else Candles()
+        return [dict(zip(FIELDS, row)) for row in rows]
+
+    def sync(self, client, fsym, tsym, period=Period.DAY, exchange=None, start=0, end=None):
+        """
+        Fetch with `client` the candles between `start` and `end` (defaulting to
+        now) which are not stored yet, along with the newest stored one as it
+        may not have been closed. Return the number of fetched candles.
+        """
+        end = end if end is not None else int(time.time())
+        bounds = self.bounds(fsym, tsym, period, exchange)
+        synced = self.synced(fsym, tsym, period, exchange)
+
+        if bounds is None:
+            ranges = [(start, end)]
+        else:
+            first, last = bounds
+            ranges = list(self.gaps(fsym, tsym, period, exchange))
+            # history before the first candle was already requested from the synced start on
+            covered = first if synced is None else min(first, synced)
+            if start < covered:
+                ranges.append((start, covered - period.seconds))
+            ranges.append((max(start, last), end))
+
+        fetched = 0
+        for range_start, range_end in ranges:
+            if range_start > range_end:
+                continue
+            candles = client.get_historical_range(
+                fsym, tsym, period, range_start, range_end, exchange=exchange, columnar=True
+            )
+            self.write(fsym, tsym, candles, period, exchange)
+            fetched += len(candles)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO synced VALUES (?, ?, ?, ?, ?)',
+                self._key(fsym, tsym, period, exchange) + (start if synced is None else min(start, synced),)
+            )
+        return fetched
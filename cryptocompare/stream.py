@@ -0,0 +1,120 @@
+import asyncio
+import collections
+import threading
+import time
+
+DEFAULT_INTERVAL = 1.0
+
+Update = collections.namedtuple('Update', ['fsym', 'tsym', 'changes'])
+
+
+class PollingSource:
+    """
+    Source of RAW full data snapshots, polling `get_symbols_full_data` every
+    `interval` seconds. Iterable with a blocking client, asynchronously
+    iterable with an `AsyncCryptoCompare` one.
+    """
+
+    def __init__(self, client, fsyms, tsyms, exchange=None, interval=DEFAULT_INTERVAL):
+        self.client = client
+        self.fsyms = fsyms
+        self.tsyms = tsyms
+        self.exchange = exchange
+        self.interval = interval
+
+    def __iter__(self):
+        while True:
+            start = time.monotonic()
+            yield self.client.get_symbols_full_data(self.fsyms, self.tsyms, self.exchange).get('RAW', {})
+            time.sleep(max(0.0, self.interval - (time.monotonic() - start)))
+
+    async def __aiter__(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            start = loop.time()
+            result = await self.client.get_symbols_full_data(self.fsyms, self.tsyms, self.exchange)
+            yield result.get('RAW', {})
+            await asyncio.sleep(max(0.0, self.interval - (loop.time() - start)))
+
+
+class PriceSubscription:
+    """
+    Stream of per pair updates holding only the fields which changed since
+    the previous ones, read from a source of RAW data, i.e. an iterable or
+    asynchronous iterable of possibly partial {fsym: {tsym: {field: value}}}
+    dicts. The latest known state of pairs is kept in `snapshot`.
+
+    The source is only read as updates are consumed. When `buffered` is set,
+    a blocking source is read ahead on a background thread instead, updates
+    of a pair not consumed yet being merged together so that memory use is
+    bounded by the number of pairs.
+    """
+
+    def __init__(self, source, buffered=False):
+        self.source = source
+        self.buffered = buffered
+        self.snapshot = {}
+
+        self._pending = collections.OrderedDict()
+        self._condition = threading.Condition()
+        self._error = None
+        self._done = False
+        self._closed = False
+
+    def _diff(self, raw):
+        for fsym, tsyms in raw.items():
+            for tsym, fields in tsyms.items():
+                state = self.snapshot.setdefault((fsym, tsym), {})
+                changes = {name: value for name, value in fields.items() if state.get(name, state) != value}
+                if changes:
+                    state.update(changes)
+                    yield Update(fsym, tsym, changes)
+
+    def __iter__(self):
+        if not self.buffered:
+            return (update for raw in self.source for update in self._diff(raw))
+
+        threading.Thread(target=self._produce, daemon=True).start()
+        return self._consume()
+
+    def _consume(self):
+        try:
+            while True:
+                with self._condition:
+                    while not self._pending and not self._done:
+                        self._condition.wait()
+                    if self._pending:
+                        (fsym, tsym), changes = self._pending.popitem(last=False)
+                    elif self._error is not None:
+                        raise self._error
+                    else:
+                        return
+                yield Update(fsym, tsym, changes)
+        finally:
+            self.close()
+
+    def _produce(self):
+        try:
+            for raw in self.source:
+                with self._condition:
+                    if self._closed:
+                        return
+                    for update in self._diff(raw):
+                        self._pending.setdefault((update.fsym, update.tsym), {}).update(update.changes)
+                    self._condition.notify()
+        except Exception as e:
+            self._error = e
+        finally:
+            with self._condition:
+                self._done = True
+                self._condition.notify()
+
+    async def __aiter__(self):
+        async for raw in self.source:
+            for update in self._diff(raw):
+                yield update
+
+    def close(self):
+        """Stop reading the source in buffered mode"""
+        with self._condition:
+            self._closed = True
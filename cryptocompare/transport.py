@@ -0,0 +1,87 @@
+import collections
+import json
+import urllib.parse
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 10
+
+Response = collections.namedtuple('Response', ['status', 'content', 'elapsed'])
+
+
+class Transport:
+    """
+    Performs HTTP GET requests on behalf of a client. Implementations return a
+    `Response` holding the status code, the raw body bytes and the time
+    elapsed until the response headers were received.
+    """
+
+    def get(self, url, timeout=None):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class RequestsTransport(Transport):
+    """
+    Transport backed by a single `requests.Session`, so that connections to
+    CryptoCompare hosts are kept alive and reused across requests.
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, session=None):
+        # imported on first use, as it is slow to import
+        import requests
+        import requests.adapters
+
+        self.timeout = timeout
+        self.session = session if session is not None else requests.Session()
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, url, timeout=None):
+        response = self.session.get(url, timeout=timeout or self.timeout)
+        return Response(response.status_code, response.content, response.elapsed.total_seconds())
+
+    def close(self):
+        self.session.close()
+
+
+class StubTransport(Transport):
+    """
+    Offline transport answering requests with canned payloads, for tests.
+
+    Routes map an URL path (e.g. '/data/pricemulti') to a payload, which may be
+    raw bytes, any JSON serializable object, a `Response`, or a callable taking
+    the query parameters as a dict and returning one of those. Every requested
+    URL is recorded in `requests`.
+    """
+
+    def __init__(self, routes=None):
+        self.routes = dict(routes or {})
+        self.requests = []
+
+    def add(self, path, payload):
+        self.routes[path] = payload
+
+    def get(self, url, timeout=None):
+        self.requests.append(url)
+        parts = urllib.parse.urlsplit(url)
+
+        try:
+            payload = self.routes[parts.path]
+        except KeyError:
+            return Response(404, b'', 0.0)
+
+        if callable(payload):
+            payload = payload(dict(urllib.parse.parse_qsl(parts.query)))
+        if isinstance(payload, Response):
+            return payload
+        if not isinstance(payload, bytes):
+            payload = json.dumps(payload).encode()
+        return Response(200, payload, 0.0)
@@ -0,0 +1,197 @@
+import collections
+import concurrent.futures
+import heapq
+import itertools
+import threading
+
+from .batch import MAX_FSYMS_LENGTH, MAX_TSYMS_LENGTH, chunk_symbols
+
+DEFAULT_TOP = 10
+DEFAULT_WORKERS = 8
+
+# volume is the 24 hours volume in tsym, comparable across venues
+Venue = collections.namedtuple('Venue', ['exchange', 'price', 'volume', 'last_update'])
+
+
+class PairVenues:
+    """
+    Venues of a pair ordered by price and by volume. Heaps are updated
+    incrementally, outdated entries being discarded as soon as they reach
+    the top of a heap, so that best venues are read in constant time.
+    """
+
+    __slots__ = ('venues', '_heaps', '_entries', '_counter')
+
+    def __init__(self):
+        self.venues = {}  # exchange -> Venue
+        # (sort key, entry id, exchange) heaps: lowest price, highest price, highest volume
+        self._heaps = ([], [], [])
+        self._entries = {}  # exchange -> id of its current heaps entries
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self.venues)
+
+    def _clean(self):
+        for heap in self._heaps:
+            while heap and self._entries.get(heap[0][2]) != heap[0][1]:
+                heapq.heappop(heap)
+            # bound the outdated entries left in the middle of heaps
+            if len(heap) > 2 * len(self.venues) + 8:
+                heap[:] = [entry for entry in heap if self._entries.get(entry[2]) == entry[1]]
+                heapq.heapify(heap)
+
+    def update(self, venue):
+        """Add or replace the venue of an exchange, returning whether it changed"""
+        if self.venues.get(venue.exchange) == venue:
+            return False
+
+        entry = next(self._counter)
+        self.venues[venue.exchange] = venue
+        self._entries[venue.exchange] = entry
+        cheapest, dearest, deepest = self._heaps
+        heapq.heappush(cheapest, (venue.price, entry, venue.exchange))
+        heapq.heappush(dearest, (-venue.price, entry, venue.exchange))
+        heapq.heappush(deepest, (-(venue.volume or 0.0), entry, venue.exchange))
+        self._clean()
+        return True
+
+    def remove(self, exchange):
+        if self.venues.pop(exchange, None) is not None:
+            del self._entries[exchange]
+            self._clean()
+
+    def _top(self, heap):
+        return self.venues.get(heap[0][2]) if heap else None
+
+    @property
+    def best_ask(self):
+        """Venue with the lowest price, where buying is cheapest"""
+        return self._top(self._heaps[0])
+
+    @property
+    def best_bid(self):
+        """Venue with the highest price, where selling pays most"""
+        return self._top(self._heaps[1])
+
+    @property
+    def best_venue(self):
+        """Venue with the highest volume"""
+        return self._top(self._heaps[2])
+
+    @property
+    def spread(self):
+        """Difference between the highest and lowest venue prices"""
+        if not self.venues:
+            return None
+        return self.best_bid.price - self.best_ask.price
+
+
+class VenueBook:
+    """
+    Consolidated view of the venues trading a set of (fsym, tsym) pairs.
+    Venues of each pair are the `top` exchanges by volume reported by
+    `get_top_exchanges`, unless a fixed list of `exchanges` is given.
+    `refresh` requests full data of every exchange concurrently and updates
+    venues which changed, best venues and spreads being read in constant time.
+
+    Prices are the last trade prices of venues, not order book quotes.
+    """
+
+    def __init__(self, client, pairs, exchanges=None, top=DEFAULT_TOP, max_workers=DEFAULT_WORKERS):
+        self.client = client
+        self.pairs = [(fsym.upper(), tsym.upper()) for fsym, tsym in pairs]
+        self.exchanges = exchanges
+        self.top = top
+        self.max_workers = max_workers
+        self.errors = {}  # exchange -> error of its last refresh
+        self._venues = {pair: PairVenues() for pair in self.pairs}
+        self._listings = None  # exchange -> set of pairs
+        self._lock = threading.Lock()
+
+    def __getitem__(self, pair):
+        fsym, tsym = pair
+        return self._venues[fsym.upper(), tsym.upper()]
+
+    def discover(self):
+        """Look up the exchanges trading each pair"""
+        listings = collections.defaultdict(set)
+        if self.exchanges is not None:
+            for exchange in self.exchanges:
+                listings[exchange].update(self.pairs)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+                tops = executor.map(
+                    lambda pair: self.client.get_top_exchanges(pair[0], pair[1], limit=self.top, typed=True),
+                    self.pairs
+                )
+                for pair, top in zip(self.pairs, tops):
+                    for volume in top:
+                        listings[volume.exchange].add(pair)
+        self._listings = dict(listings)
+
+    def _fetch(self, exchange, pairs):
+        """Tickers of pairs on an exchange"""
+        fsyms = sorted({fsym for fsym, _ in pairs})
+        tsyms = sorted({tsym for _, tsym in pairs})
+        tickers = []
+        for fsym_chunk in chunk_symbols(fsyms, MAX_FSYMS_LENGTH):
+            for tsym_chunk in chunk_symbols(tsyms, MAX_TSYMS_LENGTH):
+                tickers.extend(self.client.get_symbols_full_data(
+                    fsym_chunk, tsym_chunk, exchange=exchange, typed=True, display=False
+                ))
+        return [ticker for ticker in tickers if (ticker.fsym, ticker.tsym) in pairs]
+
+    def refresh(self):
+        """
+        Request venues of every pair, returning the set of pairs whose venues
+        changed. Venues of exchanges whose request failed are kept as is, the
+        error being recorded in `errors`.
+        """
+        if self._listings is None:
+            self.discover()
+
+        changed = set()
+        with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch, exchange, pairs): exchange
+                for exchange, pairs in self._listings.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                exchange = futures[future]
+                try:
+                    tickers = future.result()
+                except Exception as e:
+                    # API errors as well as transport ones, such as timeouts
+                    self.errors[exchange] = e
+                    continue
+                self.errors.pop(exchange, None)
+
+                with self._lock:
+                    listed = set()
+                    for ticker in tickers:
+                        if ticker.price is None:
+                            continue
+                        pair = ticker.fsym, ticker.tsym
+                        listed.add(pair)
+                        venue = Venue(exchange, ticker.price, ticker.volume_24h_to, ticker.last_update)
+                        if self._venues[pair].update(venue):
+                            changed.add(pair)
+                    # pairs no longer traded on the exchange
+                    for pair in self._listings[exchange] - listed:
+                        if exchange in self._venues[pair].venues:
+                            self._venues[pair].remove(exchange)
+                            changed.add(pair)
+        return changed
+
+    def best_bid(self, fsym, tsym):
+        return self[fsym, tsym].best_bid
+
+    def best_ask(self, fsym, tsym):
+        return self[fsym, tsym].best_ask
+
+    def best_venue(self, fsym, tsym):
+        return self[fsym, tsym].best_venue
+
+    def spread(self, fsym, tsym):
+        return self[fsym, tsym].spread
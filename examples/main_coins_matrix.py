@@ -1,9 +1,10 @@
-from cryptocompare import CryptoCompare
+from cryptocompare import CryptoCompare, get_price_matrix
 
 COINS = ['BTC', 'LTC', 'ETH', 'BCH', 'USD', 'EUR']
 
 cc = CryptoCompare()
-prices = cc.get_price(COINS, COINS)
+# only prices in USD are requested, other rates being derived from those
+prices = get_price_matrix(cc, COINS, pivots=['USD'])
 
 print(end='\t')
 for coin in COINS:  # top header
@@ -12,4 +13,4 @@ for coin in COINS:  # top header
 for a in COINS:
     print('\n', a, end='\t')  # left header
     for b in COINS:
-        print('{:7.2f}'.format(prices[a][b]), end='\t')
+        print('{:7.2f}'.format(prices[a, b]), end='\t')
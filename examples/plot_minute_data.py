@@ -1,29 +1,19 @@
 import datetime
+import time
 import matplotlib.pyplot as plt
 
-from cryptocompare import CryptoCompare, CryptoCompareApiError, Period
+from cryptocompare import CryptoCompare, Period
 
 BASE = 'ETH'
 QUOTE = 'USD'
 
 cc = CryptoCompare()
 
-# prices need to be read in a loop because of cryptocompare's historical prices
-# points limit
-points = []
-ts = None
-while True:
-    try:
-        data = cc.get_historical(BASE, QUOTE, period=Period.MINUTE, limit=100000, to_ts=ts)
-    except CryptoCompareApiError:
-        break
-
-    # first price is the oldest one, remove one to not include that point again
-    ts = data[0]['time']
-    print("Got historical data from {} ({} points)".format(ts, len(data)))
-
-    data.extend(points)
-    points = data
+# CryptoCompare only provides minute data for the last 7 days, fetched in
+# concurrent pages
+end = int(time.time())
+points = cc.get_historical_range(BASE, QUOTE, period=Period.MINUTE, start=end - 7 * 24 * 3600, end=end)
+print("Got {} points".format(len(points)))
 
 closes = [p['close'] for p in points]
 datetimes = [datetime.datetime.fromtimestamp(p['time']) for p in points]
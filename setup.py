@@ -1,4 +1,4 @@
-from distutils.core import setup
+from setuptools import setup
 
 setup(
     name='cryptocompare',
@@ -6,5 +6,6 @@ setup(
     packages=['cryptocompare'],
     license='MIT',
     long_description=open('README.rst').read(),
-    install_requires=['requests >= 2.0.0']
+    install_requires=['requests >= 2.0.0'],
+    python_requires='>=3.6',
 )
@@ -0,0 +1,23 @@
+import json
+
+from cryptocompare import Response
+
+
+def histo_route(step, first=0):
+    """
+    Stub route answering historical data like CryptoCompare does, `limit + 1`
+    candles up to `toTs`, none before `first`
+    """
+    def route(params):
+        to_ts = int(params.get('toTs', 10 ** 9))
+        to_ts -= to_ts % step
+        limit = int(params.get('limit', 30))
+        data = [
+            {
+                'time': t, 'open': t + 0.5, 'high': t + 1.0, 'low': float(t), 'close': t + 0.25,
+                'volumefrom': 1.0, 'volumeto': float(t),
+            }
+            for t in range(to_ts - limit * step, to_ts + 1, step) if t >= first
+        ]
+        return Response(200, json.dumps({'Response': 'Success', 'Type': 100, 'Data': data}).encode(), 0.0)
+    return route
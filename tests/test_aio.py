@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from cryptocompare import (
+    AsyncCryptoCompare, CryptoCompareApiError, ExecutorTransport, Period, Response, StubTransport
+)
+from cryptocompare.aio import gather
+
+from .helpers import histo_route
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestGather(unittest.TestCase):
+    def test_results_order(self):
+        """Results should be returned in the order of given awaitables"""
+        async def value(x):
+            await asyncio.sleep(0.01 * (3 - x))
+            return x
+
+        self.assertEqual(run(gather(*(value(x) for x in range(3)), limit=2)), [0, 1, 2])
+
+    def test_limit(self):
+        """No more than limit awaitables should be running at once"""
+        running = []
+        peak = []
+
+        async def task():
+            running.append(None)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        run(gather(*(task() for _ in range(10)), limit=3))
+        self.assertEqual(max(peak), 3)
+
+
+class TestAsyncCryptoCompare(unittest.TestCase):
+    def test_get_price(self):
+        """Async methods should mirror their blocking counterparts"""
+        transport = StubTransport({'/data/pricemulti': {'BTC': {'USD': 1.0}}})
+
+        async def main():
+            async with AsyncCryptoCompare(transport=ExecutorTransport(transport)) as cc:
+                return await cc.get_price('BTC', 'USD')
+
+        self.assertEqual(run(main()), {'BTC': {'USD': 1.0}})
+
+    def test_api_error(self):
+        """Error responses should raise an API error"""
+        transport = StubTransport({'/data/top/exchanges': {'Response': 'Error'}})
+
+        async def main():
+            async with AsyncCryptoCompare(transport=ExecutorTransport(transport)) as cc:
+                await cc.get_top_exchanges('BTC', 'USD')
+
+        self.assertRaises(CryptoCompareApiError, run, main())
+
+    def test_concurrent_fan_out(self):
+        """Requests should be issued concurrently, up to max concurrency"""
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def price(params):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return Response(200, '{{"{}": {{"USD": 1.0}}}}'.format(params['fsyms']).encode(), 0.0)
+
+        transport = ExecutorTransport(StubTransport({'/data/pricemulti': price}), max_workers=10)
+        fsyms = ['C{}'.format(i) for i in range(20)]
+
+        async def main():
+            async with AsyncCryptoCompare(transport=transport, max_concurrency=4) as cc:
+                return await cc.gather(*(cc.get_price(fsym, 'USD') for fsym in fsyms))
+
+        results = run(main())
+        self.assertEqual([list(r) for r in results], [[fsym] for fsym in fsyms])
+        self.assertEqual(peak[0], 4)
+
+    def test_historical_range(self):
+        """Historical range should be fetched concurrently and merged"""
+        transport = ExecutorTransport(StubTransport({'/data/histohour': histo_route(3600)}))
+
+        async def main():
+            async with AsyncCryptoCompare(transport=transport) as cc:
+                return await cc.get_historical_range('BTC', 'USD', Period.HOUR, start=0, end=3600 * 5000)
+
+        result = run(main())
+        self.assertEqual([e['time'] for e in result], list(range(0, 3600 * 5000 + 1, 3600)))
+
+    def test_prices_at(self):
+        """Bulk prices should be fetched from candles, falling back to single lookups"""
+        now = int(time.time())
+        transport = ExecutorTransport(StubTransport({
+            '/data/histominute': histo_route(60),
+            '/data/histohour': histo_route(3600, first=now - 60 * 86400),
+            '/data/pricehistorical': {'BTC': {'USD': 42.0}},
+        }))
+
+        async def main():
+            async with AsyncCryptoCompare(transport=transport) as cc:
+                return await cc.get_prices_at('BTC', 'USD', [now - 60, now - 90 * 86400])
+
+        result = run(main())
+        self.assertEqual(result[now - 60], {'USD': now - 60 - (now - 60) % 60 + 0.25})
+        self.assertEqual(result[now - 90 * 86400], {'USD': 42.0})
@@ -3,7 +3,9 @@ import numbers
 import time
 import unittest
 
-from cryptocompare import CryptoCompare, CryptoCompareApiError, ERROR_TYPE_THRESHOLD, Period
+from cryptocompare import CryptoCompare, CryptoCompareApiError, ERROR_TYPE_THRESHOLD, Period, StubTransport
+
+from .helpers import histo_route
 
 BTC_ID = 1182
 
@@ -249,6 +251,75 @@ class TestGetHistorical(unittest.TestCase):
         self.assertIsInstance(result[0]['close'], numbers.Real)
 
 
+class TestGetHistoricalRange(unittest.TestCase):
+    def setUp(self):
+        self.transport = StubTransport({
+            '/data/histominute': histo_route(60),
+            '/data/histoday': histo_route(86400),
+        })
+        self.cc = CryptoCompare(transport=self.transport)
+
+    def test_range(self):
+        """Every point of the range should be returned once, in time order"""
+        result = self.cc.get_historical_range('BTC', 'USD', Period.MINUTE, start=60 * 1000, end=60 * 9000)
+        self.assertEqual([e['time'] for e in result], list(range(60 * 1000, 60 * 9000 + 1, 60)))
+
+    def test_pages(self):
+        """Range should be fetched in as few pages as possible"""
+        self.cc.get_historical_range('BTC', 'USD', Period.MINUTE, start=60 * 1000, end=60 * 9000)
+        self.assertEqual(len(self.transport.requests), 4)
+
+    def test_unaligned_bounds(self):
+        """Points outside of the range should not be returned"""
+        result = self.cc.get_historical_range('BTC', 'USD', Period.DAY, start=86400 * 3 + 1, end=86400 * 10 - 1)
+        self.assertEqual([e['time'] for e in result], [86400 * i for i in range(4, 10)])
+
+    def test_datetimes(self):
+        """Range bounds may be provided as datetimes"""
+        result = self.cc.get_historical_range(
+            'BTC', 'USD', Period.DAY,
+            start=datetime.datetime(2018, 1, 1),
+            end=datetime.datetime(2018, 1, 31)
+        )
+        self.assertEqual(len(result), 31)
+
+
+class TestGetPricesAt(unittest.TestCase):
+    def setUp(self):
+        self.now = int(time.time())
+        self.transport = StubTransport({
+            '/data/histominute': histo_route(60),
+            '/data/histohour': histo_route(3600, first=self.now - 60 * 86400),
+            '/data/pricehistorical': {'BTC': {'USD': 42.0}},
+        })
+        self.cc = CryptoCompare(transport=self.transport)
+
+    def test_prices(self):
+        """Prices should be read from the candles holding timestamps"""
+        recent = self.now - 3600
+        old = self.now - 30 * 86400
+        result = self.cc.get_prices_at('BTC', 'USD', [recent, old, recent])
+        self.assertEqual(result, {
+            recent: {'USD': recent - recent % 60 + 0.25},
+            old: {'USD': old - old % 3600 + 0.25},
+        })
+        self.assertEqual(len(self.transport.requests), 2)
+
+    def test_fallback(self):
+        """Timestamps not covered by candles should be requested alone"""
+        ts = self.now - 90 * 86400
+        result = self.cc.get_prices_at('BTC', ['USD'], [ts, self.now - 30 * 86400])
+        self.assertEqual(result[ts], {'USD': 42.0})
+        self.assertEqual(len(self.transport.requests), 2)
+        self.assertIn('pricehistorical', self.transport.requests[-1])
+
+    def test_clusters(self):
+        """Distant timestamps should not be fetched as a single range"""
+        timestamps = [self.now - 10 * 86400, self.now - 100 * 86400, self.now - 100 * 86400 - 3600]
+        self.cc.get_prices_at('BTC', 'USD', timestamps)
+        self.assertEqual(len([url for url in self.transport.requests if 'histohour' in url]), 2)
+
+
 class TestGetHistoricalForTimestamp(unittest.TestCase):
     def test_today(self):
         """Get historical data for today should work"""
@@ -0,0 +1,79 @@
+import concurrent.futures
+import unittest
+
+from cryptocompare import CryptoCompare, CryptoCompareApiError, PriceBatcher, StubTransport
+from cryptocompare.batch import chunk_symbols
+
+
+def pricemulti(params):
+    return {
+        fsym: {tsym: float(len(fsym + tsym)) for tsym in params['tsyms'].split(',')}
+        for fsym in params['fsyms'].split(',') if fsym != 'UNKNOWN'
+    }
+
+
+class TestChunkSymbols(unittest.TestCase):
+    def test_chunks(self):
+        """Joined chunks should fit in maximum length"""
+        symbols = ['S{}'.format(i) for i in range(100)]
+        chunks = list(chunk_symbols(symbols, 30))
+        self.assertEqual(sum(chunks, []), symbols)
+        for chunk in chunks:
+            self.assertLessEqual(len(','.join(chunk)), 30)
+
+
+class TestPriceBatcher(unittest.TestCase):
+    def setUp(self):
+        self.transport = StubTransport({
+            '/data/pricemulti': pricemulti,
+            '/data/pricemultifull': lambda params: {'RAW': pricemulti(params)},
+        })
+        self.cc = CryptoCompare(transport=self.transport)
+
+    def test_coalesce(self):
+        """Concurrent lookups should be merged in a single request"""
+        batcher = PriceBatcher(self.cc, window=0.05)
+        pairs = [(fsym, tsym) for fsym in ('BTC', 'ETH', 'LTC') for tsym in ('USD', 'EUR')]
+
+        with concurrent.futures.ThreadPoolExecutor(len(pairs)) as executor:
+            results = list(executor.map(lambda pair: batcher.get_price(*pair), pairs))
+
+        self.assertEqual(results, [float(len(f + t)) for f, t in pairs])
+        self.assertEqual(len(self.transport.requests), 1)
+
+    def test_chunks(self):
+        """Lookups should be split over symbols length limits"""
+        with PriceBatcher(self.cc, window=10) as batcher:
+            futures = [batcher.submit('COIN{}'.format(i), 'USD') for i in range(100)]
+        self.assertEqual([f.result() for f in futures], [float(len('COIN{}USD'.format(i))) for i in range(100)])
+        self.assertEqual(len(self.transport.requests), 3)
+
+    def test_sparse_chunks(self):
+        """Symbols chunks without any lookup should not be requested"""
+        with PriceBatcher(self.cc, window=10) as batcher:
+            futures = [batcher.submit('COIN{}'.format(i), 'USD') for i in range(100)]
+            futures += [batcher.submit('AAA', 'CUR{}'.format(i)) for i in range(40)]
+        self.assertEqual(futures[-1].result(), float(len('AAACUR39')))
+        self.assertTrue(all(f.done() for f in futures))
+        self.assertEqual(len(self.transport.requests), 5)
+
+    def test_exchanges(self):
+        """Lookups on different exchanges should be requested separately"""
+        with PriceBatcher(self.cc, window=10) as batcher:
+            batcher.submit('BTC', 'USD', exchange='Kraken')
+            batcher.submit('BTC', 'USD')
+        self.assertEqual(len(self.transport.requests), 2)
+
+    def test_missing_pair(self):
+        """Lookups of pairs missing from response should fail alone"""
+        with PriceBatcher(self.cc, window=10) as batcher:
+            known = batcher.submit('BTC', 'USD')
+            unknown = batcher.submit('UNKNOWN', 'USD')
+        self.assertEqual(known.result(), 6.0)
+        self.assertRaises(CryptoCompareApiError, unknown.result)
+
+    def test_full(self):
+        """Full batcher should return RAW pair data"""
+        batcher = PriceBatcher(self.cc, full=True)
+        self.assertEqual(batcher.get_price('btc', 'usd'), 6.0)
+        self.assertIn('pricemultifull', self.transport.requests[0])
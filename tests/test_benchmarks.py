@@ -0,0 +1,51 @@
+import unittest
+
+from cryptocompare import CryptoCompare
+
+from benchmarks import importtime
+from benchmarks.compare import compare
+from benchmarks.server import LocalTransport, StubServer
+from benchmarks.suite import ENDPOINTS
+
+
+class TestStubServer(unittest.TestCase):
+    def test_every_endpoint(self):
+        """Every client endpoint should be answered by the fixtures server"""
+        with StubServer() as server:
+            cc = CryptoCompare(transport=LocalTransport(server.url))
+            for name, call in ENDPOINTS.items():
+                with self.subTest(endpoint=name):
+                    self.assertTrue(call(cc))
+            cc.close()
+
+
+class TestCompare(unittest.TestCase):
+    def test_regressions(self):
+        """Slower durations and lower throughputs should be regressions"""
+        before = {'environment': {'commit': 'a'}, 'endpoints': {'x': {'latency': 1.0}}, 'throughput': {'4': 100.0}}
+        after = {'environment': {'commit': 'b'}, 'endpoints': {'x': {'latency': 1.2}}, 'throughput': {'4': 80.0}}
+        self.assertEqual(
+            [(name, regressed) for name, _, _, _, regressed in compare(before, after, 0.1)],
+            [('endpoints.x.latency', True), ('throughput.4', True)]
+        )
+        self.assertFalse(any(r for *_, r in compare(before, after, 0.5)))
+
+
+class TestImportTime(unittest.TestCase):
+    def test_parse(self):
+        """Imports reported after the marker should be parsed with their depth"""
+        report = '\n'.join([
+            'import time: self [us] | cumulative | imported package',
+            'import time:       100 |        100 | site',
+            importtime.MARKER,
+            'import time:        20 |         20 |   cryptocompare.lazy',
+            'import time:        30 |         50 | cryptocompare',
+        ])
+        imports = list(importtime.parse(report))
+        self.assertEqual(imports, [('cryptocompare.lazy', 20, 20, 1), ('cryptocompare', 30, 50, 0)])
+        self.assertEqual(importtime.total(imports), 50e-6)
+
+    def test_measure(self):
+        """Importing the package should be measured in a fresh interpreter"""
+        modules = [module for module, _, _, _ in importtime.measure('import cryptocompare')]
+        self.assertIn('cryptocompare', modules)
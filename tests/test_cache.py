@@ -0,0 +1,79 @@
+import tempfile
+import time
+import unittest
+
+from cryptocompare import CryptoCompare, CryptoCompareApiError, DiskCache, MemoryCache, ResponseCache, StubTransport
+from cryptocompare.cache import endpoint_name
+
+
+class TestEndpointName(unittest.TestCase):
+    def test_names(self):
+        """Endpoint names should be URL paths without API prefix"""
+        self.assertEqual(endpoint_name('https://min-api.cryptocompare.com/data/all/coinlist'), 'all/coinlist')
+        self.assertEqual(endpoint_name('https://min-api.cryptocompare.com/data/pricemulti?fsyms=BTC'), 'pricemulti')
+        self.assertEqual(endpoint_name('https://www.cryptocompare.com/api/data/socialstats/?id=1'), 'socialstats')
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        """Least recently used entries should be evicted over size limit"""
+        cache = MemoryCache(max_size=10)
+        cache.set('a', 0, b'1234')
+        cache.set('b', 0, b'1234')
+        cache.get('a')
+        cache.set('c', 0, b'1234')
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.size, 8)
+
+    def test_too_large(self):
+        """Entries larger than the size limit should not be stored"""
+        cache = MemoryCache(max_size=2)
+        cache.set('a', 0, b'1234')
+        self.assertEqual(len(cache), 0)
+
+
+class TestDiskCache(unittest.TestCase):
+    def test_roundtrip(self):
+        """Stored entries should be read back"""
+        with tempfile.TemporaryDirectory() as directory:
+            DiskCache(directory).set('a', 12.5, b'content')
+            self.assertEqual(DiskCache(directory).get('a'), (12.5, b'content'))
+            self.assertIsNone(DiskCache(directory).get('b'))
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_ttl(self):
+        """Entries should expire after their endpoint TTL"""
+        cache = ResponseCache(ttls={'pricemulti': 0.05})
+        cache.set('pricemulti', 'url', b'content')
+        self.assertEqual(cache.get('pricemulti', 'url'), b'content')
+        time.sleep(0.06)
+        self.assertIsNone(cache.get('pricemulti', 'url'))
+        self.assertEqual(cache.get('pricemulti', 'url', stale=True), b'content')
+        self.assertEqual((cache.hits['pricemulti'], cache.misses['pricemulti']), (2, 1))
+
+    def test_uncached_endpoint(self):
+        """Endpoints without TTL should not be cached"""
+        cache = ResponseCache(ttls={})
+        cache.set('pricemulti', 'url', b'content')
+        self.assertIsNone(cache.get('pricemulti', 'url'))
+
+
+class TestClientCache(unittest.TestCase):
+    def test_cached_request(self):
+        """Cached responses should not be requested again"""
+        transport = StubTransport({'/data/all/coinlist': {'Data': {'BTC': {}}}})
+        cc = CryptoCompare(transport=transport, cache=ResponseCache())
+        self.assertEqual(cc.get_coin_list(), {'BTC': {}})
+        self.assertEqual(cc.get_coin_list(), {'BTC': {}})
+        self.assertEqual(len(transport.requests), 1)
+        self.assertEqual(cc.cache.hits['all/coinlist'], 1)
+
+    def test_errors_not_cached(self):
+        """Error responses should not be cached"""
+        transport = StubTransport({'/data/all/coinlist': {'Response': 'Error'}})
+        cc = CryptoCompare(transport=transport, cache=ResponseCache())
+        self.assertRaises(CryptoCompareApiError, cc.get_coin_list)
+        self.assertRaises(CryptoCompareApiError, cc.get_coin_list)
+        self.assertEqual(len(transport.requests), 2)
@@ -0,0 +1,64 @@
+import argparse
+import os
+import tempfile
+import unittest
+
+from cryptocompare import Candles, Period, StubTransport
+from cryptocompare.cli import backfill, job_path, parse_pair, parse_time, plan
+
+from .helpers import histo_route
+
+HOUR = 3600
+
+
+class TestParse(unittest.TestCase):
+    def test_pair(self):
+        """Pairs may specify an exchange"""
+        self.assertEqual(parse_pair('btc/usd'), ('BTC', 'USD', None))
+        self.assertEqual(parse_pair('BTC/USD@Kraken'), ('BTC', 'USD', 'Kraken'))
+        self.assertRaises(argparse.ArgumentTypeError, parse_pair, 'BTC')
+
+    def test_time(self):
+        """Times may be timestamps or dates"""
+        self.assertEqual(parse_time('1500000000'), 1500000000)
+        self.assertEqual(parse_time('2018-01-01'), 1514764800)
+        self.assertEqual(parse_time('2018-01-01T01:00:00'), 1514768400)
+        self.assertRaises(argparse.ArgumentTypeError, parse_time, 'yesterday')
+
+
+class TestPlan(unittest.TestCase):
+    def test_windows(self):
+        """Jobs should cover the range of every pair without overlap"""
+        jobs = plan([('BTC', 'USD', None), ('ETH', 'USD', 'Kraken')], Period.HOUR, 0, HOUR * 5000, pages_per_job=1)
+        self.assertEqual(len(jobs), 6)
+        btc = [job for job in jobs if job.fsym == 'BTC']
+        self.assertEqual([(job.start, job.end) for job in btc], [
+            (0, HOUR * 2000), (HOUR * 2001, HOUR * 4001), (HOUR * 4002, HOUR * 5000)
+        ])
+
+
+class TestBackfill(unittest.TestCase):
+    def setUp(self):
+        self.output = tempfile.TemporaryDirectory()
+        self.client_kwargs = {'transport': StubTransport({'/data/histohour': histo_route(HOUR)})}
+        self.jobs = plan([('BTC', 'USD', None), ('ETH', 'USD', None)], Period.HOUR, 0, HOUR * 5000, pages_per_job=1)
+
+    def tearDown(self):
+        self.output.cleanup()
+
+    def test_processes(self):
+        """Jobs should be run by worker processes and written as columns"""
+        total = backfill(self.jobs, self.output.name, workers=2, client_kwargs=self.client_kwargs)
+        self.assertEqual(total, 2 * 5001)
+
+        candles = Candles.concat(Candles.load(job_path(self.output.name, job)) for job in self.jobs[:3])
+        self.assertEqual(list(candles.time), list(range(0, HOUR * 5001, HOUR)))
+
+    def test_resume(self):
+        """Jobs recorded in checkpoint should not be run again"""
+        backfill(self.jobs[:4], self.output.name, workers=0, client_kwargs=self.client_kwargs)
+        reports = []
+        backfill(self.jobs, self.output.name, workers=0, client_kwargs=self.client_kwargs,
+                 report=lambda *args: reports.append(args))
+        self.assertEqual([done for done, jobs, _, _ in reports], [1, 2])
+        self.assertTrue(all(os.path.exists(job_path(self.output.name, job)) for job in self.jobs))
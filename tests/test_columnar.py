@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import unittest
+
+from cryptocompare import Candles, CryptoCompare, CryptoCompareApiError, Period, StubTransport
+
+from .helpers import histo_route
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+CANDLE = {
+    'time': 60, 'close': 4.0, 'high': 5.0, 'low': 1.0, 'open': 2.0,
+    'volumefrom': 10.0, 'volumeto': 40.0,
+}
+
+
+class TestCandlesParse(unittest.TestCase):
+    def test_columns(self):
+        """Candles should be parsed into columns whatever their keys order"""
+        content = json.dumps({'Response': 'Success', 'Data': [CANDLE, dict(CANDLE, time=120)]}).encode()
+        result = Candles.parse(content)
+        self.assertEqual(list(result['Data'].time), [60, 120])
+        self.assertEqual(list(result['Data'].close), [4.0, 4.0])
+        self.assertEqual(result['Data'][0], CANDLE)
+
+    def test_other_objects(self):
+        """Objects other than candles should be decoded as usual"""
+        content = json.dumps({'ConversionType': {'type': 'direct'}, 'Data': []}).encode()
+        result = Candles.parse(content)
+        self.assertEqual(result['ConversionType'], {'type': 'direct'})
+        self.assertEqual(len(result['Data']), 0)
+
+
+class TestCandlesConcat(unittest.TestCase):
+    def test_overlap(self):
+        """Overlapping candles should be kept once, in time order"""
+        a = Candles(time=[3, 4, 5], close=[3, 4, 5], open=[0] * 3, high=[0] * 3, low=[0] * 3,
+                    volumefrom=[0] * 3, volumeto=[0] * 3)
+        b = Candles(time=[1, 2, 3], close=[1, 2, 3], open=[0] * 3, high=[0] * 3, low=[0] * 3,
+                    volumefrom=[0] * 3, volumeto=[0] * 3)
+        result = Candles.concat([a, b], start=2, end=4)
+        self.assertEqual(list(result.time), [2, 3, 4])
+        self.assertEqual(list(result.close), [2, 3, 4])
+
+
+class TestCandlesFile(unittest.TestCase):
+    def test_roundtrip(self):
+        """Saved candles should be loaded back"""
+        candles = Candles.parse(json.dumps({'Data': [CANDLE, dict(CANDLE, time=120)]}).encode())['Data']
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'candles')
+            candles.save(path)
+            self.assertEqual(Candles.load(path), candles)
+
+    def test_invalid_file(self):
+        """Loading a file which is not a candles one should fail"""
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b'0' * 64)
+            f.flush()
+            self.assertRaises(ValueError, Candles.load, f.name)
+
+
+class TestColumnarHistorical(unittest.TestCase):
+    def setUp(self):
+        self.cc = CryptoCompare(transport=StubTransport({'/data/histohour': histo_route(3600)}))
+
+    def test_historical(self):
+        """Columnar historical data should hold the same points as the regular one"""
+        rows = self.cc.get_historical('BTC', 'USD', Period.HOUR, limit=10, to_ts=3600 * 100)
+        candles = self.cc.get_historical('BTC', 'USD', Period.HOUR, limit=10, to_ts=3600 * 100, columnar=True)
+        self.assertIsInstance(candles, Candles)
+        self.assertEqual(list(candles), rows)
+
+    def test_historical_range(self):
+        """Columnar historical range should match the regular one"""
+        rows = self.cc.get_historical_range('BTC', 'USD', Period.HOUR, start=0, end=3600 * 5000)
+        candles = self.cc.get_historical_range('BTC', 'USD', Period.HOUR, start=0, end=3600 * 5000, columnar=True)
+        self.assertEqual(list(candles), rows)
+
+    def test_error(self):
+        """Error responses should still raise"""
+        cc = CryptoCompare(transport=StubTransport({'/data/histohour': {'Response': 'Error', 'Data': []}}))
+        self.assertRaises(CryptoCompareApiError, cc.get_historical, 'BTC', 'USD', Period.HOUR, columnar=True)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_to_numpy(self):
+        """NumPy arrays should share memory with the columns"""
+        candles = self.cc.get_historical('BTC', 'USD', Period.HOUR, limit=10, to_ts=3600 * 100, columnar=True)
+        arrays = candles.to_numpy()
+        self.assertEqual(arrays['time'].dtype, numpy.int64)
+        candles.close[0] = -1.0
+        self.assertEqual(arrays['close'][0], -1.0)
@@ -0,0 +1,33 @@
+import json
+import unittest
+
+from cryptocompare import Candles, CryptoCompare, StubTransport, decoder
+
+
+class TestDecoder(unittest.TestCase):
+    def test_default_backend(self):
+        """A known backend should be picked by default"""
+        self.assertIn(decoder.backend, ('orjson', 'simdjson', 'ujson', 'json'))
+        self.assertEqual(decoder.loads(b'{"a": [1, 2.5]}'), {'a': [1, 2.5]})
+
+    def test_standard_backend(self):
+        """Standard library backend should decode bytes"""
+        self.assertEqual(decoder.get_loads('json')(b'{"a": "\\u00e9"}'), {'a': 'é'})
+
+    def test_client_backend(self):
+        """Client should decode responses with the requested backend"""
+        transport = StubTransport({'/data/pricemulti': {'BTC': {'USD': 1.0}}})
+        cc = CryptoCompare(transport=transport, json_backend='json')
+        self.assertIs(cc.loads, decoder.get_loads('json'))
+        self.assertEqual(cc.get_price('BTC', 'USD'), {'BTC': {'USD': 1.0}})
+
+    def test_columnar_backends(self):
+        """Columnar parsing should not depend on the backend"""
+        content = json.dumps({'Data': [
+            {'time': t, 'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5, 'volumefrom': 3.0, 'volumeto': 4.0}
+            for t in range(10)
+        ]}).encode()
+        self.assertEqual(
+            Candles.parse(content, decoder.get_loads('json'))['Data'],
+            Candles.parse(content, lambda c: json.loads(c))['Data']
+        )
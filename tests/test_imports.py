@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import unittest
+
+import cryptocompare
+
+
+def imported_modules(statement):
+    """Top level names of the modules loaded after running statement in a fresh interpreter"""
+    code = '{}; import sys; print(" ".join(sorted({{m.split(".")[0] for m in sys.modules}})))'.format(statement)
+    output = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, check=True).stdout
+    return set(output.decode().split())
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import(self):
+        """Importing the package should not load heavy dependencies"""
+        modules = imported_modules('import cryptocompare')
+        for heavy in ('requests', 'numpy', 'asyncio', 'aiohttp', 'orjson', 'sqlite3', 'multiprocessing'):
+            self.assertNotIn(heavy, modules)
+
+    def test_client(self):
+        """A blocking client should not load asynchronous support"""
+        modules = imported_modules('import cryptocompare; cryptocompare.CryptoCompare()')
+        self.assertIn('requests', modules)
+        self.assertNotIn('asyncio', modules)
+        self.assertNotIn('numpy', modules)
+
+    def test_exports(self):
+        """Every exported name should be importable"""
+        for name in cryptocompare.__all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(cryptocompare, name))
+        self.assertIn('CryptoCompare', dir(cryptocompare))
+        with self.assertRaises(AttributeError):
+            cryptocompare.missing
+
+    def test_eager_exports(self):
+        """Exports should be bound on import where module __getattr__ is not supported"""
+        code = (
+            'import sys; sys.version_info = (3, 6, 9); import cryptocompare; from cryptocompare import decoder; '
+            'print(all(name in vars(cryptocompare) for name in cryptocompare.__all__), "loads" in vars(decoder))'
+        )
+        output = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, check=True).stdout
+        self.assertEqual(output.split(), [b'True', b'True'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import json
+import unittest
+
+from benchmarks import fixtures
+from cryptocompare import CryptoCompare, CryptoCompareApiError, LazyMapping, StubTransport
+
+
+class TestLazyMapping(unittest.TestCase):
+    def test_decode(self):
+        """Members should decode as with json.loads"""
+        content = (
+            b'{"a": {"x": [1, {"y": "}{"}, [[2], [ ]], {}], "z": "\\"q"}, "b" : 2 ,'
+            b' "c\\u00e9": {}, "d": [ ], "e": {"f": "}", "g": "{"}, "h": null}'
+        )
+        lazy = LazyMapping(content)
+        self.assertEqual(dict(lazy), json.loads(content))
+        self.assertEqual(list(lazy), ['a', 'b', 'cé', 'd', 'e', 'h'])
+        self.assertEqual(lazy.raw('b'), b'2')
+
+    def test_levels(self):
+        """Nested objects should be lazy down to the requested level"""
+        lazy = LazyMapping(b'{"a": {"b": {"c": 1}}, "d": [1]}', levels=2)
+        self.assertIsInstance(lazy['a'], LazyMapping)
+        self.assertEqual(lazy['a']['b'], {'c': 1})
+        self.assertEqual(lazy['d'], [1])
+        self.assertIs(lazy['a'], lazy['a'])
+
+    def test_invalid(self):
+        """Malformed objects should raise ValueError"""
+        for content in (b'[1]', b'{"a" 1}', b'{"a": 1', b'{"a": [1}'):
+            with self.assertRaises(ValueError):
+                LazyMapping(content)
+
+    def test_coin_list(self):
+        """Lazy coin list should match the decoded one"""
+        content = fixtures.coinlist()
+        cc = CryptoCompare(transport=StubTransport({'/data/all/coinlist': content}))
+        coins = cc.get_coin_list(lazy=True)
+        self.assertIsInstance(coins, LazyMapping)
+        expected = json.loads(content)['Data']
+        self.assertEqual(len(coins), len(expected))
+        self.assertEqual(coins['C0042'], expected['C0042'])
+
+    def test_mining(self):
+        """Lazy mining payloads should be keyed by id"""
+        content = fixtures.mining('contracts')
+        cc = CryptoCompare(transport=StubTransport({'/api/data/miningcontracts': content}))
+        self.assertEqual(dict(cc.get_mining_contracts(lazy=True)), json.loads(content)['MiningData'])
+
+    def test_error(self):
+        """Lazy responses should still be checked for errors"""
+        error = {'Response': 'Error', 'Message': 'failed', 'Type': 1, 'Data': {}}
+        cc = CryptoCompare(transport=StubTransport({'/data/all/coinlist': error}))
+        with self.assertRaises(CryptoCompareApiError):
+            cc.get_coin_list(lazy=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import math
+import unittest
+from unittest import mock
+
+from cryptocompare import CryptoCompare, StubTransport, get_price_matrix
+from cryptocompare import matrix
+
+PRICES = {
+    'BTC': {'USD': 10000.0, 'EUR': 8000.0}, 'ETH': {'USD': 500.0}, 'LTC': {'EUR': 100.0},
+    'USD': {'EUR': 0.8}, 'EUR': {'USD': 1.25},
+}
+
+
+def pricemulti(params):
+    return {
+        fsym: {tsym: PRICES[fsym][tsym] for tsym in params['tsyms'].split(',') if tsym in PRICES.get(fsym, {})}
+        for fsym in params['fsyms'].split(',') if fsym in PRICES
+    }
+
+
+class TestPriceMatrix(unittest.TestCase):
+    def setUp(self):
+        self.transport = StubTransport({'/data/pricemulti': pricemulti})
+        self.cc = CryptoCompare(transport=self.transport)
+
+    def check(self):
+        result = get_price_matrix(self.cc, ['btc', 'eth', 'ltc', 'usd', 'xyz'], pivots=['USD', 'EUR'])
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertTrue(self.transport.requests[0].endswith('tsyms=USD,EUR'))
+
+        self.assertEqual(result.rate('BTC', 'USD'), 10000.0)
+        self.assertTrue(result.is_direct('BTC', 'USD'))
+        self.assertEqual(result['BTC', 'ETH'], 20.0)
+        self.assertTrue(result.is_synthetic('BTC', 'ETH'))
+        self.assertEqual(result.rate('ETH', 'BTC'), 0.05)
+        self.assertAlmostEqual(result.rate('LTC', 'USD'), 125.0)
+        self.assertAlmostEqual(result.rate('ETH', 'LTC'), 4.0)
+        self.assertEqual(result.rate('ETH', 'ETH'), 1.0)
+        self.assertTrue(math.isnan(result.rate('ETH', 'XYZ')))
+        self.assertFalse(result.is_synthetic('ETH', 'XYZ'))
+        self.assertNotIn('XYZ', result.to_dict()['ETH'])
+
+    def test_rates(self):
+        """Cross rates should be derived through pivots"""
+        self.check()
+
+    @unittest.skipIf(matrix.numpy is None, "numpy is not installed")
+    def test_rates_without_numpy(self):
+        """Cross rates should be derived without NumPy too"""
+        with mock.patch.object(matrix, 'numpy', None):
+            self.check()
+
+    def test_exchange(self):
+        """Prices should be requested from the given exchange"""
+        get_price_matrix(self.cc, ['BTC', 'ETH'], exchange='Kraken')
+        self.assertIn('e=Kraken', self.transport.requests[0])
@@ -0,0 +1,106 @@
+import socket
+import unittest
+
+from cryptocompare import (
+    CryptoCompare, CryptoCompareApiError, MetricsCollector, RequestEvent, ResponseCache, StatsdExporter,
+    StubTransport, Transport
+)
+from cryptocompare.metrics import Histogram
+
+
+class FailingTransport(Transport):
+    def get(self, url, timeout=None):
+        raise ConnectionError()
+
+
+class TestHooks(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.transport = StubTransport({
+            '/data/pricemulti': {'BTC': {'USD': 1.0}},
+            '/data/histoday': {'Response': 'Error', 'Message': 'foo'},
+        })
+        self.cc = CryptoCompare(transport=self.transport, hooks=[self.events.append])
+
+    def test_event(self):
+        """Hooks should receive an event per request"""
+        self.cc.get_price('BTC', 'USD')
+        event, = self.events
+        self.assertEqual(event.endpoint, 'pricemulti')
+        self.assertIn('{fsyms}', event.template)
+        self.assertEqual(event.url, self.transport.requests[0])
+        self.assertEqual(event.bytes, len(b'{"BTC": {"USD": 1.0}}'))
+        self.assertGreaterEqual(event.total, event.decode)
+        self.assertIsNone(event.cache)
+        self.assertIsNone(event.error)
+
+    def test_api_error(self):
+        """API errors should be reported"""
+        self.assertRaises(CryptoCompareApiError, self.cc.get_historical, 'BTC', 'USD')
+        self.assertEqual(self.events[0].error, 'CryptoCompareApiError')
+
+    def test_transport_error(self):
+        """Transport errors should be reported"""
+        cc = CryptoCompare(transport=FailingTransport(), hooks=[self.events.append])
+        self.assertRaises(ConnectionError, cc.get_price, 'BTC', 'USD')
+        self.assertEqual(self.events[0].error, 'ConnectionError')
+        self.assertIsNone(self.events[0].ttfb)
+
+    def test_cache(self):
+        """Cache hits and misses should be reported"""
+        self.cc.cache = ResponseCache()
+        self.cc.get_price('BTC', 'USD')
+        self.cc.get_price('BTC', 'USD')
+        self.assertEqual([e.cache for e in self.events], ['miss', 'hit'])
+
+
+class TestHistogram(unittest.TestCase):
+    def test_quantile(self):
+        """Quantiles should be bucket upper bounds"""
+        histogram = Histogram((0.1, 1.0, float('inf')))
+        for value in (0.05, 0.05, 0.5, 5.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.quantile(0.5), 0.1)
+        self.assertEqual(histogram.quantile(0.75), 1.0)
+        self.assertEqual(histogram.quantile(1), float('inf'))
+        self.assertEqual(list(histogram.cumulative()), [(0.1, 2), (1.0, 3), (float('inf'), 4)])
+
+
+def event(**fields):
+    defaults = dict(
+        endpoint='pricemulti', template='', url='', bytes=10, ttfb=0.01, total=0.02, decode=0.001,
+        cache=None, error=None
+    )
+    defaults.update(fields)
+    return RequestEvent(**defaults)
+
+
+class TestMetricsCollector(unittest.TestCase):
+    def test_prometheus(self):
+        """Aggregated metrics should be exported in Prometheus text format"""
+        collector = MetricsCollector(buckets=(0.1, float('inf')))
+        collector(event())
+        collector(event(error='CryptoCompareApiError', total=0.5))
+        text = collector.to_prometheus()
+        self.assertIn('cryptocompare_requests_total{endpoint="pricemulti"} 2', text)
+        self.assertIn('cryptocompare_errors_total{endpoint="pricemulti",type="CryptoCompareApiError"} 1', text)
+        self.assertIn('cryptocompare_request_total_seconds_bucket{endpoint="pricemulti",le="0.1"} 1', text)
+        self.assertIn('cryptocompare_request_total_seconds_bucket{endpoint="pricemulti",le="+Inf"} 2', text)
+
+
+class TestStatsdExporter(unittest.TestCase):
+    def test_send(self):
+        """Events should be sent as StatsD lines"""
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(('127.0.0.1', 0))
+        server.settimeout(1)
+        exporter = StatsdExporter(*server.getsockname())
+        try:
+            exporter(event(endpoint='all/coinlist', cache='miss'))
+            lines = server.recv(4096).decode().splitlines()
+        finally:
+            exporter.close()
+            server.close()
+        self.assertIn('cryptocompare.all_coinlist.requests:1|c', lines)
+        self.assertIn('cryptocompare.all_coinlist.total:20.000|ms', lines)
+        self.assertIn('cryptocompare.all_coinlist.cache.miss:1|c', lines)
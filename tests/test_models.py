@@ -0,0 +1,79 @@
+import json
+import sys
+import unittest
+
+from benchmarks import fixtures
+from cryptocompare import CryptoCompare, CryptoCompareApiError, PairVolume, Price, StubTransport, Ticker
+from cryptocompare import models
+
+
+def client(path, payload):
+    return CryptoCompare(transport=StubTransport({path: payload}))
+
+
+class TestTypedResults(unittest.TestCase):
+    def test_price(self):
+        """Typed prices should be Price records"""
+        cc = client('/data/pricemulti', fixtures.pricemulti(['BTC', 'ETH'], ['USD']))
+        self.assertEqual(cc.get_price(['BTC', 'ETH'], 'USD', typed=True), [
+            Price('BTC', 'USD', 1.5), Price('ETH', 'USD', 1.5)
+        ])
+
+    def test_full_data(self):
+        """Typed full data should be Ticker records with interned symbols"""
+        cc = client('/data/pricemultifull', fixtures.pricemultifull(['BTC', 'ETH'], ['USD', 'EUR']))
+        tickers = cc.get_symbols_full_data(['BTC', 'ETH'], ['USD', 'EUR'], typed=True)
+        self.assertEqual(len(tickers), 4)
+        self.assertIsInstance(tickers[0], Ticker)
+        self.assertEqual((tickers[0].fsym, tickers[0].tsym, tickers[0].price), ('BTC', 'USD', 1.5))
+        self.assertEqual(tickers[0].volume_24h_to, 3000.0)
+        self.assertEqual(tickers[0].display['PRICE'], 'USD 1.5')
+        self.assertIs(tickers[0].fsym, sys.intern('BTC'))
+
+    def test_skip_display(self):
+        """DISPLAY should not be decoded unless requested"""
+        content = fixtures.pricemultifull(['BTC'], ['USD'])
+        decoded = []
+
+        def loads(body):
+            decoded.append(body)
+            return json.loads(body)
+
+        response = models.parse_full_data(content, loads, typed=False, display=False)
+        self.assertEqual(response, {'RAW': json.loads(content)['RAW']})
+        self.assertNotIn(b'DISPLAY', decoded[0])
+
+        cc = client('/data/pricemultifull', content)
+        self.assertIsNone(cc.get_symbols_full_data('BTC', 'USD', typed=True, display=False)[0].display)
+
+    def test_display_first(self):
+        """Responses with DISPLAY before RAW should still be decoded"""
+        content = json.dumps({'DISPLAY': {'BTC': {}}, 'RAW': {'BTC': {'USD': {'PRICE': 2.0}}}}).encode()
+        response = models.parse_full_data(content, json.loads, typed=False, display=False)
+        self.assertEqual(response, {'RAW': {'BTC': {'USD': {'PRICE': 2.0}}}})
+
+    def test_top(self):
+        """Typed top exchanges and pairs should be PairVolume records"""
+        cc = client('/data/top/exchanges', fixtures.top_exchanges('BTC', 'USD', count=2))
+        self.assertEqual(cc.get_top_exchanges('BTC', 'USD', typed=True), [
+            PairVolume('Exchange0', 'BTC', 'USD', 1000.0, 1500.0),
+            PairVolume('Exchange1', 'BTC', 'USD', 999.0, 1499.0),
+        ])
+        cc = client('/data/top/pairs', fixtures.top_pairs('BTC', count=1))
+        self.assertEqual(cc.get_top_pairs('BTC', typed=True), [PairVolume('CCCAGG', 'BTC', 'C0000', 1000.0, 1500.0)])
+
+    def test_error(self):
+        """Typed responses should still be checked for errors"""
+        error = {'Response': 'Error', 'Message': 'failed', 'Type': 1}
+        cases = (
+            ('/data/pricemulti', lambda cc: cc.get_price('BTC', 'USD', typed=True)),
+            ('/data/pricemultifull', lambda cc: cc.get_symbols_full_data('BTC', 'USD', typed=True, display=False)),
+            ('/data/top/pairs', lambda cc: cc.get_top_pairs('BTC', typed=True)),
+        )
+        for path, call in cases:
+            with self.subTest(path=path), self.assertRaises(CryptoCompareApiError):
+                call(client(path, error))
+
+
+if __name__ == '__main__':
+    unittest.main()
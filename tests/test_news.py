@@ -0,0 +1,76 @@
+import threading
+import unittest
+
+from cryptocompare import CryptoCompare, NewsCursor, StubTransport
+
+PAGE_SIZE = 5
+
+
+class FakeNews:
+    """Articles published every 10 seconds, served newest first by pages"""
+
+    def __init__(self, count):
+        self.articles = [{'id': str(i), 'published_on': 1000 + 10 * i} for i in range(count)]
+        self.lock = threading.Lock()
+
+    def publish(self, count):
+        with self.lock:
+            start = len(self.articles)
+            self.articles += [{'id': str(i), 'published_on': 1000 + 10 * i} for i in range(start, start + count)]
+
+    def __call__(self, params):
+        if params.get('feeds', 'coindesk') != 'coindesk':
+            return []
+        before = int(params.get('lTs', 10 ** 10))
+        with self.lock:
+            articles = [a for a in reversed(self.articles) if a['published_on'] < before]
+        return articles[:PAGE_SIZE]
+
+
+class TestNewsCursor(unittest.TestCase):
+    def setUp(self):
+        self.news = FakeNews(20)
+        self.transport = StubTransport({'/data/news/': self.news})
+        self.cursor = NewsCursor(CryptoCompare(transport=self.transport))
+
+    def test_first_poll(self):
+        """First poll should return the latest page"""
+        self.assertEqual([a['id'] for a in self.cursor.poll()], ['19', '18', '17', '16', '15'])
+        self.assertEqual((self.cursor.oldest, self.cursor.newest), (1150, 1190))
+
+    def test_poll_newer(self):
+        """Following polls should only return new articles"""
+        list(self.cursor.poll())
+        self.news.publish(7)
+        self.assertEqual([a['id'] for a in self.cursor.poll()], ['26', '25', '24', '23', '22', '21', '20'])
+        self.assertEqual(list(self.cursor.poll()), [])
+        self.assertEqual(len(self.transport.requests), 4)
+
+    def test_backfill(self):
+        """Backfill should return every older article once"""
+        list(self.cursor.poll())
+        ids = [a['id'] for a in self.cursor.backfill(until=1000, workers=3)]
+        self.assertEqual(sorted(ids, key=int), [str(i) for i in range(15)])
+        self.assertEqual(self.cursor.oldest, 1000)
+
+    def test_backfill_stopped(self):
+        """Backfill should stop paging when iteration stops"""
+        self.news.publish(1000)
+        list(self.cursor.poll())
+        articles = self.cursor.backfill(until=1000, workers=2)
+        next(articles)
+        articles.close()
+        self.assertLess(len(self.transport.requests), 20)
+
+    def test_feeds(self):
+        """Feeds should be requested along with the paging timestamp"""
+        cursor = NewsCursor(CryptoCompare(transport=self.transport), feeds=['coindesk'])
+        list(cursor.poll())
+        ids = [a['id'] for a in cursor.backfill(until=1000, workers=2)]
+        self.assertEqual(sorted(ids, key=int), [str(i) for i in range(15)])
+
+    def test_seen_size(self):
+        """Only a bounded number of identifiers should be remembered"""
+        cursor = NewsCursor(CryptoCompare(transport=self.transport), seen_size=3)
+        list(cursor.poll())
+        self.assertEqual(len(cursor._seen), 3)
@@ -0,0 +1,107 @@
+import math
+import unittest
+
+from cryptocompare import AsyncCryptoCompare, Candles, CryptoCompare, ExecutorTransport, Panel, Period, StubTransport
+
+from .helpers import histo_route
+from .test_aio import run
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def candles(times, close=1.0):
+    return Candles(times, [close] * len(times), [close] * len(times), [close] * len(times), [close] * len(times),
+                   [1.0] * len(times), [close] * len(times))
+
+
+def by_fsym(routes):
+    return lambda params: routes[params['fsym']](params)
+
+
+class TestPanel(unittest.TestCase):
+    def test_alignment(self):
+        """Candles should be placed on the shared time index"""
+        panel = Panel.from_candles(
+            [('BTC', 'USD', None), ('ETH', 'USD', None)],
+            [candles([60, 120, 180]), candles([120, 240], close=2.0)],
+            60, 60, 240
+        )
+        self.assertEqual(panel.shape, (2, 4))
+        self.assertEqual(list(panel.time), [60, 120, 180, 240])
+        self.assertEqual(list(panel.row('close', ('BTC', 'USD')))[:3], [1.0] * 3)
+        self.assertTrue(math.isnan(panel.row('close', ('BTC', 'USD'))[3]))
+        eth = list(panel.row('close', ('eth', 'usd')))
+        self.assertTrue(math.isnan(eth[0]) and math.isnan(eth[2]))
+        self.assertEqual((eth[1], eth[3]), (2.0, 2.0))
+        self.assertEqual(panel.value('close', ('ETH', 'USD'), 240), 2.0)
+        with self.assertRaises(IndexError):
+            panel.value('close', ('ETH', 'USD'), 0)
+        with self.assertRaises(IndexError):
+            panel.value('close', ('BTC', 'USD'), 300)
+
+    def test_empty_candles(self):
+        """Zero candles sent before a pair was listed should be gaps"""
+        series = candles([60, 120, 180])
+        series.close[0] = series.volumefrom[0] = series.volumeto[0] = 0.0
+        panel = Panel.from_candles([('BTC', 'USD', None)], [series], 60, 60, 180)
+        self.assertTrue(math.isnan(panel['close'][0]))
+        self.assertEqual(panel['close'][1], 1.0)
+
+    def test_forward_fill(self):
+        """Gaps should take the previous close and no volume when filled"""
+        panel = Panel.from_candles([('BTC', 'USD', None)], [candles([120, 300], close=3.0)], 60, 60, 300, fill='ffill')
+        self.assertTrue(math.isnan(panel['open'][0]))
+        self.assertEqual(list(panel['open'])[1:], [3.0] * 4)
+        self.assertEqual(list(panel['volumefrom'])[1:], [1.0, 0.0, 0.0, 1.0])
+        with self.assertRaises(ValueError):
+            Panel.from_candles([], [], 60, 60, 300, fill='bfill')
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_to_numpy(self):
+        """Fields should be (pairs, time) matrices sharing memory with the panel"""
+        panel = Panel.from_candles([('BTC', 'USD', None), ('ETH', 'USD', None)], [candles([60]), candles([120])],
+                                   60, 60, 120)
+        arrays = panel.to_numpy()
+        self.assertEqual(arrays['close'].shape, (2, 2))
+        panel['close'][1] = 5.0
+        self.assertEqual(arrays['close'][0, 1], 5.0)
+
+
+class TestGetHistoricalPanel(unittest.TestCase):
+    def setUp(self):
+        self.transport = StubTransport({
+            '/data/histominute': by_fsym({'BTC': histo_route(60), 'ETH': histo_route(60, first=60 * 5000)}),
+        })
+
+    def test_panel(self):
+        """Pairs should be fetched page by page and aligned"""
+        cc = CryptoCompare(transport=self.transport)
+        panel = cc.get_historical_panel(
+            [('BTC', 'USD'), ('ETH', 'USD', 'Kraken')], Period.MINUTE, start=60 * 1000 + 1, end=60 * 9000
+        )
+        self.assertEqual(panel.shape, (2, 8001))
+        self.assertEqual(panel.time[0], 60 * 1000)
+        self.assertEqual(len(self.transport.requests), 8)
+        self.assertEqual(sum('e=Kraken' in url for url in self.transport.requests), 4)
+
+        self.assertEqual(list(panel.row('low', ('BTC', 'USD'))), [float(t) for t in panel.time])
+        eth = panel.row('low', ('ETH', 'USD', 'Kraken'))
+        self.assertTrue(all(math.isnan(v) for v in eth[:4000]))
+        self.assertEqual(eth[4000], 60 * 5000)
+
+    def test_async(self):
+        """Asynchronous clients should fetch panels concurrently"""
+        async def main():
+            async with AsyncCryptoCompare(transport=ExecutorTransport(self.transport)) as cc:
+                return await cc.get_historical_panel(['BTC/USD'.split('/')], Period.MINUTE, 60 * 1000, 60 * 3000)
+
+        panel = run(main())
+        self.assertEqual(panel.shape, (1, 2001))
+        self.assertEqual(panel['close'][0], 60 * 1000 + 0.25)
+
+
+if __name__ == '__main__':
+    unittest.main()
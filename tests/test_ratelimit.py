@@ -0,0 +1,119 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from cryptocompare import (
+    CryptoCompare, CryptoCompareRateLimitError, ProcessRateLimiter, RateLimiter, Response, StubTransport
+)
+from cryptocompare.ratelimit import backoff
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst(self):
+        """Requests within budget should not wait"""
+        limiter = RateLimiter(per_second=5)
+        self.assertEqual([limiter.reserve() for _ in range(5)], [0.0] * 5)
+
+    def test_delay(self):
+        """Requests over budget should be delayed in order"""
+        limiter = RateLimiter(per_second=10, per_minute=1000)
+        for _ in range(10):
+            limiter.reserve()
+        self.assertAlmostEqual(limiter.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(limiter.reserve(), 0.2, places=2)
+
+    def test_strictest_budget(self):
+        """Delay should follow the strictest budget"""
+        limiter = RateLimiter(per_second=100, per_minute=1)
+        limiter.reserve()
+        self.assertAlmostEqual(limiter.reserve(), 60, places=1)
+
+    def test_try_acquire(self):
+        """Tokens should only be taken while no wait is needed"""
+        limiter = RateLimiter(per_second=100, per_minute=2)
+        self.assertEqual([limiter.try_acquire() for _ in range(3)], [True, True, False])
+        self.assertAlmostEqual(limiter.reserve(), 30, places=1)
+
+    def test_threads(self):
+        """Limiter should pace requests shared across threads"""
+        limiter = RateLimiter(per_second=20)
+        for _ in range(20):
+            limiter.reserve()
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_backoff(self):
+        """Backoff delay should grow up to its cap"""
+        for attempt in range(10):
+            self.assertLessEqual(backoff(attempt, base=1, cap=8), min(8, 2 ** attempt))
+
+
+class TestProcessRateLimiter(unittest.TestCase):
+    def test_delay(self):
+        """Requests over budget should be delayed in order"""
+        shared = ProcessRateLimiter(per_second=10, per_minute=1000)
+        for _ in range(10):
+            self.assertEqual(shared.reserve(), 0.0)
+        self.assertAlmostEqual(shared.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(shared.reserve(), 0.2, places=2)
+
+    def test_strictest_budget(self):
+        """Delay should follow the strictest budget"""
+        limiter = ProcessRateLimiter(per_second=100, per_minute=1)
+        limiter.reserve()
+        self.assertAlmostEqual(limiter.reserve(), 60, places=1)
+
+
+    def test_try_acquire(self):
+        """Tokens should only be taken while no wait is needed"""
+        limiter = ProcessRateLimiter(per_second=100, per_minute=2)
+        self.assertEqual([limiter.try_acquire() for _ in range(3)], [True, True, False])
+        self.assertAlmostEqual(limiter.reserve(), 30, places=1)
+
+
+@mock.patch('cryptocompare.api.backoff', return_value=0)
+class TestRateLimitRetries(unittest.TestCase):
+    def throttled(self, failures, response=None):
+        calls = []
+
+        def route(params):
+            calls.append(params)
+            if len(calls) <= failures:
+                return response or {'Response': 'Error', 'Message': 'Rate limit excedeed!'}
+            return {'BTC': {'USD': 1.0}}
+        return route
+
+    def test_retry(self, _):
+        """Throttled requests should be retried"""
+        transport = StubTransport({'/data/pricemulti': self.throttled(2)})
+        cc = CryptoCompare(transport=transport)
+        self.assertEqual(cc.get_price('BTC', 'USD'), {'BTC': {'USD': 1.0}})
+        self.assertEqual(len(transport.requests), 3)
+
+    def test_http_status(self, _):
+        """HTTP 429 responses should be retried"""
+        transport = StubTransport({'/data/pricemulti': self.throttled(1, Response(429, b'', 0.0))})
+        cc = CryptoCompare(transport=transport)
+        self.assertEqual(cc.get_price('BTC', 'USD'), {'BTC': {'USD': 1.0}})
+
+    def test_give_up(self, _):
+        """Rate limit error should be raised once retries are exhausted"""
+        transport = StubTransport({'/data/pricemulti': self.throttled(10)})
+        cc = CryptoCompare(transport=transport, rate_limit_retries=2)
+        self.assertRaises(CryptoCompareRateLimitError, cc.get_price, 'BTC', 'USD')
+        self.assertEqual(len(transport.requests), 3)
+
+    def test_limiter(self, _):
+        """Client requests should go through its rate limiter"""
+        limiter = RateLimiter(per_second=10)
+        cc = CryptoCompare(transport=StubTransport({'/data/pricemulti': {}}), rate_limiter=limiter)
+        for _ in range(10):
+            cc.get_price('BTC', 'USD')
+        self.assertGreater(limiter.reserve(), 0)
@@ -0,0 +1,84 @@
+import threading
+import time
+import unittest
+
+from cryptocompare import Coin, CryptoCompare, Registry, StubTransport
+
+COINS = {
+    'BTC': {'Id': '1182', 'Name': 'BTC', 'Symbol': 'BTC', 'CoinName': 'Bitcoin', 'FullName': 'Bitcoin (BTC)',
+            'Algorithm': 'SHA256', 'ProofType': 'PoW'},
+    'ETH': {'Id': '7605', 'Name': 'ETH', 'Symbol': 'ETH', 'CoinName': 'Ethereum', 'FullName': 'Ethereum (ETH)',
+            'Algorithm': 'Ethash', 'ProofType': 'PoW'},
+}
+EXCHANGES = {
+    'Kraken': {'BTC': ['USD', 'EUR'], 'ETH': ['USD']},
+    'Bitstamp': {'BTC': ['USD']},
+}
+
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self):
+        self.coins = dict(COINS)
+        self.exchanges = dict(EXCHANGES)
+        self.transport = StubTransport({
+            '/data/all/coinlist': lambda params: {'Response': 'Success', 'Data': self.coins},
+            '/data/all/exchanges': lambda params: self.exchanges,
+        })
+        self.registry = Registry(CryptoCompare(transport=self.transport))
+
+    def test_lazy(self):
+        """Lists should only be fetched on first lookup, once"""
+        self.assertEqual(self.transport.requests, [])
+        self.registry.coin('BTC')
+        self.registry.pairs('Kraken')
+        self.assertEqual(len(self.transport.requests), 2)
+
+    def test_concurrent_first_lookups(self):
+        """Concurrent first lookups should fetch the lists once"""
+        def exchanges(params):
+            time.sleep(0.02)
+            return self.exchanges
+
+        self.transport.add('/data/all/exchanges', exchanges)
+        threads = [threading.Thread(target=self.registry.pairs, args=('Kraken',)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.transport.requests), 2)
+
+    def test_coins(self):
+        """Coins should be found by symbol, case insensitively, or id"""
+        btc = Coin(1182, 'BTC', 'Bitcoin', 'Bitcoin (BTC)', 'SHA256', 'PoW')
+        self.assertEqual(self.registry.coin('btc'), btc)
+        self.assertEqual(self.registry.coin_id('BTC'), 1182)
+        self.assertEqual(self.registry.coin_by_id('1182'), btc)
+        self.assertIsNone(self.registry.coin('FOO'))
+        self.assertRaises(KeyError, self.registry.coin_id, 'FOO')
+
+    def test_exchanges(self):
+        """Pairs of exchanges and exchanges of pairs should be indexed"""
+        self.assertEqual(self.registry.pairs('kraken'), {('BTC', 'USD'), ('BTC', 'EUR'), ('ETH', 'USD')})
+        self.assertEqual(self.registry.exchanges_for('btc', 'usd'), {'Kraken', 'Bitstamp'})
+        self.assertEqual(self.registry.exchange('BITSTAMP'), 'Bitstamp')
+        self.assertTrue(self.registry.supports('Kraken', 'ETH', 'USD'))
+        self.assertFalse(self.registry.supports('Bitstamp', 'ETH', 'USD'))
+        self.assertEqual(self.registry.pairs('foo'), frozenset())
+
+    def test_refresh(self):
+        """Refresh should apply added, changed and removed entries"""
+        self.registry.coin('BTC')
+        self.coins = {'BTC': dict(COINS['BTC'], Id='1'), 'LTC': dict(COINS['ETH'], Id='3', Symbol='LTC')}
+        self.exchanges = {'Kraken': {'BTC': ['USD']}, 'Coinbase': {'ETH': ['USD']}}
+        self.registry.refresh()
+
+        self.assertEqual(self.registry.coin_id('BTC'), 1)
+        self.assertIsNone(self.registry.coin_by_id(1182))
+        self.assertIsNone(self.registry.coin('ETH'))
+        self.assertEqual(self.registry.coin_by_id(3).symbol, 'LTC')
+
+        self.assertEqual(set(self.registry.exchanges), {'Kraken', 'Coinbase'})
+        self.assertEqual(self.registry.exchanges_for('BTC', 'USD'), {'Kraken'})
+        self.assertEqual(self.registry.exchanges_for('ETH', 'USD'), {'Coinbase'})
+        self.assertEqual(self.registry.exchanges_for('BTC', 'EUR'), set())
+        self.assertIsNone(self.registry.exchange('bitstamp'))
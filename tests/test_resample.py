@@ -0,0 +1,99 @@
+import math
+import statistics
+import unittest
+
+from cryptocompare import Candles, Resampler, merge_exchanges, resample
+from cryptocompare.resample import MONDAY, ema, interval, rolling_std, sma
+
+
+def candle(t, price, volume=1.0):
+    return {
+        'time': t, 'open': price, 'high': price + 1, 'low': price - 1, 'close': price + 0.5,
+        'volumefrom': volume, 'volumeto': volume * price,
+    }
+
+
+MINUTES = [candle(60 * i, float(i)) for i in range(12)]
+
+
+class TestResample(unittest.TestCase):
+    def test_interval(self):
+        """Intervals may be given as strings"""
+        self.assertEqual(interval('15m'), 900)
+        self.assertEqual(interval('4h'), 4 * 3600)
+        self.assertEqual(interval('1w'), 7 * 86400)
+        self.assertEqual(interval(300), 300)
+
+    def test_bars(self):
+        """Candles should be aggregated into bars"""
+        result = resample(MINUTES, '5m')
+        self.assertEqual(list(result.time), [0, 300, 600])
+        self.assertEqual(result[0], {
+            'time': 0, 'open': 0.0, 'high': 5.0, 'low': -1.0, 'close': 4.5, 'volumefrom': 5.0, 'volumeto': 10.0,
+        })
+        self.assertEqual(result[2]['volumefrom'], 2.0)
+
+    def test_columnar_input(self):
+        """Columnar candles should be resampled as well"""
+        columns = Candles()
+        for c in MINUTES:
+            columns.append(c)
+        self.assertEqual(resample(columns, 300), resample(MINUTES, 300))
+
+    def test_offset(self):
+        """Bars should start at offset"""
+        week = 7 * 86400
+        result = resample([candle(MONDAY + week + 86400, 1.0)], '1w', offset=MONDAY)
+        self.assertEqual(result.time[0], MONDAY + week)
+
+    def test_incremental(self):
+        """Appending candles should only update the current bar"""
+        resampler = Resampler(300)
+        resampler.extend(MINUTES[:7])
+        self.assertEqual(len(resampler.closed), 1)
+        self.assertEqual(resampler.current['close'], 6.5)
+
+        # last candle updated while still open
+        resampler.append(candle(360, 10.0))
+        self.assertEqual(resampler.current['close'], 10.5)
+        self.assertEqual(resampler.current['volumefrom'], 2.0)
+
+        resampler.extend(MINUTES[7:])
+        self.assertEqual(len(resampler.candles()), 3)
+        self.assertRaises(ValueError, resampler.append, MINUTES[0])
+
+
+class TestMergeExchanges(unittest.TestCase):
+    def test_volume_weighted(self):
+        """Prices should be weighted by volume, volumes summed"""
+        result = merge_exchanges([[candle(0, 10.0, 3.0)], [candle(0, 20.0, 1.0), candle(60, 20.0, 0.0)]])
+        self.assertEqual(result[0]['open'], 12.5)
+        self.assertEqual(result[0]['high'], 21.0)
+        self.assertEqual(result[0]['low'], 9.0)
+        self.assertEqual(result[0]['volumefrom'], 4.0)
+        self.assertEqual(result[1]['open'], 20.0)
+
+
+class TestIndicators(unittest.TestCase):
+    def test_sma(self):
+        """Simple moving average should be undefined until window is full"""
+        result = sma([1, 2, 3, 4], 2)
+        self.assertTrue(math.isnan(result[0]))
+        self.assertEqual(list(result[1:]), [1.5, 2.5, 3.5])
+
+    def test_ema(self):
+        """Exponential moving average should be seeded with first value"""
+        self.assertEqual(list(ema([1, 4, 4], 2)), [1.0, 3.0, 3.6666666666666665])
+
+    def test_rolling_std(self):
+        """Rolling standard deviation should be the sample one"""
+        result = rolling_std([1, 2, 3, 5], 3)
+        self.assertAlmostEqual(result[2], 1.0)
+        self.assertAlmostEqual(result[3], math.sqrt(7 / 3))
+
+    def test_rolling_std_offset(self):
+        """Rolling standard deviation should stay precise for values far from zero"""
+        values = [1e9 + (0.5 if i % 2 else -0.5) + i % 3 for i in range(10000)]
+        result = rolling_std(values, 10)
+        for i in (9, 5000, 9999):
+            self.assertAlmostEqual(result[i], statistics.stdev(values[i - 9:i + 1]), places=6)
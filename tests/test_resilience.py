@@ -0,0 +1,223 @@
+import asyncio
+import time
+import unittest
+
+from cryptocompare import (
+    AsyncCryptoCompare, CircuitBreaker, CryptoCompare, CryptoCompareCircuitOpenError, CryptoCompareHttpError,
+    ExecutorTransport, Hedge, RateLimiter, ResponseCache, Response, RetryPolicy, StubTransport, Transport
+)
+
+from .test_aio import run
+
+PRICE = {'BTC': {'USD': 1.0}}
+
+
+def sequence(*payloads):
+    """Route answering the given payloads in turn, callables being called with no argument"""
+    payloads = list(payloads)
+
+    def route(params):
+        payload = payloads.pop(0) if len(payloads) > 1 else payloads[0]
+        return payload() if callable(payload) else payload
+    return route
+
+
+def unavailable():
+    return Response(503, b'', 0.0)
+
+
+def slow(seconds, payload=PRICE):
+    def answer():
+        time.sleep(seconds)
+        return payload
+    return answer
+
+
+class RecordingTransport(Transport):
+    def __init__(self):
+        self.timeouts = []
+
+    def get(self, url, timeout=None):
+        self.timeouts.append(timeout)
+        return Response(200, b'{"Data": []}', 0.0)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_retry_status(self):
+        """5xx responses should be retried"""
+        transport = StubTransport({'/data/pricemulti': sequence(unavailable(), unavailable(), PRICE)})
+        cc = CryptoCompare(transport=transport, retry=RetryPolicy(retries=2, base=0))
+        self.assertEqual(cc.get_price('BTC', 'USD'), PRICE)
+        self.assertEqual(len(transport.requests), 3)
+
+    def test_retries_exhausted(self):
+        """The last error should be raised once retries are exhausted"""
+        transport = StubTransport({'/data/pricemulti': unavailable()})
+        cc = CryptoCompare(transport=transport, retry=RetryPolicy(retries=1, base=0))
+        with self.assertRaises(CryptoCompareHttpError):
+            cc.get_price('BTC', 'USD')
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_not_retried(self):
+        """Client errors should not be retried"""
+        transport = StubTransport({})
+        cc = CryptoCompare(transport=transport, retry=RetryPolicy(base=0))
+        with self.assertRaises(CryptoCompareHttpError):
+            cc.get_price('BTC', 'USD')
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_transport_errors(self):
+        """Connection errors should be retried"""
+        def refused():
+            raise ConnectionRefusedError()
+
+        transport = StubTransport({'/data/pricemulti': sequence(refused, PRICE)})
+        cc = CryptoCompare(transport=transport, retry=RetryPolicy(base=0))
+        self.assertEqual(cc.get_price('BTC', 'USD'), PRICE)
+
+    def test_async(self):
+        """Asynchronous clients should retry too"""
+        transport = StubTransport({'/data/pricemulti': sequence(unavailable(), PRICE)})
+
+        async def main():
+            async with AsyncCryptoCompare(transport=ExecutorTransport(transport), retry=RetryPolicy(base=0)) as cc:
+                return await cc.get_price('BTC', 'USD')
+
+        self.assertEqual(run(main()), PRICE)
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_timeouts(self):
+        """Endpoint timeouts should override the client timeout"""
+        transport = RecordingTransport()
+        cc = CryptoCompare(transport=transport, timeout=5, timeouts={'histoday': 30})
+        cc.get_price('BTC', 'USD')
+        cc.get_historical('BTC', 'USD')
+        self.assertEqual(transport.timeouts, [5, 30])
+
+
+class TestHedge(unittest.TestCase):
+    def setUp(self):
+        self.hedge = Hedge(min_samples=1)
+        self.hedge.observe('pricemulti', 0.01)
+        self.transport = StubTransport({'/data/pricemulti': sequence(slow(0.5), PRICE)})
+
+    def test_delay(self):
+        """Hedging delay should be the latency quantile"""
+        hedge = Hedge(quantile=0.9, min_samples=10)
+        self.assertIsNone(hedge.delay('pricemulti'))
+        for i in range(10):
+            hedge.observe('pricemulti', i / 100)
+        self.assertEqual(hedge.delay('pricemulti'), 0.09)
+
+    def test_hedged(self):
+        """A duplicate request should answer when the first one is slow"""
+        with CryptoCompare(transport=self.transport, hedge=self.hedge) as cc:
+            start = time.perf_counter()
+            self.assertEqual(cc.get_price('BTC', 'USD'), PRICE)
+            self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual(len(self.transport.requests), 2)
+        self.assertEqual((self.hedge.hedged['pricemulti'], self.hedge.won['pricemulti']), (1, 1))
+
+    def test_hedged_async(self):
+        """Asynchronous clients should hedge with tasks"""
+        async def main():
+            async with AsyncCryptoCompare(transport=ExecutorTransport(self.transport), hedge=self.hedge) as cc:
+                return await cc.get_price('BTC', 'USD')
+
+        start = time.perf_counter()
+        self.assertEqual(run(main()), PRICE)
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual(self.hedge.won['pricemulti'], 1)
+
+    def test_rate_limited(self):
+        """Duplicates should only be sent within the rate limiter budget"""
+        limiter = RateLimiter(per_minute=3)
+        with CryptoCompare(transport=self.transport, hedge=self.hedge, rate_limiter=limiter) as cc:
+            self.assertEqual(cc.get_price('BTC', 'USD'), PRICE)
+            self.assertEqual(cc.get_price('ETH', 'USD'), PRICE)
+        self.assertEqual(len(self.transport.requests), 3)
+        self.assertEqual(self.hedge.hedged['pricemulti'], 1)
+        self.assertFalse(limiter.try_acquire())
+
+    def test_rate_limited_async(self):
+        """Asynchronous duplicates should only be sent within the rate limiter budget"""
+        limiter = RateLimiter(per_minute=1)
+
+        async def main():
+            async with AsyncCryptoCompare(
+                transport=ExecutorTransport(self.transport), hedge=self.hedge, rate_limiter=limiter
+            ) as cc:
+                return await cc.get_price('BTC', 'USD')
+
+        self.assertEqual(run(main()), PRICE)
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertEqual(self.hedge.hedged['pricemulti'], 0)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_states(self):
+        """Circuit should open after failures and let a trial through later"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        breaker.failure('a')
+        self.assertTrue(breaker.allow('a'))
+        breaker.failure('a')
+        self.assertEqual(breaker.state('a'), CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow('a'))
+        self.assertTrue(breaker.allow('b'))
+
+        time.sleep(0.06)
+        self.assertEqual(breaker.state('a'), CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow('a'))
+        self.assertFalse(breaker.allow('a'))
+        breaker.failure('a')
+        self.assertFalse(breaker.allow('a'))
+
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow('a'))
+        breaker.success('a')
+        self.assertEqual(breaker.state('a'), CircuitBreaker.CLOSED)
+
+    def test_stale(self):
+        """Expired cached responses should be served while the circuit is open"""
+        transport = StubTransport({'/data/pricemulti': sequence(PRICE, unavailable())})
+        events = []
+        cc = CryptoCompare(
+            transport=transport, cache=ResponseCache(ttls={'pricemulti': 0.01}), hooks=[events.append],
+            breaker=CircuitBreaker(failure_threshold=1), retry=RetryPolicy(retries=1, base=0)
+        )
+        self.assertEqual(cc.get_price('BTC', 'USD'), PRICE)
+        time.sleep(0.02)
+        self.assertEqual(cc.get_price('BTC', 'USD'), PRICE)
+        self.assertEqual(events[-1].cache, 'stale')
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_open(self):
+        """Requests should be refused while the circuit is open"""
+        transport = StubTransport({'/data/pricemulti': unavailable()})
+        cc = CryptoCompare(transport=transport, breaker=CircuitBreaker(failure_threshold=1))
+        with self.assertRaises(CryptoCompareHttpError):
+            cc.get_price('BTC', 'USD')
+        with self.assertRaises(CryptoCompareCircuitOpenError):
+            cc.get_price('BTC', 'USD')
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_cancelled_trial(self):
+        """A cancelled trial request should let another trial through"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        host = 'min-api.cryptocompare.com'
+        breaker.failure(host)
+        time.sleep(0.02)
+        transport = ExecutorTransport(StubTransport({'/data/pricemulti': sequence(slow(0.1))}))
+
+        async def main():
+            async with AsyncCryptoCompare(transport=transport, breaker=breaker) as cc:
+                with self.assertRaises(asyncio.TimeoutError):
+                    await asyncio.wait_for(cc.get_price('BTC', 'USD'), 0.02)
+
+        run(main())
+        self.assertEqual(breaker.state(host), CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow(host))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+import unittest
+
+from cryptocompare import (
+    AsyncCryptoCompare, AsyncSingleFlight, CryptoCompare, CryptoCompareApiError, ExecutorTransport, SingleFlight,
+    StubTransport
+)
+
+from .test_aio import run
+
+
+def slow_route(payload, delay=0.05):
+    def route(params):
+        time.sleep(delay)
+        return payload
+    return route
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_collapse(self):
+        """Concurrent calls with the same key should run once"""
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def function():
+            calls.append(None)
+            started.set()
+            time.sleep(0.05)
+            return 42
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            first = executor.submit(flight.do, 'k', function)
+            started.wait()
+            others = [executor.submit(flight.do, 'k', function) for _ in range(3)]
+            results = [first.result()] + [f.result() for f in others]
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [(True, 42)] + [(False, 42)] * 3)
+        self.assertEqual((flight.calls, flight.collapsed), (4, 3))
+        self.assertEqual(len(flight), 0)
+
+    def test_error(self):
+        """Waiting callers should receive the error of the shared call"""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def function():
+            started.set()
+            time.sleep(0.05)
+            raise ValueError('failed')
+
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            first = executor.submit(flight.do, 'k', function)
+            started.wait()
+            second = executor.submit(flight.do, 'k', function)
+            for future in (first, second):
+                with self.assertRaises(ValueError):
+                    future.result()
+
+    def test_sequential(self):
+        """Calls made one after the other should not be collapsed"""
+        flight = SingleFlight()
+        self.assertEqual(flight.do('k', lambda: 1), (True, 1))
+        self.assertEqual(flight.do('k', lambda: 2), (True, 2))
+        self.assertEqual(flight.collapsed, 0)
+
+    def test_async(self):
+        """Concurrent coroutines with the same key should run once"""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def function():
+            calls.append(None)
+            await asyncio.sleep(0.01)
+            return 42
+
+        async def main():
+            return await asyncio.gather(*(flight.do('k', function) for _ in range(5)))
+
+        self.assertEqual(run(main()), [(True, 42)] + [(False, 42)] * 4)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.collapsed, 4)
+
+    def test_async_leader_cancelled(self):
+        """Waiters should take over the call when its leader is cancelled"""
+        flight = AsyncSingleFlight()
+
+        async def function():
+            await asyncio.sleep(0.02)
+            return 42
+
+        async def main():
+            leader = asyncio.ensure_future(flight.do('k', function))
+            await asyncio.sleep(0)
+            followers = asyncio.gather(*(flight.do('k', function) for _ in range(3)))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await followers
+
+        self.assertEqual(sorted(run(main())), [(False, 42)] * 2 + [(True, 42)])
+        self.assertEqual(len(flight), 0)
+
+
+class TestClientSingleFlight(unittest.TestCase):
+    def test_threads(self):
+        """Concurrent identical calls should share one request"""
+        transport = StubTransport({'/data/all/coinlist': slow_route({'Response': 'Success', 'Data': {'BTC': {}}})})
+        events = []
+        cc = CryptoCompare(transport=transport, hooks=[events.append])
+
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: cc.get_coin_list(), range(8)))
+
+        self.assertEqual(results, [{'BTC': {}}] * 8)
+        self.assertEqual(len(transport.requests), 1)
+        self.assertEqual(cc.single_flight.collapsed, 7)
+        self.assertEqual(sorted(e.cache for e in events if e.cache), ['shared'] * 7)
+        # results are decoded per caller
+        self.assertIsNot(results[0], results[1])
+
+    def test_errors_shared(self):
+        """Callers sharing a request should all receive its error"""
+        error = {'Response': 'Error', 'Message': 'failed', 'Type': 1}
+        transport = StubTransport({'/data/all/coinlist': slow_route(error)})
+        cc = CryptoCompare(transport=transport)
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(cc.get_coin_list) for _ in range(4)]
+            for future in futures:
+                with self.assertRaises(CryptoCompareApiError):
+                    future.result()
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_disabled(self):
+        """Requests should not be shared without single flight"""
+        transport = StubTransport({'/data/all/coinlist': slow_route({'Data': {}})})
+        cc = CryptoCompare(transport=transport, single_flight=False)
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda _: cc.get_coin_list(), range(4)))
+        self.assertEqual(len(transport.requests), 4)
+
+    def test_async(self):
+        """Concurrent identical coroutines should share one request"""
+        transport = StubTransport({'/data/all/coinlist': slow_route({'Response': 'Success', 'Data': {'BTC': {}}})})
+
+        async def main():
+            async with AsyncCryptoCompare(transport=ExecutorTransport(transport)) as cc:
+                results = await cc.gather(*(cc.get_coin_list() for _ in range(5)))
+                return results, cc.single_flight.collapsed
+
+        results, collapsed = run(main())
+        self.assertEqual(results, [{'BTC': {}}] * 5)
+        self.assertEqual(collapsed, 4)
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_async_leader_cancelled(self):
+        """A timed out leader should not fail concurrent identical calls"""
+        transport = StubTransport({'/data/pricemulti': slow_route({'BTC': {'USD': 1.0}})})
+
+        async def main():
+            async with AsyncCryptoCompare(transport=ExecutorTransport(transport)) as cc:
+                leader = asyncio.ensure_future(asyncio.wait_for(cc.get_price('BTC', 'USD'), 0.01))
+                while not len(cc.single_flight):
+                    await asyncio.sleep(0)
+                follower = await cc.get_price('BTC', 'USD')
+                with self.assertRaises(asyncio.TimeoutError):
+                    await leader
+                return follower
+
+        self.assertEqual(run(main()), {'BTC': {'USD': 1.0}})
+
+
+if __name__ == '__main__':
+    unittest.main()
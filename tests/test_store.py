@@ -0,0 +1,67 @@
+import unittest
+
+from cryptocompare import CandleStore, Candles, CryptoCompare, Period, StubTransport
+
+from .helpers import histo_route
+
+HOUR = 3600
+
+
+class TestCandleStore(unittest.TestCase):
+    def setUp(self):
+        self.transport = StubTransport({'/data/histohour': histo_route(HOUR)})
+        self.cc = CryptoCompare(transport=self.transport)
+        self.store = CandleStore()
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_sync(self):
+        """Synced candles should be read back from the store"""
+        self.store.sync(self.cc, 'BTC', 'USD', Period.HOUR, start=0, end=HOUR * 100)
+        self.assertEqual(
+            self.store.read('BTC', 'USD', Period.HOUR),
+            self.cc.get_historical_range('BTC', 'USD', Period.HOUR, start=0, end=HOUR * 100)
+        )
+
+    def test_incremental_sync(self):
+        """Only new candles and the last stored one should be fetched again"""
+        self.store.sync(self.cc, 'BTC', 'USD', Period.HOUR, start=0, end=HOUR * 100)
+        fetched = self.store.sync(self.cc, 'BTC', 'USD', Period.HOUR, start=0, end=HOUR * 110)
+        self.assertEqual(fetched, 11)
+        self.assertEqual(len(self.store.read('BTC', 'USD', Period.HOUR)), 111)
+
+    def test_resync(self):
+        """History before the first candle should only be requested once"""
+        transport = StubTransport({'/data/histohour': histo_route(HOUR, first=HOUR * 5000)})
+        cc = CryptoCompare(transport=transport)
+        self.store.sync(cc, 'BTC', 'USD', Period.HOUR, start=0, end=HOUR * 6000)
+        self.assertEqual(self.store.synced('BTC', 'USD', Period.HOUR), 0)
+
+        count = len(transport.requests)
+        self.assertEqual(self.store.sync(cc, 'BTC', 'USD', Period.HOUR, start=0, end=HOUR * 6000), 1)
+        self.assertEqual(len(transport.requests), count + 1)
+
+    def test_gaps(self):
+        """Missing candles between stored ones should be fetched on sync"""
+        candles = self.cc.get_historical_range('BTC', 'USD', Period.HOUR, start=0, end=HOUR * 10)
+        self.store.write('BTC', 'USD', candles[:3] + candles[6:], Period.HOUR)
+        self.assertEqual(self.store.gaps('BTC', 'USD', Period.HOUR), [(HOUR * 3, HOUR * 5)])
+
+        self.store.sync(self.cc, 'BTC', 'USD', Period.HOUR, start=0, end=HOUR * 10)
+        self.assertEqual(self.store.read('BTC', 'USD', Period.HOUR), candles)
+        self.assertEqual(self.store.gaps('BTC', 'USD', Period.HOUR), [])
+
+    def test_keys(self):
+        """Candles should be stored apart per pair, exchange and period"""
+        self.store.sync(self.cc, 'BTC', 'USD', Period.HOUR, exchange='Kraken', start=0, end=HOUR * 10)
+        self.assertEqual(self.store.read('BTC', 'USD', Period.HOUR), [])
+        self.assertEqual(self.store.read('BTC', 'EUR', Period.HOUR, exchange='Kraken'), [])
+        self.assertEqual(len(self.store.read('btc', 'usd', Period.HOUR, exchange='Kraken')), 11)
+
+    def test_read_columnar(self):
+        """Stored candles may be read as columns within a range"""
+        self.store.sync(self.cc, 'BTC', 'USD', Period.HOUR, start=0, end=HOUR * 10)
+        candles = self.store.read('BTC', 'USD', Period.HOUR, start=HOUR * 2, end=HOUR * 4, columnar=True)
+        self.assertIsInstance(candles, Candles)
+        self.assertEqual(list(candles.time), [HOUR * 2, HOUR * 3, HOUR * 4])
@@ -0,0 +1,89 @@
+import asyncio
+import itertools
+import threading
+import unittest
+
+from cryptocompare import (
+    AsyncCryptoCompare, CryptoCompare, ExecutorTransport, PollingSource, PriceSubscription, StubTransport, Update
+)
+
+SNAPSHOTS = [
+    {'BTC': {'USD': {'PRICE': 1.0, 'VOLUME24HOUR': 10.0}}, 'ETH': {'USD': {'PRICE': 2.0}}},
+    {'BTC': {'USD': {'PRICE': 1.0, 'VOLUME24HOUR': 11.0}}, 'ETH': {'USD': {'PRICE': 2.0}}},
+    {'BTC': {'USD': {'PRICE': 1.5, 'VOLUME24HOUR': 12.0}}},
+]
+
+
+class TestPriceSubscription(unittest.TestCase):
+    def test_deltas(self):
+        """Only changed fields should be emitted"""
+        updates = list(PriceSubscription(SNAPSHOTS))
+        self.assertEqual(updates, [
+            Update('BTC', 'USD', {'PRICE': 1.0, 'VOLUME24HOUR': 10.0}),
+            Update('ETH', 'USD', {'PRICE': 2.0}),
+            Update('BTC', 'USD', {'VOLUME24HOUR': 11.0}),
+            Update('BTC', 'USD', {'PRICE': 1.5, 'VOLUME24HOUR': 12.0}),
+        ])
+
+    def test_snapshot(self):
+        """Latest state of every pair should be kept"""
+        subscription = PriceSubscription(SNAPSHOTS)
+        list(subscription)
+        self.assertEqual(subscription.snapshot[('BTC', 'USD')], {'PRICE': 1.5, 'VOLUME24HOUR': 12.0})
+        self.assertEqual(subscription.snapshot[('ETH', 'USD')], {'PRICE': 2.0})
+
+    def test_buffered_conflation(self):
+        """Updates not consumed yet should be merged per pair"""
+        produced = threading.Event()
+
+        def source():
+            yield from SNAPSHOTS
+            produced.set()
+
+        iterator = iter(PriceSubscription(source(), buffered=True))
+        produced.wait(1)
+        self.assertEqual(list(iterator), [
+            Update('BTC', 'USD', {'PRICE': 1.5, 'VOLUME24HOUR': 12.0}),
+            Update('ETH', 'USD', {'PRICE': 2.0}),
+        ])
+
+    def test_buffered_error(self):
+        """Source errors should be raised to the consumer"""
+        def source():
+            yield SNAPSHOTS[0]
+            raise ValueError()
+
+        with self.assertRaises(ValueError):
+            list(PriceSubscription(source(), buffered=True))
+
+
+class TestPollingSource(unittest.TestCase):
+    def setUp(self):
+        counter = itertools.count()
+        self.transport = StubTransport({
+            '/data/pricemultifull': lambda params: {'RAW': {'BTC': {'USD': {'PRICE': float(next(counter) // 2)}}}},
+        })
+
+    def test_polling(self):
+        """Polled changes should be emitted"""
+        source = PollingSource(CryptoCompare(transport=self.transport), 'BTC', 'USD', interval=0)
+        updates = list(itertools.islice(PriceSubscription(source), 3))
+        self.assertEqual([u.changes['PRICE'] for u in updates], [0.0, 1.0, 2.0])
+        self.assertEqual(len(self.transport.requests), 5)
+
+    def test_async_polling(self):
+        """Polled changes should be emitted to asynchronous consumers"""
+        async def main():
+            async with AsyncCryptoCompare(transport=ExecutorTransport(self.transport)) as cc:
+                updates = []
+                async for update in PriceSubscription(PollingSource(cc, 'BTC', 'USD', interval=0)):
+                    updates.append(update)
+                    if len(updates) == 2:
+                        return updates
+
+        loop = asyncio.new_event_loop()
+        try:
+            updates = loop.run_until_complete(main())
+        finally:
+            loop.close()
+        self.assertEqual([u.changes['PRICE'] for u in updates], [0.0, 1.0])
@@ -0,0 +1,83 @@
+import unittest
+
+from cryptocompare import (
+    CryptoCompare, CryptoCompareApiError, CryptoCompareHttpError, Period,
+    RequestsTransport, Response, StubTransport
+)
+
+
+class TestStubTransport(unittest.TestCase):
+    def test_payload(self):
+        """JSON serializable payloads should be returned encoded"""
+        transport = StubTransport({'/data/foo': {'a': 1}})
+        response = transport.get('https://example.com/data/foo?x=1')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.content, b'{"a": 1}')
+
+    def test_callable(self):
+        """Callable payloads should be given the query parameters"""
+        transport = StubTransport({'/data/foo': lambda params: params})
+        response = transport.get('https://example.com/data/foo?x=1&y=b')
+        self.assertEqual(response.content, b'{"x": "1", "y": "b"}')
+
+    def test_unknown_route(self):
+        """Unknown routes should answer a 404 status"""
+        transport = StubTransport()
+        self.assertEqual(transport.get('https://example.com/nope').status, 404)
+
+    def test_records_requests(self):
+        """Every requested URL should be recorded"""
+        transport = StubTransport()
+        transport.get('https://example.com/a')
+        transport.get('https://example.com/b')
+        self.assertEqual(transport.requests, ['https://example.com/a', 'https://example.com/b'])
+
+
+class TestRequestsTransport(unittest.TestCase):
+    def test_pool_size(self):
+        """Connection pool size should be configurable"""
+        transport = RequestsTransport(pool_size=42)
+        adapter = transport.session.get_adapter('https://min-api.cryptocompare.com')
+        self.assertEqual(adapter._pool_maxsize, 42)
+
+    def test_gzip(self):
+        """Compressed responses should be accepted"""
+        transport = RequestsTransport()
+        self.assertIn('gzip', transport.session.headers['Accept-Encoding'])
+
+
+class TestClientTransport(unittest.TestCase):
+    def test_shared_transport(self):
+        """All endpoints should go through the client transport"""
+        transport = StubTransport({
+            '/data/pricemulti': {'BTC': {'USD': 1.0}},
+            '/data/histoday': {'Data': [{'time': 0, 'close': 1.0}]},
+        })
+        cc = CryptoCompare(transport=transport)
+        self.assertEqual(cc.get_price('btc', 'usd'), {'BTC': {'USD': 1.0}})
+        self.assertEqual(cc.get_historical('BTC', 'USD', period=Period.DAY), [{'time': 0, 'close': 1.0}])
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_request_parameters(self):
+        """Request parameters should be formatted in requested URL"""
+        transport = StubTransport({'/data/pricemulti': {}})
+        cc = CryptoCompare(app_name='foo', transport=transport)
+        cc.get_price(['BTC', 'ETH'], 'usd', exchange='Kraken')
+        self.assertEqual(
+            transport.requests[0],
+            'https://min-api.cryptocompare.com/data/pricemulti?fsyms=BTC,ETH&tsyms=USD&e=Kraken&extraParams=foo'
+        )
+
+    def test_api_error(self):
+        """Error responses should raise an API error"""
+        transport = StubTransport({'/data/pricemulti': {'Response': 'Error', 'Message': 'foo'}})
+        cc = CryptoCompare(transport=transport)
+        self.assertRaises(CryptoCompareApiError, cc.get_price, 'BTC', 'USD')
+
+    def test_http_error(self):
+        """HTTP error statuses should raise an HTTP error"""
+        transport = StubTransport({'/data/pricemulti': Response(503, b'', 0.0)})
+        cc = CryptoCompare(transport=transport)
+        with self.assertRaises(CryptoCompareHttpError) as context:
+            cc.get_price('BTC', 'USD')
+        self.assertEqual(context.exception.status, 503)
@@ -0,0 +1,119 @@
+import json
+import unittest
+
+from benchmarks import fixtures
+from cryptocompare import CryptoCompare, PairVenues, StubTransport, Venue, VenueBook
+
+
+def full_data(prices):
+    """Route answering full data from {exchange: {(fsym, tsym): price}}"""
+    def route(params):
+        quotes = prices[params['e']]
+        if isinstance(quotes, Exception):
+            raise quotes
+        if quotes is None:
+            return {'Response': 'Error', 'Message': 'market does not exist', 'Type': 1}
+        raw = {}
+        for fsym in params['fsyms'].split(','):
+            for tsym in params['tsyms'].split(','):
+                if (fsym, tsym) in quotes:
+                    price, volume = quotes[fsym, tsym]
+                    raw.setdefault(fsym, {})[tsym] = {
+                        'FROMSYMBOL': fsym, 'TOSYMBOL': tsym, 'MARKET': params['e'], 'PRICE': price,
+                        'VOLUME24HOURTO': volume, 'LASTUPDATE': 1500000000,
+                    }
+        return json.dumps({'RAW': raw, 'DISPLAY': {}}).encode()
+    return route
+
+
+class TestPairVenues(unittest.TestCase):
+    def test_best(self):
+        """Best venues should follow updates and removals"""
+        venues = PairVenues()
+        self.assertIsNone(venues.best_bid)
+        self.assertIsNone(venues.spread)
+
+        venues.update(Venue('A', 10.0, 100.0, 0))
+        venues.update(Venue('B', 12.0, 50.0, 0))
+        venues.update(Venue('C', 11.0, 500.0, 0))
+        self.assertEqual((venues.best_ask.exchange, venues.best_bid.exchange), ('A', 'B'))
+        self.assertEqual(venues.best_venue.exchange, 'C')
+        self.assertEqual(venues.spread, 2.0)
+
+        self.assertTrue(venues.update(Venue('A', 13.0, 100.0, 1)))
+        self.assertFalse(venues.update(Venue('A', 13.0, 100.0, 1)))
+        self.assertEqual((venues.best_ask.exchange, venues.best_bid.exchange), ('C', 'A'))
+
+        venues.remove('C')
+        self.assertEqual((venues.best_ask.exchange, venues.best_venue.exchange), ('B', 'A'))
+        self.assertEqual(len(venues), 2)
+
+    def test_bounded_heaps(self):
+        """Outdated heap entries should not accumulate"""
+        venues = PairVenues()
+        for i in range(1000):
+            venues.update(Venue('AB'[i % 2], float(i % 7), float(i), i))
+        self.assertTrue(all(len(heap) <= 2 * len(venues) + 9 for heap in venues._heaps))
+        self.assertEqual(venues.best_bid, max(venues.venues.values(), key=lambda v: v.price))
+
+
+class TestVenueBook(unittest.TestCase):
+    def setUp(self):
+        self.prices = {
+            'Exchange0': {('BTC', 'USD'): (100.0, 5000.0), ('ETH', 'USD'): (10.0, 900.0)},
+            'Exchange1': {('BTC', 'USD'): (101.0, 9000.0), ('ETH', 'USD'): (9.5, 100.0)},
+        }
+        self.transport = StubTransport({
+            '/data/top/exchanges': lambda params: fixtures.top_exchanges(params['fsym'], params['tsym'], count=2),
+            '/data/pricemultifull': full_data(self.prices),
+        })
+        self.book = VenueBook(CryptoCompare(transport=self.transport), [('btc', 'usd'), ('ETH', 'USD')])
+
+    def test_refresh(self):
+        """Venues of every pair should be requested once per exchange"""
+        self.assertEqual(self.book.refresh(), {('BTC', 'USD'), ('ETH', 'USD')})
+        self.assertEqual(self.book.best_bid('BTC', 'USD').exchange, 'Exchange1')
+        self.assertEqual(self.book.best_ask('ETH', 'USD'), Venue('Exchange1', 9.5, 100.0, 1500000000))
+        self.assertEqual(self.book.best_venue('ETH', 'USD').exchange, 'Exchange0')
+        self.assertEqual(self.book.spread('BTC', 'USD'), 1.0)
+        full = [url for url in self.transport.requests if 'pricemultifull' in url]
+        self.assertEqual(len(full), 2)
+
+    def test_incremental(self):
+        """Only pairs whose venues changed should be reported"""
+        self.book.refresh()
+        self.prices['Exchange0'][('ETH', 'USD')] = (11.0, 900.0)
+        self.assertEqual(self.book.refresh(), {('ETH', 'USD')})
+        self.assertEqual(self.book.best_bid('ETH', 'USD').exchange, 'Exchange0')
+
+        del self.prices['Exchange1'][('BTC', 'USD')]
+        self.assertEqual(self.book.refresh(), {('BTC', 'USD')})
+        self.assertEqual(len(self.book['BTC', 'USD']), 1)
+
+    def test_errors(self):
+        """Venues of failed exchanges should be kept"""
+        self.book.refresh()
+        self.prices['Exchange1'] = None
+        self.assertEqual(self.book.refresh(), set())
+        self.assertIn('Exchange1', self.book.errors)
+        self.assertEqual(self.book.best_bid('BTC', 'USD').exchange, 'Exchange1')
+
+    def test_transport_errors(self):
+        """Venues of exchanges failing with a transport error should be kept"""
+        self.book.refresh()
+        self.prices['Exchange1'] = ConnectionError('connection reset')
+        self.prices['Exchange0'][('ETH', 'USD')] = (11.0, 900.0)
+        self.assertEqual(self.book.refresh(), {('ETH', 'USD')})
+        self.assertIsInstance(self.book.errors['Exchange1'], ConnectionError)
+        self.assertEqual(self.book.best_bid('BTC', 'USD').exchange, 'Exchange1')
+
+    def test_fixed_exchanges(self):
+        """Given exchanges should be used without looking up top exchanges"""
+        book = VenueBook(CryptoCompare(transport=self.transport), [('BTC', 'USD')], exchanges=['Exchange0'])
+        book.refresh()
+        self.assertEqual(book.best_venue('BTC', 'USD').exchange, 'Exchange0')
+        self.assertFalse(any('top/exchanges' in url for url in self.transport.requests))
+
+
+if __name__ == '__main__':
+    unittest.main()